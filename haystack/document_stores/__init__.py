@@ -22,6 +22,12 @@ elasticsearch_index_to_document_store = safe_import(
 open_search_index_to_document_store = safe_import(
     "haystack.document_stores.elasticsearch", "open_search_index_to_document_store", "elasticsearch"
 )
+AsyncElasticsearchDocumentStore = safe_import(
+    "haystack.document_stores.async_elasticsearch", "AsyncElasticsearchDocumentStore", "elasticsearch-async"
+)
+AsyncOpenSearchDocumentStore = safe_import(
+    "haystack.document_stores.async_elasticsearch", "AsyncOpenSearchDocumentStore", "elasticsearch-async"
+)
 
 SQLDocumentStore = safe_import("haystack.document_stores.sql", "SQLDocumentStore", "sql")
 FAISSDocumentStore = safe_import("haystack.document_stores.faiss", "FAISSDocumentStore", "faiss")
@@ -0,0 +1,339 @@
+from typing import Any, Dict, List, Optional, Type, Union
+
+import asyncio
+import logging
+from functools import partial
+from inspect import Parameter, signature
+
+import numpy as np
+
+try:
+    from elasticsearch import AsyncElasticsearch
+    from elasticsearch.helpers import async_bulk
+    from elasticsearch.exceptions import RequestError
+except (ImportError, ModuleNotFoundError) as ie:
+    from haystack.utils.import_utils import _optional_component_not_installed
+
+    _optional_component_not_installed(__name__, "elasticsearch-async", ie)
+
+from haystack.schema import Document
+from haystack.errors import DuplicateDocumentError
+from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore, OpenSearchDocumentStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncElasticsearchDocumentStore:
+    """
+    Asynchronous counterpart of the ElasticsearchDocumentStore for serving many concurrent requests from a single
+    event loop, e.g. in an async web application.
+
+    `query()`, `query_by_embedding()`, `get_documents_by_id()`, `get_existing_ids()` and `write_documents()` are
+    coroutines that send their requests through an `AsyncElasticsearch` client with a pool of connections, so
+    hundreds of searches can be in flight without a thread per request. The search bodies, filters and the conversion
+    of the results are the same as in the ElasticsearchDocumentStore.
+
+    Everything else (creating indices on initialization, updating embeddings, labels, ...) is left to the
+    synchronous document store, available as `sync_document_store`. It's created with the same parameters.
+
+    ```python
+    |    document_store = AsyncElasticsearchDocumentStore(host="localhost", index="document")
+    |    results = await asyncio.gather(*[document_store.query(query=query) for query in queries])
+    |    await document_store.close()
+    ```
+    """
+
+    sync_document_store_class: Type[ElasticsearchDocumentStore] = ElasticsearchDocumentStore
+
+    def __init__(self, connection_pool_size: int = 10, **kwargs):
+        """
+        :param connection_pool_size: Maximum number of open connections per Elasticsearch node. This bounds the
+                                     number of requests that are sent to a node concurrently, further requests wait
+                                     for a free connection.
+        :param kwargs: Parameters of the synchronous document store (see `ElasticsearchDocumentStore.__init__()`),
+                       including the connection settings such as `host`, `port`, `username` and `password`.
+        """
+        self.sync_document_store = self.sync_document_store_class(**kwargs)
+        self.client = self._init_async_elastic_client(
+            connection_pool_size=connection_pool_size, **self._get_connection_params(kwargs)
+        )
+
+    @classmethod
+    def _get_connection_params(cls, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve the connection parameters of the synchronous document store class from `kwargs` and the defaults of
+        the class and its parents (e.g. OpenSearchDocumentStore has other defaults than ElasticsearchDocumentStore).
+        """
+        connection_param_names = signature(cls._init_async_elastic_client).parameters.keys()
+        params = {}
+        for klass in cls.sync_document_store_class.__mro__:
+            if "__init__" not in vars(klass):
+                continue
+            for name, param in signature(klass.__init__).parameters.items():
+                if param.default is not Parameter.empty:
+                    params.setdefault(name, param.default)
+            if klass is ElasticsearchDocumentStore:
+                break
+        params.update(kwargs)
+        return {name: value for name, value in params.items() if name in connection_param_names}
+
+    @classmethod
+    def _init_async_elastic_client(
+        cls,
+        host: Union[str, List[str]],
+        port: Union[int, List[int]],
+        username: str,
+        password: str,
+        api_key_id: Optional[str],
+        api_key: Optional[str],
+        aws4auth,
+        scheme: str,
+        ca_certs: Optional[str],
+        verify_certs: bool,
+        timeout: int,
+        use_system_proxy: bool,
+        connection_pool_size: int,
+    ) -> AsyncElasticsearch:
+        hosts = ElasticsearchDocumentStore._prepare_hosts(host, port)
+
+        if (api_key or api_key_id) and not (api_key and api_key_id):
+            raise ValueError("You must provide either both or none of `api_key_id` and `api_key`")
+
+        if aws4auth:
+            raise NotImplementedError("AsyncElasticsearchDocumentStore does not support `aws4auth`.")
+
+        if use_system_proxy:
+            logger.warning("AsyncElasticsearchDocumentStore ignores `use_system_proxy`.")
+
+        client_params: Dict[str, Any] = {
+            "hosts": hosts,
+            "scheme": scheme,
+            "ca_certs": ca_certs,
+            "verify_certs": verify_certs,
+            "timeout": timeout,
+            "maxsize": connection_pool_size,
+        }
+        if api_key:
+            # api key authentication
+            client_params["api_key"] = (api_key_id, api_key)
+        elif username:
+            # standard http_auth
+            client_params["http_auth"] = (username, password)
+
+        # The connection was already tested by the synchronous document store
+        return AsyncElasticsearch(**client_params)
+
+    async def close(self):
+        """
+        Close the connections of the asynchronous client.
+        """
+        await self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def query(
+        self,
+        query: Optional[str],
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None,
+        top_k: int = 10,
+        custom_query: Optional[str] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        all_terms_must_match: bool = False,
+    ) -> List[Document]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to the query as defined by the BM25 algorithm.
+        See `ElasticsearchDocumentStore.query()` for a description of the parameters.
+        """
+        if index is None:
+            index = self.sync_document_store.index
+
+        body = self.sync_document_store._construct_query_body(
+            query=query,
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            all_terms_must_match=all_terms_must_match,
+        )
+
+        logger.debug(f"Retriever query: {body}")
+        result = (await self.client.search(index=index, body=body, headers=headers))["hits"]["hits"]
+
+        return_embedding = self.sync_document_store.return_embedding
+        documents = [
+            self.sync_document_store._convert_es_hit_to_document(hit, return_embedding=return_embedding)
+            for hit in result
+        ]
+        return documents
+
+    async def query_by_embedding(
+        self,
+        query_emb: np.ndarray,
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Document]:
+        """
+        Find the document that is most similar to the provided `query_emb` by using a vector similarity metric.
+        See `ElasticsearchDocumentStore.query_by_embedding()` for a description of the parameters.
+        """
+        if index is None:
+            index = self.sync_document_store.index
+
+        if return_embedding is None:
+            return_embedding = self.sync_document_store.return_embedding
+
+        if not self.sync_document_store.embedding_field:
+            raise RuntimeError("Please specify arg `embedding_field` in ElasticsearchDocumentStore()")
+
+        body = self.sync_document_store._construct_dense_query_body(
+            query_emb=query_emb, filters=filters, top_k=top_k, return_embedding=return_embedding
+        )
+
+        logger.debug(f"Retriever query: {body}")
+        try:
+            result = (await self.client.search(index=index, body=body, request_timeout=300, headers=headers))["hits"][
+                "hits"
+            ]
+            if len(result) == 0 and not isinstance(self.sync_document_store, OpenSearchDocumentStore):
+                count_body = {"query": {"exists": {"field": self.sync_document_store.embedding_field}}}
+                count_embeddings = (await self.client.count(index=index, body=count_body, headers=headers))["count"]
+                if count_embeddings == 0:
+                    raise RequestError(
+                        400, "search_phase_execution_exception", {"error": "No documents with embeddings."}
+                    )
+        except RequestError as e:
+            if e.error == "search_phase_execution_exception":
+                error_message: str = (
+                    "search_phase_execution_exception: Likely some of your stored documents don't have embeddings."
+                    " Run the document store's update_embeddings() method."
+                )
+                raise RequestError(e.status_code, error_message, e.info)
+            raise e
+
+        documents = [
+            self.sync_document_store._convert_es_hit_to_document(
+                hit, adapt_score_for_embedding=True, return_embedding=return_embedding
+            )
+            for hit in result
+        ]
+        return documents
+
+    async def get_documents_by_id(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Document]:
+        """
+        Fetch documents by specifying a list of text id strings.
+        """
+        index = index or self.sync_document_store.index
+        documents = []
+        for i in range(0, len(ids), batch_size):
+            batch_ids = ids[i : i + batch_size]
+            query = {"size": len(batch_ids), "query": {"ids": {"values": batch_ids}}}
+            result = (await self.client.search(index=index, body=query, headers=headers))["hits"]["hits"]
+            documents.extend(
+                self.sync_document_store._convert_es_hit_to_document(
+                    hit, return_embedding=self.sync_document_store.return_embedding
+                )
+                for hit in result
+            )
+        return documents
+
+    async def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index, without fetching the documents.
+        If the index doesn't exist, no ids are returned.
+        """
+        index = index or self.sync_document_store.index
+        existing_ids = []
+        for i in range(0, len(ids), batch_size):
+            batch_ids = ids[i : i + batch_size]
+            query = {"size": len(batch_ids), "query": {"ids": {"values": batch_ids}}, "_source": False}
+            result = await self.client.search(index=index, body=query, headers=headers, ignore_unavailable=True)
+            result = result["hits"]["hits"]
+            existing_ids.extend(hit["_id"] for hit in result)
+        return existing_ids
+
+    async def write_documents(
+        self,
+        documents: Union[List[dict], List[Document]],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        duplicate_documents: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Indexes documents for later queries in Elasticsearch.
+        See `ElasticsearchDocumentStore.write_documents()` for a description of the parameters.
+
+        :raises DuplicateDocumentError: Exception trigger on duplicate document
+        """
+        sync_document_store = self.sync_document_store
+
+        if index and not await self.client.indices.exists(index=index, headers=headers):
+            # creating an index is rare and involves several requests, so we leave it to the synchronous store
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, partial(sync_document_store._create_document_index, index, headers=headers)
+            )
+
+        if index is None:
+            index = sync_document_store.index
+        duplicate_documents = duplicate_documents or sync_document_store.duplicate_documents
+        assert (
+            duplicate_documents in sync_document_store.duplicate_documents_options
+        ), f"duplicate_documents parameter must be {', '.join(sync_document_store.duplicate_documents_options)}"
+
+        field_map = sync_document_store._create_document_field_map()
+        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+        if duplicate_documents in ("skip", "fail"):
+            document_objects = sync_document_store._drop_duplicate_documents(document_objects)
+            ids_exist_in_db = set(
+                await self.get_existing_ids(ids=[doc.id for doc in document_objects], index=index, headers=headers)
+            )
+            if len(ids_exist_in_db) > 0 and duplicate_documents == "fail":
+                raise DuplicateDocumentError(
+                    f"Document with ids '{', '.join(ids_exist_in_db)} already exists" f" in index = '{index}'."
+                )
+            document_objects = [doc for doc in document_objects if doc.id not in ids_exist_in_db]
+
+        documents_to_index = [
+            sync_document_store._convert_document_to_bulk_action(
+                document=doc, index=index, duplicate_documents=duplicate_documents
+            )
+            for doc in document_objects
+        ]
+        for i in range(0, len(documents_to_index), batch_size):
+            await async_bulk(
+                self.client,
+                documents_to_index[i : i + batch_size],
+                request_timeout=300,
+                refresh=sync_document_store.refresh_type,
+                headers=headers,
+            )
+
+
+class AsyncOpenSearchDocumentStore(AsyncElasticsearchDocumentStore):
+    """
+    Asynchronous counterpart of the OpenSearchDocumentStore. See AsyncElasticsearchDocumentStore for details.
+    """
+
+    sync_document_store_class = OpenSearchDocumentStore
@@ -1,4 +1,4 @@
-from typing import Generator, Optional, Dict, List, Set, Union
+from typing import Any, Generator, Optional, Dict, List, Set, Union
 
 import logging
 import collections
@@ -10,7 +10,7 @@ import numpy as np
 
 from haystack.schema import Document, Label, MultiLabel
 from haystack.nodes.base import BaseComponent
-from haystack.errors import DuplicateDocumentError
+from haystack.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.nodes.preprocessor import PreProcessor
 from haystack.document_stores.utils import eval_data_from_json, eval_data_from_jsonl, squad_json_to_jsonl
 
@@ -390,6 +390,47 @@ class BaseDocumentStore(BaseComponent):
     ) -> List[Document]:
         pass
 
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[
+            Union[
+                Dict[str, Union[Dict, List, str, int, float, bool]],
+                List[Optional[Dict[str, Union[Dict, List, str, int, float, bool]]]],
+            ]
+        ] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs`.
+
+        This implementation runs `query_by_embedding()` for one query after the other. Document stores that can search
+        for several queries at once override it.
+
+        :param query_embs: Embeddings of the queries, one per row of an array or a list of arrays
+        :param filters: Optional filters to narrow down the search space, see `query_by_embedding()`. Either one
+                        filter dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query
+        :param index: Index name for storing the docs and metadata
+        :param return_embedding: To return document embedding
+        :param headers: Custom HTTP headers to pass to document store client if supported
+        :return: One list of documents per query
+        """
+        return [
+            self.query_by_embedding(
+                query_emb=query_emb,
+                filters=query_filters,
+                top_k=top_k,
+                index=index,
+                return_embedding=return_embedding,
+                headers=headers,
+            )
+            for query_emb, query_filters in zip(query_embs, get_filters_per_query(filters, len(query_embs)))
+        ]
+
     @abstractmethod
     def get_label_count(self, index: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> int:
         pass
@@ -574,6 +615,43 @@ class BaseDocumentStore(BaseComponent):
     ) -> List[Document]:
         pass
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index.
+        Document stores should override this to check for the ids without fetching content, meta and embeddings.
+
+        :param ids: The document ids to check.
+        :param index: Name of the index to check. If None, the DocumentStore's default index (self.index) will be used.
+        :param batch_size: Number of ids to check per request.
+        :param headers: Custom HTTP headers to pass to document store client if supported (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='} for basic authentication)
+        :return: The ids from `ids` that exist in the index.
+        """
+        documents = self.get_documents_by_id(ids=ids, index=index, batch_size=batch_size, headers=headers)
+        return [doc.id for doc in documents]
+
+    def get_all_document_ids(
+        self, index: Optional[str] = None, batch_size: int = 10_000, headers: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Return the ids of all documents in the index.
+        Document stores should override this to list the ids without fetching content, meta and embeddings.
+
+        :param index: Name of the index to list. If None, the DocumentStore's default index (self.index) will be used.
+        :param batch_size: Number of ids to fetch per request.
+        :param headers: Custom HTTP headers to pass to document store client if supported (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='} for basic authentication)
+        :return: The ids of the documents in the index.
+        """
+        documents = self.get_all_documents_generator(
+            index=index, return_embedding=False, batch_size=batch_size, headers=headers
+        )
+        return [doc.id for doc in documents]
+
     def _drop_duplicate_documents(self, documents: List[Document]) -> List[Document]:
         """
         Drop duplicates documents based on same hash ID
@@ -620,15 +698,16 @@ class BaseDocumentStore(BaseComponent):
         index = index or self.index
         if duplicate_documents in ("skip", "fail"):
             documents = self._drop_duplicate_documents(documents)
-            documents_found = self.get_documents_by_id(ids=[doc.id for doc in documents], index=index, headers=headers)
-            ids_exist_in_db: List[str] = [doc.id for doc in documents_found]
+            ids_exist_in_db: Set[str] = set(
+                self.get_existing_ids(ids=[doc.id for doc in documents], index=index, headers=headers)
+            )
 
             if len(ids_exist_in_db) > 0 and duplicate_documents == "fail":
                 raise DuplicateDocumentError(
                     f"Document with ids '{', '.join(ids_exist_in_db)} already exists" f" in index = '{index}'."
                 )
 
-            documents = list(filter(lambda doc: doc.id not in ids_exist_in_db, documents))
+            documents = [doc for doc in documents if doc.id not in ids_exist_in_db]
 
         return documents
 
@@ -752,6 +831,68 @@ class KeywordDocumentStore(BaseDocumentStore):
                                      Defaults to False.
         """
 
+    def query_batch(
+        self,
+        queries: List[Optional[str]],
+        filters: Optional[
+            Union[
+                Dict[str, Union[Dict, List, str, int, float, bool]],
+                List[Optional[Dict[str, Union[Dict, List, str, int, float, bool]]]],
+            ]
+        ] = None,
+        top_k: int = 10,
+        custom_query: Optional[str] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        all_terms_must_match: bool = False,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents that are most relevant to each of
+        the queries as defined by keyword matching algorithms like BM25.
+
+        This implementation runs `query()` for one query after the other. Document stores that can search for several
+        queries at once override it.
+
+        :param queries: The queries
+        :param filters: Optional filters to narrow down the search space, see `query()`. Either one filter dictionary
+                        that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param custom_query: Custom query to be executed, see `query()`.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param headers: Custom HTTP headers to pass to document store client if supported (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='} for basic authentication)
+        :param all_terms_must_match: Whether all terms of the query must match the document, see `query()`.
+        :return: One list of documents per query
+        """
+        return [
+            self.query(
+                query=query,
+                filters=query_filters,
+                top_k=top_k,
+                custom_query=custom_query,
+                index=index,
+                headers=headers,
+                all_terms_must_match=all_terms_must_match,
+            )
+            for query, query_filters in zip(queries, get_filters_per_query(filters, len(queries)))
+        ]
+
+
+def get_filters_per_query(
+    filters: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]], num_queries: int
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Expand the `filters` of a batch query to one entry per query. `filters` is either None, a filter dictionary that
+    applies to all queries or a list with one filter dictionary (or None) per query.
+    """
+    if isinstance(filters, list):
+        if len(filters) != num_queries:
+            raise DocumentStoreError(
+                f"Got {len(filters)} filters for {num_queries} queries. Pass either one filter dictionary that "
+                f"applies to all queries or a list with one entry per query."
+            )
+        return filters
+    return [filters] * num_queries
+
 
 def get_batches_from_generator(iterable, n):
     """
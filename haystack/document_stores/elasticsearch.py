@@ -2,6 +2,8 @@ from typing import List, Optional, Type, Union, Dict, Any, Generator
 
 import json
 import logging
+import queue
+import threading
 import time
 from copy import deepcopy
 from string import Template
@@ -12,7 +14,7 @@ from tqdm.auto import tqdm
 
 try:
     from elasticsearch import Elasticsearch, RequestsHttpConnection, Connection, Urllib3HttpConnection
-    from elasticsearch.helpers import bulk, scan
+    from elasticsearch.helpers import bulk, parallel_bulk, scan
     from elasticsearch.exceptions import RequestError
 except (ImportError, ModuleNotFoundError) as ie:
     from haystack.utils.import_utils import _optional_component_not_installed
@@ -21,13 +23,39 @@ except (ImportError, ModuleNotFoundError) as ie:
 
 from haystack.document_stores import KeywordDocumentStore
 from haystack.schema import Document, Label
-from haystack.document_stores.base import get_batches_from_generator
+from haystack.document_stores.base import get_batches_from_generator, get_filters_per_query
 from haystack.document_stores.filter_utils import LogicalFilterClause
 
 
 logger = logging.getLogger(__name__)
 
 
+def _put_unless_stopped(q: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+    """
+    Put `item` into the bounded queue `q`, waiting for a free slot until `stop_event` is set.
+    Returns False if the item was not put because `stop_event` is set.
+    """
+    while not stop_event.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_unless_stopped(q: queue.Queue, stop_event: threading.Event) -> Any:
+    """
+    Get the next item from the queue `q`, waiting for one until `stop_event` is set. Returns None once stopped.
+    """
+    while not stop_event.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
 class ElasticsearchDocumentStore(KeywordDocumentStore):
     def __init__(
         self,
@@ -447,6 +475,47 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         documents = [self._convert_es_hit_to_document(hit, return_embedding=self.return_embedding) for hit in result]
         return documents
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index.
+        The document sources are not fetched, so this is much cheaper than `get_documents_by_id()`.
+        If the index doesn't exist, no ids are returned.
+        """
+        index = index or self.index
+        existing_ids = []
+        for i in range(0, len(ids), batch_size):
+            batch_ids = ids[i : i + batch_size]
+            query = {"size": len(batch_ids), "query": {"ids": {"values": batch_ids}}, "_source": False}
+            result = self.client.search(index=index, body=query, headers=headers, ignore_unavailable=True)
+            existing_ids.extend(hit["_id"] for hit in result["hits"]["hits"])
+        return existing_ids
+
+    def get_all_document_ids(
+        self, index: Optional[str] = None, batch_size: int = 10_000, headers: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Return the ids of all documents in the index. The document sources are not fetched.
+        If the index doesn't exist, no ids are returned.
+        """
+        index = index or self.index
+        body = {"query": {"match_all": {}}, "_source": False}
+        result = scan(
+            self.client,
+            query=body,
+            index=index,
+            size=batch_size,
+            scroll=self.scroll,
+            headers=headers,
+            ignore_unavailable=True,
+        )
+        return [hit["_id"] for hit in result]
+
     def get_metadata_values_by_key(
         self,
         key: str,
@@ -565,31 +634,11 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         )
         documents_to_index = []
         for doc in document_objects:
-            _doc = {
-                "_op_type": "index" if duplicate_documents == "overwrite" else "create",
-                "_index": index,
-                **doc.to_dict(field_map=self._create_document_field_map()),
-            }  # type: Dict[str, Any]
-
-            # cast embedding type as ES cannot deal with np.array
-            if _doc[self.embedding_field] is not None:
-                if type(_doc[self.embedding_field]) == np.ndarray:
-                    _doc[self.embedding_field] = _doc[self.embedding_field].tolist()
-
-            # rename id for elastic
-            _doc["_id"] = str(_doc.pop("id"))
-
-            # don't index query score and empty fields
-            _ = _doc.pop("score", None)
-            _doc = {k: v for k, v in _doc.items() if v is not None}
-
-            # In order to have a flat structure in elastic + similar behaviour to the other DocumentStores,
-            # we "unnest" all value within "meta"
-            if "meta" in _doc.keys():
-                for k, v in _doc["meta"].items():
-                    _doc[k] = v
-                _doc.pop("meta")
-            documents_to_index.append(_doc)
+            documents_to_index.append(
+                self._convert_document_to_bulk_action(
+                    document=doc, index=index, duplicate_documents=duplicate_documents
+                )
+            )
 
             # Pass batch_size number of documents to bulk
             if len(documents_to_index) % batch_size == 0:
@@ -599,6 +648,38 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         if documents_to_index:
             bulk(self.client, documents_to_index, request_timeout=300, refresh=self.refresh_type, headers=headers)
 
+    def _convert_document_to_bulk_action(
+        self, document: Document, index: str, duplicate_documents: str
+    ) -> Dict[str, Any]:
+        """
+        Convert a Document to an action for Elasticsearch's bulk helpers that indexes it into `index`.
+        """
+        _doc = {
+            "_op_type": "index" if duplicate_documents == "overwrite" else "create",
+            "_index": index,
+            **document.to_dict(field_map=self._create_document_field_map()),
+        }  # type: Dict[str, Any]
+
+        # cast embedding type as ES cannot deal with np.array
+        if _doc[self.embedding_field] is not None:
+            if type(_doc[self.embedding_field]) == np.ndarray:
+                _doc[self.embedding_field] = _doc[self.embedding_field].tolist()
+
+        # rename id for elastic
+        _doc["_id"] = str(_doc.pop("id"))
+
+        # don't index query score and empty fields
+        _ = _doc.pop("score", None)
+        _doc = {k: v for k, v in _doc.items() if v is not None}
+
+        # In order to have a flat structure in elastic + similar behaviour to the other DocumentStores,
+        # we "unnest" all value within "meta"
+        if "meta" in _doc.keys():
+            for k, v in _doc["meta"].items():
+                _doc[k] = v
+            _doc.pop("meta")
+        return _doc
+
     def write_labels(
         self,
         labels: Union[List[Label], List[dict]],
@@ -1020,59 +1101,13 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         if index is None:
             index = self.index
 
-        # Naive retrieval without BM25, only filtering
-        if query is None:
-            body = {"query": {"bool": {"must": {"match_all": {}}}}}  # type: Dict[str, Any]
-            if filters:
-                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
-
-        # Retrieval via custom query
-        elif custom_query:  # substitute placeholder for query and filters for the custom_query template string
-            template = Template(custom_query)
-            # replace all "${query}" placeholder(s) with query
-            substitutions = {"query": f'"{query}"'}
-            # For each filter we got passed, we'll try to find & replace the corresponding placeholder in the template
-            # Example: filters={"years":[2018]} => replaces {$years} in custom_query with '[2018]'
-            if filters:
-                for key, values in filters.items():
-                    values_str = json.dumps(values)
-                    substitutions[key] = values_str
-            custom_query_json = template.substitute(**substitutions)
-            body = json.loads(custom_query_json)
-            # add top_k
-            body["size"] = str(top_k)
-
-        # Default Retrieval via BM25 using the user query on `self.search_fields`
-        else:
-            if not isinstance(query, str):
-                logger.warning(
-                    "The query provided seems to be not a string, but an object "
-                    f"of type {type(query)}. This can cause Elasticsearch to fail."
-                )
-            operator = "AND" if all_terms_must_match else "OR"
-            body = {
-                "size": str(top_k),
-                "query": {
-                    "bool": {
-                        "must": [
-                            {
-                                "multi_match": {
-                                    "query": query,
-                                    "type": "most_fields",
-                                    "fields": self.search_fields,
-                                    "operator": operator,
-                                }
-                            }
-                        ]
-                    }
-                },
-            }
-
-            if filters:
-                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
-
-        if self.excluded_meta_data:
-            body["_source"] = {"excludes": self.excluded_meta_data}
+        body = self._construct_query_body(
+            query=query,
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            all_terms_must_match=all_terms_must_match,
+        )
 
         logger.debug(f"Retriever query: {body}")
         result = self.client.search(index=index, body=body, headers=headers)["hits"]["hits"]
@@ -1172,29 +1207,9 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         if not self.embedding_field:
             raise RuntimeError("Please specify arg `embedding_field` in ElasticsearchDocumentStore()")
 
-        # +1 in similarity to avoid negative numbers (for cosine sim)
-        body = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
-        if filters:
-            filter_ = {"bool": {"filter": LogicalFilterClause.parse(filters).convert_to_elasticsearch()}}
-            if body["query"]["script_score"]["query"] == {"match_all": {}}:
-                body["query"]["script_score"]["query"] = filter_
-            else:
-                body["query"]["script_score"]["query"]["bool"]["filter"]["bool"]["must"].append(filter_)
-
-        excluded_meta_data: Optional[list] = None
-
-        if self.excluded_meta_data:
-            excluded_meta_data = deepcopy(self.excluded_meta_data)
-
-            if return_embedding is True and self.embedding_field in excluded_meta_data:
-                excluded_meta_data.remove(self.embedding_field)
-            elif return_embedding is False and self.embedding_field not in excluded_meta_data:
-                excluded_meta_data.append(self.embedding_field)
-        elif return_embedding is False:
-            excluded_meta_data = [self.embedding_field]
-
-        if excluded_meta_data:
-            body["_source"] = {"excludes": excluded_meta_data}
+        body = self._construct_dense_query_body(
+            query_emb=query_emb, filters=filters, top_k=top_k, return_embedding=return_embedding
+        )
 
         logger.debug(f"Retriever query: {body}")
         try:
@@ -1220,6 +1235,276 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         ]
         return documents
 
+    def query_batch(
+        self,
+        queries: List[Optional[str]],
+        filters: Optional[
+            Union[
+                Dict[str, Union[Dict, List, str, int, float, bool]],
+                List[Optional[Dict[str, Union[Dict, List, str, int, float, bool]]]],
+            ]
+        ] = None,
+        top_k: int = 10,
+        custom_query: Optional[str] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        all_terms_must_match: bool = False,
+        batch_size: int = 1_000,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents that are most relevant to each of
+        the queries as defined by the BM25 algorithm. The queries are sent to Elasticsearch in `_msearch` requests,
+        so there is one round trip per `batch_size` queries instead of one per query.
+
+        :param queries: The queries
+        :param filters: Optional filters to narrow down the search space, see `query()`. Either one filter dictionary
+                        that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param custom_query: Query string as per Elasticsearch DSL with a mandatory query placeholder, see `query()`.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param headers: Custom HTTP headers to pass to elasticsearch client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
+                Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        :param all_terms_must_match: Whether all terms of the query must match the document, see `query()`.
+        :param batch_size: Maximum number of queries sent in one `_msearch` request.
+        :return: One list of documents per query
+        """
+        if index is None:
+            index = self.index
+
+        bodies = [
+            self._construct_query_body(
+                query=query,
+                filters=query_filters,
+                top_k=top_k,
+                custom_query=custom_query,
+                all_terms_must_match=all_terms_must_match,
+            )
+            for query, query_filters in zip(queries, get_filters_per_query(filters, len(queries)))
+        ]
+
+        results = self._msearch(index=index, bodies=bodies, headers=headers, batch_size=batch_size)
+
+        return [
+            [self._convert_es_hit_to_document(hit, return_embedding=self.return_embedding) for hit in result]
+            for result in results
+        ]
+
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[
+            Union[
+                Dict[str, Union[Dict, List, str, int, float, bool]],
+                List[Optional[Dict[str, Union[Dict, List, str, int, float, bool]]]],
+            ]
+        ] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        batch_size: int = 1_000,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric. The queries are sent to Elasticsearch in `_msearch` requests, so there is one round trip per
+        `batch_size` queries instead of one per query.
+
+        :param query_embs: Embeddings of the queries, one per row of an array or a list of arrays
+        :param filters: Optional filters to narrow down the search space, see `query_by_embedding()`. Either one filter
+                        dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query
+        :param index: Index name for storing the docs and metadata
+        :param return_embedding: To return document embedding
+        :param headers: Custom HTTP headers to pass to elasticsearch client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
+                Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        :param batch_size: Maximum number of queries sent in one `_msearch` request.
+        :return: One list of documents per query
+        """
+        if index is None:
+            index = self.index
+
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+
+        if not self.embedding_field:
+            raise RuntimeError("Please specify arg `embedding_field` in ElasticsearchDocumentStore()")
+
+        bodies = [
+            self._construct_dense_query_body(
+                query_emb=np.asarray(query_emb), filters=query_filters, top_k=top_k, return_embedding=return_embedding
+            )
+            for query_emb, query_filters in zip(query_embs, get_filters_per_query(filters, len(query_embs)))
+        ]
+
+        try:
+            results = self._msearch(
+                index=index, bodies=bodies, headers=headers, batch_size=batch_size, request_timeout=300
+            )
+            # OpenSearch's k-NN queries don't fail for missing embeddings, see OpenSearchDocumentStore.query_by_embedding
+            if not isinstance(self, OpenSearchDocumentStore) and any(len(result) == 0 for result in results):
+                count_embeddings = self.get_embedding_count(index=index, headers=headers)
+                if count_embeddings == 0:
+                    raise RequestError(
+                        400, "search_phase_execution_exception", {"error": "No documents with embeddings."}
+                    )
+        except RequestError as e:
+            if e.error == "search_phase_execution_exception":
+                error_message: str = (
+                    "search_phase_execution_exception: Likely some of your stored documents don't have embeddings."
+                    " Run the document store's update_embeddings() method."
+                )
+                raise RequestError(e.status_code, error_message, e.info)
+            raise e
+
+        return [
+            [
+                self._convert_es_hit_to_document(hit, adapt_score_for_embedding=True, return_embedding=return_embedding)
+                for hit in result
+            ]
+            for result in results
+        ]
+
+    def _msearch(
+        self,
+        index: str,
+        bodies: List[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        batch_size: int = 1_000,
+        **kwargs,
+    ) -> List[List[dict]]:
+        """
+        Run the search `bodies` on `index` with as few `_msearch` requests as possible.
+
+        :return: The hits of each search body.
+        :raises RequestError: If any of the searches failed.
+        """
+        results: List[List[dict]] = []
+        for i in range(0, len(bodies), batch_size):
+            searches: List[Dict[str, Any]] = []
+            for body in bodies[i : i + batch_size]:
+                searches.append({"index": index})
+                searches.append(body)
+            logger.debug(f"Retriever queries: {searches}")
+            responses = self.client.msearch(body=searches, headers=headers, **kwargs)["responses"]
+            for response in responses:
+                if "error" in response:
+                    error = response["error"]
+                    error_type = error.get("type", "unknown") if isinstance(error, dict) else str(error)
+                    raise RequestError(response.get("status", 500), error_type, response)
+                results.append(response["hits"]["hits"])
+        return results
+
+    def _construct_query_body(
+        self,
+        query: Optional[str],
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]],
+        top_k: int,
+        custom_query: Optional[str],
+        all_terms_must_match: bool,
+    ) -> Dict[str, Any]:
+        """
+        Construct the search body for `query()`. See `query()` for a description of the parameters.
+        """
+        # Naive retrieval without BM25, only filtering
+        if query is None:
+            body = {"query": {"bool": {"must": {"match_all": {}}}}}  # type: Dict[str, Any]
+            if filters:
+                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+
+        # Retrieval via custom query
+        elif custom_query:  # substitute placeholder for query and filters for the custom_query template string
+            template = Template(custom_query)
+            # replace all "${query}" placeholder(s) with query
+            substitutions = {"query": f'"{query}"'}
+            # For each filter we got passed, we'll try to find & replace the corresponding placeholder in the template
+            # Example: filters={"years":[2018]} => replaces {$years} in custom_query with '[2018]'
+            if filters:
+                for key, values in filters.items():
+                    values_str = json.dumps(values)
+                    substitutions[key] = values_str
+            custom_query_json = template.substitute(**substitutions)
+            body = json.loads(custom_query_json)
+            # add top_k
+            body["size"] = str(top_k)
+
+        # Default Retrieval via BM25 using the user query on `self.search_fields`
+        else:
+            if not isinstance(query, str):
+                logger.warning(
+                    "The query provided seems to be not a string, but an object "
+                    f"of type {type(query)}. This can cause Elasticsearch to fail."
+                )
+            operator = "AND" if all_terms_must_match else "OR"
+            body = {
+                "size": str(top_k),
+                "query": {
+                    "bool": {
+                        "must": [
+                            {
+                                "multi_match": {
+                                    "query": query,
+                                    "type": "most_fields",
+                                    "fields": self.search_fields,
+                                    "operator": operator,
+                                }
+                            }
+                        ]
+                    }
+                },
+            }
+
+            if filters:
+                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+
+        if self.excluded_meta_data:
+            body["_source"] = {"excludes": self.excluded_meta_data}
+
+        return body
+
+    def _construct_dense_query_body(
+        self,
+        query_emb: np.ndarray,
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]],
+        top_k: int,
+        return_embedding: bool,
+    ) -> Dict[str, Any]:
+        """
+        Construct the search body for `query_by_embedding()`. See `query_by_embedding()` for a description of the
+        parameters.
+        """
+        # +1 in similarity to avoid negative numbers (for cosine sim)
+        body = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
+        if filters:
+            filter_ = {"bool": {"filter": LogicalFilterClause.parse(filters).convert_to_elasticsearch()}}
+            if body["query"]["script_score"]["query"] == {"match_all": {}}:
+                body["query"]["script_score"]["query"] = filter_
+            else:
+                body["query"]["script_score"]["query"]["bool"]["filter"]["bool"]["must"].append(filter_)
+
+        excluded_meta_data = self._get_excluded_meta_data(return_embedding=return_embedding)
+        if excluded_meta_data:
+            body["_source"] = {"excludes": excluded_meta_data}
+
+        return body
+
+    def _get_excluded_meta_data(self, return_embedding: bool) -> Optional[list]:
+        """
+        Fields to exclude from the returned documents, taking into account whether to return the embeddings.
+        """
+        excluded_meta_data: Optional[list] = None
+
+        if self.excluded_meta_data:
+            excluded_meta_data = deepcopy(self.excluded_meta_data)
+
+            if return_embedding is True and self.embedding_field in excluded_meta_data:
+                excluded_meta_data.remove(self.embedding_field)
+            elif return_embedding is False and self.embedding_field not in excluded_meta_data:
+                excluded_meta_data.append(self.embedding_field)
+        elif return_embedding is False:
+            excluded_meta_data = [self.embedding_field]
+
+        return excluded_meta_data
+
     def _get_vector_similarity_query(self, query_emb: np.ndarray, top_k: int):
         """
         Generate Elasticsearch query for vector similarity.
@@ -1326,11 +1611,17 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         update_existing_embeddings: bool = True,
         batch_size: int = 10_000,
         headers: Optional[Dict[str, str]] = None,
+        bulk_writer_threads: int = 2,
+        max_queued_batches: int = 2,
     ):
         """
         Updates the embeddings in the the document store using the encoding model specified in the retriever.
         This can be useful if want to add or change the embeddings for your documents (e.g. after changing the retriever config).
 
+        Reading, embedding and writing overlap: while the retriever embeds a batch of documents, a background thread
+        already scrolls the next batches from Elasticsearch and a pool of bulk writers stores the embeddings of the
+        previous ones.
+
         :param retriever: Retriever to use to update the embeddings.
         :param index: Index name to update
         :param update_existing_embeddings: Whether to update existing embeddings of the documents. If set to False,
@@ -1365,8 +1656,14 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
         :param batch_size: When working with large number of documents, batching can help reduce memory footprint.
         :param headers: Custom HTTP headers to pass to elasticsearch client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
                 Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        :param bulk_writer_threads: Number of threads sending bulk requests with the updated embeddings.
+        :param max_queued_batches: Maximum number of batches waiting to be embedded and waiting to be written.
+                                   Bounds the memory used when reading or writing is faster than embedding.
         :return: None
         """
+        if bulk_writer_threads < 1 or max_queued_batches < 1:
+            raise ValueError("`bulk_writer_threads` and `max_queued_batches` must be at least 1.")
+
         if index is None:
             index = self.index
 
@@ -1395,30 +1692,87 @@ class ElasticsearchDocumentStore(KeywordDocumentStore):
 
         logging.getLogger("elasticsearch").setLevel(logging.CRITICAL)
 
-        with tqdm(total=document_count, position=0, unit=" Docs", desc="Updating embeddings") as progress_bar:
-            for result_batch in get_batches_from_generator(result, batch_size):
-                document_batch = [self._convert_es_hit_to_document(hit, return_embedding=False) for hit in result_batch]
-                embeddings = retriever.embed_documents(document_batch)  # type: ignore
-                assert len(document_batch) == len(embeddings)
-
-                if embeddings[0].shape[0] != self.embedding_dim:
-                    raise RuntimeError(
-                        f"Embedding dim. of model ({embeddings[0].shape[0]})"
-                        f" doesn't match embedding dim. in DocumentStore ({self.embedding_dim})."
-                        "Specify the arg `embedding_dim` when initializing ElasticsearchDocumentStore()"
-                    )
-                doc_updates = []
-                for doc, emb in zip(document_batch, embeddings):
-                    update = {
+        # Batches are handed between the threads through bounded queues. None marks the end of a queue.
+        document_batches: queue.Queue = queue.Queue(maxsize=max_queued_batches)
+        embedding_batches: queue.Queue = queue.Queue(maxsize=max_queued_batches)
+        stop_event = threading.Event()
+        errors: List[BaseException] = []
+
+        def prefetch_documents():
+            try:
+                for result_batch in get_batches_from_generator(result, batch_size):
+                    document_batch = [
+                        self._convert_es_hit_to_document(hit, return_embedding=False) for hit in result_batch
+                    ]
+                    if not _put_unless_stopped(document_batches, document_batch, stop_event):
+                        return
+                _put_unless_stopped(document_batches, None, stop_event)
+            except Exception as e:
+                errors.append(e)
+                stop_event.set()
+
+        def generate_updates():
+            while True:
+                embedding_batch = _get_unless_stopped(embedding_batches, stop_event)
+                if embedding_batch is None:
+                    return
+                # converting to lists happens here, in the writer thread, instead of blocking the embedding loop
+                for doc_id, emb in zip(*embedding_batch):
+                    yield {
                         "_op_type": "update",
                         "_index": index,
-                        "_id": doc.id,
+                        "_id": doc_id,
                         "doc": {self.embedding_field: emb.tolist()},
                     }
-                    doc_updates.append(update)
 
-                bulk(self.client, doc_updates, request_timeout=300, refresh=self.refresh_type, headers=headers)
-                progress_bar.update(batch_size)
+        def write_updates(progress_bar):
+            try:
+                for _ in parallel_bulk(
+                    self.client,
+                    generate_updates(),
+                    thread_count=bulk_writer_threads,
+                    queue_size=bulk_writer_threads,
+                    request_timeout=300,
+                    refresh=self.refresh_type,
+                    headers=headers,
+                ):
+                    progress_bar.update(1)
+            except Exception as e:
+                errors.append(e)
+                stop_event.set()
+
+        with tqdm(total=document_count, position=0, unit=" Docs", desc="Updating embeddings") as progress_bar:
+            prefetch_thread = threading.Thread(target=prefetch_documents, daemon=True)
+            writer_thread = threading.Thread(target=write_updates, args=(progress_bar,), daemon=True)
+            prefetch_thread.start()
+            writer_thread.start()
+            try:
+                while True:
+                    document_batch = _get_unless_stopped(document_batches, stop_event)
+                    if document_batch is None:
+                        break
+                    embeddings = retriever.embed_documents(document_batch)  # type: ignore
+                    assert len(document_batch) == len(embeddings)
+
+                    if embeddings[0].shape[0] != self.embedding_dim:
+                        raise RuntimeError(
+                            f"Embedding dim. of model ({embeddings[0].shape[0]})"
+                            f" doesn't match embedding dim. in DocumentStore ({self.embedding_dim})."
+                            "Specify the arg `embedding_dim` when initializing ElasticsearchDocumentStore()"
+                        )
+                    embedding_batch = ([doc.id for doc in document_batch], embeddings)
+                    if not _put_unless_stopped(embedding_batches, embedding_batch, stop_event):
+                        break
+                _put_unless_stopped(embedding_batches, None, stop_event)
+            except BaseException:
+                stop_event.set()
+                raise
+            finally:
+                writer_thread.join()
+                prefetch_thread.join()
+
+        if errors:
+            raise errors[0]
 
     def delete_all_documents(
         self,
@@ -1762,25 +2116,9 @@ class OpenSearchDocumentStore(ElasticsearchDocumentStore):
 
         if not self.embedding_field:
             raise RuntimeError("Please specify arg `embedding_field` in ElasticsearchDocumentStore()")
-        # +1 in similarity to avoid negative numbers (for cosine sim)
-        body: Dict[str, Any] = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
-        if filters:
-            body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
-
-        excluded_meta_data: Optional[list] = None
-
-        if self.excluded_meta_data:
-            excluded_meta_data = deepcopy(self.excluded_meta_data)
-
-            if return_embedding is True and self.embedding_field in excluded_meta_data:
-                excluded_meta_data.remove(self.embedding_field)
-            elif return_embedding is False and self.embedding_field not in excluded_meta_data:
-                excluded_meta_data.append(self.embedding_field)
-        elif return_embedding is False:
-            excluded_meta_data = [self.embedding_field]
-
-        if excluded_meta_data:
-            body["_source"] = {"excludes": excluded_meta_data}
+        body = self._construct_dense_query_body(
+            query_emb=query_emb, filters=filters, top_k=top_k, return_embedding=return_embedding
+        )
 
         logger.debug(f"Retriever query: {body}")
         result = self.client.search(index=index, body=body, request_timeout=300, headers=headers)["hits"]["hits"]
@@ -1962,6 +2300,24 @@ class OpenSearchDocumentStore(ElasticsearchDocumentStore):
             if not self.client.indices.exists(index=index_name, headers=headers):
                 raise e
 
+    def _construct_dense_query_body(
+        self,
+        query_emb: np.ndarray,
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]],
+        top_k: int,
+        return_embedding: bool,
+    ) -> Dict[str, Any]:
+        # +1 in similarity to avoid negative numbers (for cosine sim)
+        body: Dict[str, Any] = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
+        if filters:
+            body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+
+        excluded_meta_data = self._get_excluded_meta_data(return_embedding=return_embedding)
+        if excluded_meta_data:
+            body["_source"] = {"excludes": excluded_meta_data}
+
+        return body
+
     def _get_vector_similarity_query(self, query_emb: np.ndarray, top_k: int):
         """
         Generate Elasticsearch query for vector similarity.
@@ -1,6 +1,8 @@
-from typing import TYPE_CHECKING, Any, Union, List, Optional, Dict, Generator
+from typing import TYPE_CHECKING, Any, Union, List, Optional, Dict, Generator, Tuple
 
 import json
+import math
+import hashlib
 import logging
 import warnings
 from pathlib import Path
@@ -14,6 +16,7 @@ try:
     import faiss
     from haystack.document_stores.sql import (
         SQLDocumentStore,
+        DocumentORM,
     )  # its deps are optional, but get installed with the `faiss` extra
 except (ImportError, ModuleNotFoundError) as ie:
     from haystack.utils.import_utils import _optional_component_not_installed
@@ -21,7 +24,8 @@ except (ImportError, ModuleNotFoundError) as ie:
     _optional_component_not_installed(__name__, "faiss", ie)
 
 from haystack.schema import Document
-from haystack.document_stores.base import get_batches_from_generator
+from haystack.errors import DocumentStoreError
+from haystack.document_stores.base import get_batches_from_generator, get_filters_per_query
 
 if TYPE_CHECKING:
     from haystack.nodes.retriever import BaseRetriever
@@ -29,6 +33,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Filtered queries matching at most this many vectors are scored exactly instead of searching the FAISS index
+EXACT_FILTERED_SEARCH_MAX_VECTORS = 10_000
+# suggest_index_factory_str() suggests a "Flat" index, i.e. exact search, for corpora up to this size
+FLAT_INDEX_MAX_DOCUMENTS = 10_000
+
 
 class FAISSDocumentStore(SQLDocumentStore):
     """
@@ -56,6 +65,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         duplicate_documents: str = "overwrite",
         faiss_index_path: Union[str, Path] = None,
         faiss_config_path: Union[str, Path] = None,
+        faiss_index_mmap: bool = False,
         isolation_level: str = None,
         **kwargs,
     ):
@@ -101,6 +111,8 @@ class FAISSDocumentStore(SQLDocumentStore):
             If specified no other params besides faiss_config_path must be specified.
         :param faiss_config_path: Stored FAISS initial configuration parameters.
             Can be created via calling `save()`
+        :param faiss_index_mmap: Memory-map the stored FAISS index instead of reading it into RAM. Only used together
+            with `faiss_index_path`, see `load()`.
         :param isolation_level: see SQLAlchemy's `isolation_level` parameter for `create_engine()` (https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.isolation_level)
         """
         # special case if we want to load an existing index from disk
@@ -108,7 +120,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         if faiss_index_path is not None:
             sig = signature(self.__class__.__init__)
             self._validate_params_load_from_disk(sig, locals(), kwargs)
-            init_params = self._load_init_params_from_config(faiss_index_path, faiss_config_path)
+            init_params = self._load_init_params_from_config(faiss_index_path, faiss_config_path, mmap=faiss_index_mmap)
             self.__class__.__init__(self, **init_params)  # pylint: disable=non-parent-init-called
             return
 
@@ -156,7 +168,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         self._validate_index_sync()
 
     def _validate_params_load_from_disk(self, sig: Signature, locals: dict, kwargs: dict):
-        allowed_params = ["faiss_index_path", "faiss_config_path", "self", "kwargs"]
+        allowed_params = ["faiss_index_path", "faiss_config_path", "faiss_index_mmap", "self", "kwargs"]
         invalid_param_set = False
 
         for param in sig.parameters.values():
@@ -187,16 +199,71 @@ class FAISSDocumentStore(SQLDocumentStore):
             index = faiss.IndexHNSWFlat(embedding_dim, n_links, metric_type)
             index.hnsw.efSearch = kwargs.get("efSearch", 20)  # 20
             index.hnsw.efConstruction = kwargs.get("efConstruction", 80)  # 80
-            if "ivf" in index_factory.lower():  # enable reconstruction of vectors for inverted index
-                self.faiss_indexes[index].set_direct_map_type(faiss.DirectMap.Hashtable)
 
             logger.info(
                 f"HNSW params: n_links: {n_links}, efSearch: {index.hnsw.efSearch}, efConstruction: {index.hnsw.efConstruction}"
             )
         else:
             index = faiss.index_factory(embedding_dim, index_factory, metric_type)
+
+        if faiss.try_extract_index_ivf(index) is None and not index_factory.startswith("IDMap"):
+            # vectors get stable ids derived from the document ids, so they can be updated and removed one by one.
+            # Inverted indices store these ids themselves (an id map breaks on removals from them).
+            index = faiss.IndexIDMap2(index)
         return index
 
+    @staticmethod
+    def _get_vector_id(document_id: str, index: str) -> int:
+        """
+        Stable, non-negative 64-bit FAISS id of a document. It includes the index as vector ids are unique across
+        indices in the SQL database.
+        """
+        digest = hashlib.blake2b(f"{index}/{document_id}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") & 0x7FFF_FFFF_FFFF_FFFF
+
+    def _uses_document_vector_ids(self, index: str) -> bool:
+        """
+        Whether the vectors in the FAISS index have the ids from `_get_vector_id()`. That's the case for id maps and
+        inverted indices (which store arbitrary ids), unless the latter were filled by an older version that used the
+        position of a vector as its id. Other index types use positions, too.
+        """
+        faiss_index = self.faiss_indexes[index]
+        if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            return True
+        if faiss.try_extract_index_ivf(faiss_index) is None:
+            return False
+        if faiss_index.ntotal == 0:
+            return True
+        row = (
+            self.session.query(DocumentORM.id, DocumentORM.vector_id)
+            .filter(DocumentORM.index == index, DocumentORM.vector_id.isnot(None))
+            .first()
+        )
+        return row is None or row.vector_id == str(self._get_vector_id(row.id, index))
+
+    def _remove_vectors(self, vector_ids: List[int], index: str):
+        if not vector_ids:
+            return
+        faiss_index = self.faiss_indexes[index]
+        if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)) and faiss.try_extract_index_ivf(faiss_index):
+            # FAISS aborts the process when removing from an inverted index behind an id map
+            raise DocumentStoreError(
+                f"The FAISS index '{index}' doesn't support removing vectors (inverted indices in an id map don't)."
+            )
+        ids_to_remove = np.array(vector_ids, dtype="int64")
+        ivf_index = faiss.try_extract_index_ivf(faiss_index)
+        if ivf_index is not None and ivf_index.direct_map.type == faiss.DirectMap.Hashtable:
+            # inverted indices with a hashtable for reconstruction only remove an array of ids
+            selector = faiss.IDSelectorArray(len(ids_to_remove), faiss.swig_ptr(ids_to_remove))
+        else:
+            selector = faiss.IDSelectorBatch(len(ids_to_remove), faiss.swig_ptr(ids_to_remove))
+        try:
+            faiss_index.remove_ids(selector)
+        except RuntimeError as e:
+            raise DocumentStoreError(
+                f"The FAISS index '{index}' doesn't support removing vectors (e.g. HNSW indices don't)."
+            ) from e
+
     def write_documents(
         self,
         documents: Union[List[dict], List[Document]],
@@ -244,8 +311,11 @@ class FAISSDocumentStore(SQLDocumentStore):
         )
         if len(document_objects) > 0:
             add_vectors = False if document_objects[0].embedding is None else True
+            if add_vectors:
+                self._check_index_is_writable(index)
 
-            if self.duplicate_documents == "overwrite" and add_vectors:
+            uses_document_vector_ids = self._uses_document_vector_ids(index)
+            if self.duplicate_documents == "overwrite" and add_vectors and not uses_document_vector_ids:
                 logger.warning(
                     "You have to provide `duplicate_documents = 'overwrite'` arg and "
                     "`FAISSDocumentStore` does not support update in existing `faiss_index`.\n"
@@ -257,21 +327,31 @@ class FAISSDocumentStore(SQLDocumentStore):
                 total=len(document_objects), disable=not self.progress_bar, position=0, desc="Writing Documents"
             ) as progress_bar:
                 for i in range(0, len(document_objects), batch_size):
+                    batch_documents = document_objects[i : i + batch_size]
                     if add_vectors:
-                        embeddings = [doc.embedding for doc in document_objects[i : i + batch_size]]
+                        embeddings = [doc.embedding for doc in batch_documents]
                         embeddings_to_index = np.array(embeddings, dtype="float32")
 
                         if self.similarity == "cosine":
                             self.normalize_embedding(embeddings_to_index)
 
-                        self.faiss_indexes[index].add(embeddings_to_index)
+                        if uses_document_vector_ids:
+                            vector_ids = [self._get_vector_id(doc.id, index) for doc in batch_documents]
+                            if duplicate_documents == "overwrite":
+                                self._remove_vectors_of_existing_documents(batch_documents, index)
+                            self.faiss_indexes[index].add_with_ids(
+                                embeddings_to_index, np.array(vector_ids, dtype="int64")
+                            )
+                        else:
+                            vector_ids = list(range(vector_id, vector_id + len(batch_documents)))
+                            vector_id += len(batch_documents)
+                            self.faiss_indexes[index].add(embeddings_to_index)
 
                     docs_to_write_in_sql = []
-                    for doc in document_objects[i : i + batch_size]:
+                    for j, doc in enumerate(batch_documents):
                         meta = doc.meta
                         if add_vectors:
-                            meta["vector_id"] = vector_id
-                            vector_id += 1
+                            meta["vector_id"] = vector_ids[j]
                         docs_to_write_in_sql.append(doc)
 
                     super(FAISSDocumentStore, self).write_documents(
@@ -283,6 +363,17 @@ class FAISSDocumentStore(SQLDocumentStore):
                     progress_bar.update(batch_size)
             progress_bar.close()
 
+    def _remove_vectors_of_existing_documents(self, documents: List[Document], index: str):
+        """
+        Remove the vectors of those documents that are already stored, so that overwriting them replaces their
+        vectors instead of adding a second one.
+        """
+        existing_ids = self.get_existing_ids([doc.id for doc in documents], index=index)
+        try:
+            self._remove_vectors([self._get_vector_id(id, index) for id in existing_ids], index=index)
+        except DocumentStoreError as e:
+            logger.warning(f"{e} The old vectors of the {len(existing_ids)} overwritten documents stay in the index.")
+
     def _create_document_field_map(self) -> Dict:
         return {self.index: self.embedding_field}
 
@@ -310,13 +401,18 @@ class FAISSDocumentStore(SQLDocumentStore):
         :return: None
         """
         index = index or self.index
+        if index in self.faiss_indexes:
+            self._check_index_is_writable(index)
 
         if update_existing_embeddings is True:
             if filters is None:
                 self.faiss_indexes[index].reset()
                 self.reset_vector_ids(index)
-            else:
-                raise Exception("update_existing_embeddings=True is not supported with filters.")
+            elif not self._uses_document_vector_ids(index):
+                raise Exception(
+                    "update_existing_embeddings=True with filters is only supported for FAISS indices created by the "
+                    "FAISSDocumentStore."
+                )
 
         if not self.faiss_indexes.get(index):
             raise ValueError("Couldn't find a FAISS index. Try to init the FAISSDocumentStore() again ...")
@@ -328,6 +424,7 @@ class FAISSDocumentStore(SQLDocumentStore):
 
         logger.info(f"Updating embeddings for {document_count} docs...")
         vector_id = sum([index.ntotal for index in self.faiss_indexes.values()])
+        uses_document_vector_ids = self._uses_document_vector_ids(index)
 
         result = self._query(
             index=index,
@@ -349,12 +446,26 @@ class FAISSDocumentStore(SQLDocumentStore):
                 if self.similarity == "cosine":
                     self.normalize_embedding(embeddings_to_index)
 
-                self.faiss_indexes[index].add(embeddings_to_index)
-
-                vector_id_map = {}
-                for doc in document_batch:
-                    vector_id_map[str(doc.id)] = str(vector_id)
-                    vector_id += 1
+                if uses_document_vector_ids:
+                    vector_ids = [self._get_vector_id(doc.id, index) for doc in document_batch]
+                    # replace the existing vectors of the documents (only present if filters were used)
+                    self._remove_vectors(
+                        [
+                            vector_id
+                            for doc, vector_id in zip(document_batch, vector_ids)
+                            if doc.meta.get("vector_id") is not None
+                        ],
+                        index=index,
+                    )
+                    self.faiss_indexes[index].add_with_ids(embeddings_to_index, np.array(vector_ids, dtype="int64"))
+                else:
+                    vector_ids = list(range(vector_id, vector_id + len(document_batch)))
+                    vector_id += len(document_batch)
+                    self.faiss_indexes[index].add(embeddings_to_index)
+
+                vector_id_map = {
+                    str(doc.id): str(doc_vector_id) for doc, doc_vector_id in zip(document_batch, vector_ids)
+                }
                 self.update_vector_ids(vector_id_map, index=index)
                 progress_bar.set_description_str("Documents Processed")
                 progress_bar.update(batch_size)
@@ -456,15 +567,133 @@ class FAISSDocumentStore(SQLDocumentStore):
         :return: None
         """
         index = index or self.index
-        if embeddings and documents:
+        if embeddings is not None and documents:
             raise ValueError("Either pass `documents` or `embeddings`. You passed both.")
+        self._check_index_is_writable(index)
         if documents:
             document_objects = [Document.from_dict(d) if isinstance(d, dict) else d for d in documents]
             doc_embeddings = [doc.embedding for doc in document_objects]
             embeddings_for_train = np.array(doc_embeddings, dtype="float32")
-            self.faiss_indexes[index].train(embeddings_for_train)
-        if embeddings:
-            self.faiss_indexes[index].train(embeddings)
+        elif embeddings is not None:
+            embeddings_for_train = np.array(embeddings, dtype="float32")
+        else:
+            return
+
+        if self.similarity == "cosine":
+            # the index holds normalized vectors, see write_documents()
+            self.normalize_embedding(embeddings_for_train)
+        self.faiss_indexes[index].train(embeddings_for_train)
+
+    @staticmethod
+    def suggest_index_factory_str(
+        num_documents: int, embedding_dim: int, target_recall: float = 0.95
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Suggest a FAISS index type for a corpus of the given size, following the FAISS guidelines to choose an index
+        (https://github.com/facebookresearch/faiss/wiki/Guidelines-to-choose-an-index). The search parameters are
+        rules of thumb for the target recall@10, so verify them on a sample of your queries.
+
+        - Small corpora (or a target recall of 1.0) are searched exactly with "Flat".
+        - Up to 1 Mio documents and a target recall >= 0.98 use "HNSW32,Flat" with an efSearch for the target recall.
+        - Otherwise "IVF{nlist},Flat" with nlist around 4 * sqrt(num_documents) and an nprobe for the target recall.
+          Corpora with more than 1 Mio documents use an HNSW coarse quantizer ("IVF{nlist}_HNSW32").
+          For a target recall below 0.95, the vectors are compressed with product quantization ("PQ{m}",
+          4 dimensions per byte), which needs 16x less memory than "Flat".
+
+        :param num_documents: Expected number of documents in the index.
+        :param embedding_dim: The embedding vector size.
+        :param target_recall: Target recall of the approximate search compared to an exact search (0 < target_recall <= 1).
+        :return: The `faiss_index_factory_str` and the search parameters in the format of `faiss.ParameterSpace`
+                 (e.g. "nprobe=32") or None if there are none.
+        """
+        if not 0 < target_recall <= 1:
+            raise ValueError("`target_recall` must be in (0, 1].")
+
+        if num_documents <= FLAT_INDEX_MAX_DOCUMENTS or target_recall >= 1:
+            return "Flat", None
+
+        if target_recall >= 0.98 and num_documents <= 1_000_000:
+            ef_search = 256 if target_recall < 0.99 else 512
+            return "HNSW32,Flat", f"efSearch={ef_search}"
+
+        # nlist: power of two around 4 * sqrt(N), so that each list holds a few thousand vectors
+        nlist = 2 ** round(math.log2(4 * math.sqrt(num_documents)))
+        coarse_quantizer = f"IVF{nlist}" if num_documents <= 1_000_000 else f"IVF{nlist}_HNSW32"
+        if target_recall >= 0.95:
+            encoding = "Flat"
+        else:
+            # largest number of sub-quantizers with at least 4 dimensions each that divides embedding_dim
+            pq_m = max(m for m in range(1, embedding_dim // 4 + 1) if embedding_dim % m == 0)
+            encoding = f"PQ{pq_m}"
+
+        if target_recall <= 0.8:
+            nprobe = 8
+        elif target_recall <= 0.9:
+            nprobe = 16
+        elif target_recall <= 0.95:
+            nprobe = 32
+        else:
+            nprobe = 64
+        return f"{coarse_quantizer},{encoding}", f"nprobe={min(nprobe, nlist)}"
+
+    def create_tuned_index(
+        self,
+        num_documents: int,
+        target_recall: float = 0.95,
+        documents: Optional[Union[List[dict], List[Document]]] = None,
+        embeddings: Optional[np.ndarray] = None,
+        index: Optional[str] = None,
+        max_training_vectors: Optional[int] = None,
+    ) -> str:
+        """
+        Replace an empty FAISS index with the index type that `suggest_index_factory_str()` picks for the corpus size
+        and the target recall, set its search parameters and train it on a sample of the given documents or
+        embeddings if the index type requires training (e.g. IVF).
+
+        :param num_documents: Expected number of documents in the index.
+        :param target_recall: Target recall of the approximate search compared to an exact search.
+        :param documents: Documents (incl. the embeddings) to train the index on
+        :param embeddings: Plain embeddings to train the index on
+        :param index: Name of the index. If None, the DocumentStore's default index (self.index) will be used.
+        :param max_training_vectors: Maximum number of vectors to train on. Defaults to 256 per IVF list, more vectors
+                                     only make training slower. Indices without IVF lists are trained on all vectors.
+        :return: The `faiss_index_factory_str` of the new index.
+        """
+        index = index or self.index
+        if index in self.faiss_indexes and self.faiss_indexes[index].ntotal > 0:
+            raise DocumentStoreError(
+                f"FAISS index '{index}' already contains vectors. Only empty indices can be replaced with a tuned one."
+            )
+
+        faiss_index_factory_str, search_params = self.suggest_index_factory_str(
+            num_documents=num_documents, embedding_dim=self.embedding_dim, target_recall=target_recall
+        )
+        faiss_index = self._create_new_index(
+            embedding_dim=self.embedding_dim, metric_type=self.metric_type, index_factory=faiss_index_factory_str
+        )
+        if search_params:
+            faiss.ParameterSpace().set_index_parameters(faiss_index, search_params)
+        self.faiss_indexes[index] = faiss_index
+        logger.info(f"Created FAISS index '{faiss_index_factory_str}' ({search_params}) for index '{index}'.")
+
+        if not faiss_index.is_trained:
+            if documents:
+                document_objects = [Document.from_dict(d) if isinstance(d, dict) else d for d in documents]
+                embeddings = np.array([doc.embedding for doc in document_objects], dtype="float32")
+            if embeddings is None or len(embeddings) == 0:
+                raise DocumentStoreError(
+                    f"FAISS index '{faiss_index_factory_str}' needs to be trained. Pass `documents` or `embeddings`."
+                )
+            if max_training_vectors is None:
+                ivf_index = faiss.try_extract_index_ivf(faiss_index)
+                # indices without inverted lists are trained on all given vectors
+                max_training_vectors = 256 * ivf_index.nlist if ivf_index is not None else len(embeddings)
+            if len(embeddings) > max_training_vectors:
+                sample = np.random.default_rng().choice(len(embeddings), size=max_training_vectors, replace=False)
+                embeddings = embeddings[np.sort(sample)]
+            self.train_index(documents=None, embeddings=embeddings, index=index)
+
+        return faiss_index_factory_str
 
     def delete_all_documents(
         self,
@@ -511,18 +740,21 @@ class FAISSDocumentStore(SQLDocumentStore):
 
         index = index or self.index
         if index in self.faiss_indexes.keys():
+            self._check_index_is_writable(index)
             if not filters and not ids:
                 self.faiss_indexes[index].reset()
+            elif ids and not filters and self._uses_document_vector_ids(index):
+                self._remove_vectors([self._get_vector_id(id, index) for id in ids], index=index)
             else:
-                affected_docs = self.get_all_documents(filters=filters)
+                affected_docs = self.get_all_documents(index=index, filters=filters)
                 if ids:
                     affected_docs = [doc for doc in affected_docs if doc.id in ids]
                 doc_ids = [
-                    doc.meta.get("vector_id")
+                    int(doc.meta["vector_id"])
                     for doc in affected_docs
                     if doc.meta and doc.meta.get("vector_id") is not None
                 ]
-                self.faiss_indexes[index].remove_ids(np.array(doc_ids, dtype="int64"))
+                self._remove_vectors(doc_ids, index=index)
 
         super().delete_documents(index=index, ids=ids, filters=filters)
 
@@ -561,11 +793,57 @@ class FAISSDocumentStore(SQLDocumentStore):
         :param return_embedding: To return document embedding. Unlike other document stores, FAISS will return normalized embeddings
         :return:
         """
+        return self.query_by_embedding_batch(
+            query_embs=query_emb.reshape(1, -1),
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            return_embedding=return_embedding,
+            headers=headers,
+        )[0]
+
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric. All queries are searched with a single call to the FAISS index and the documents of all hits are
+        fetched with a single SQL query.
+
+        Filters are resolved to the vector ids of the matching documents in the SQL database first. If only a few
+        documents match, their vectors are scored exactly. Otherwise the FAISS index is searched with an ID selector,
+        so that each query still gets `top_k` matching documents if that many exist.
+
+        :param query_embs: Embeddings of the queries, one per row of an array or a list of arrays
+        :param filters: Optional filters to narrow down the search space. Either one filter dictionary that applies
+                        to all queries or a list with one (or None) per query.
+                        Example: {"name": ["some", "more"], "category": ["only_one"]}
+        :param top_k: How many documents to return per query
+        :param index: Index name to query the document from.
+        :param return_embedding: To return document embedding. Unlike other document stores, FAISS will return normalized embeddings
+        :return: One list of documents per query
+        """
         if headers:
             raise NotImplementedError("FAISSDocumentStore does not support headers.")
 
-        if filters:
-            logger.warning("Query filters are not implemented for the FAISSDocumentStore.")
+        if isinstance(filters, list):
+            # each query searches among the documents matching its own filters
+            return [
+                self.query_by_embedding_batch(
+                    query_embs=[query_emb],
+                    filters=query_filters,
+                    top_k=top_k,
+                    index=index,
+                    return_embedding=return_embedding,
+                )[0]
+                for query_emb, query_filters in zip(query_embs, get_filters_per_query(filters, len(query_embs)))
+            ]
 
         index = index or self.index
         if not self.faiss_indexes.get(index):
@@ -574,28 +852,151 @@ class FAISSDocumentStore(SQLDocumentStore):
         if return_embedding is None:
             return_embedding = self.return_embedding
 
-        query_emb = query_emb.reshape(1, -1).astype(np.float32)
+        if len(query_embs) == 0:
+            return []
+        # copy, normalize_embedding() works in place
+        query_embs = np.array(query_embs, dtype=np.float32).reshape(len(query_embs), -1)
 
         if self.similarity == "cosine":
-            self.normalize_embedding(query_emb)
+            self.normalize_embedding(query_embs)
 
-        score_matrix, vector_id_matrix = self.faiss_indexes[index].search(query_emb, top_k)
-        vector_ids_for_query = [str(vector_id) for vector_id in vector_id_matrix[0] if vector_id != -1]
-
-        documents = self.get_documents_by_vector_ids(vector_ids_for_query, index=index)
+        if filters:
+            filtered_vector_ids = self._get_vector_ids_by_filters(filters=filters, index=index)
+            if not filtered_vector_ids:
+                return [[] for _ in range(len(query_embs))]
+            score_matrix, vector_id_matrix = self._search_filtered(
+                faiss_index=self.faiss_indexes[index],
+                query_embs=query_embs,
+                top_k=top_k,
+                vector_ids=np.array([int(vector_id) for vector_id in filtered_vector_ids], dtype=np.int64),
+            )
+        else:
+            score_matrix, vector_id_matrix = self.faiss_indexes[index].search(query_embs, top_k)
 
-        # assign query score to each document
-        scores_for_vector_ids: Dict[str, float] = {
-            str(v_id): s for v_id, s in zip(vector_id_matrix[0], score_matrix[0])
+        hit_vector_ids = list({str(vector_id) for vector_id in vector_id_matrix.flat if vector_id != -1})
+        documents_by_vector_id = {
+            doc.meta["vector_id"]: doc for doc in self.get_documents_by_vector_ids(hit_vector_ids, index=index)
         }
-        for doc in documents:
-            raw_score = scores_for_vector_ids[doc.meta["vector_id"]]
-            doc.score = self.finalize_raw_score(raw_score, self.similarity)
 
-            if return_embedding is True:
-                doc.embedding = self.faiss_indexes[index].reconstruct(int(doc.meta["vector_id"]))
+        results = []
+        returned_vector_ids = set()
+        for scores, vector_ids in zip(score_matrix, vector_id_matrix):
+            documents = []
+            for raw_score, vector_id in zip(scores, vector_ids):
+                doc = documents_by_vector_id.get(str(vector_id))
+                if vector_id == -1 or doc is None:
+                    continue
+                if vector_id in returned_vector_ids:  # hit of several queries, each gets its own score
+                    doc = deepcopy(doc)
+                returned_vector_ids.add(vector_id)
+
+                # assign query score to each document
+                doc.score = self.finalize_raw_score(raw_score, self.similarity)
+                if return_embedding is True:
+                    doc.embedding = self.faiss_indexes[index].reconstruct(int(vector_id))
+                documents.append(doc)
+            results.append(documents)
+
+        return results
+
+    def _search_filtered(
+        self, faiss_index: "faiss.swigfaiss.Index", query_embs: np.ndarray, top_k: int, vector_ids: np.ndarray
+    ):
+        """
+        Search `faiss_index` among the given vector ids only.
+
+        Small selections are scored exactly from their reconstructed vectors. Larger ones are searched with a FAISS
+        ID selector. Approximate indexes may return fewer hits than requested when searching with a selector, in
+        which case we fall back to the exact scan as well.
 
-        return documents
+        :return: Tuple of score and vector id matrices of shape (len(query_embs), top_k), padded with -1 ids.
+        """
+        expected_hits = min(top_k, len(vector_ids))
+        selector_result = None
+        if len(vector_ids) > EXACT_FILTERED_SEARCH_MAX_VECTORS:
+            selector_result = self._search_with_id_selector(faiss_index, query_embs, top_k, vector_ids)
+            if selector_result is not None and (selector_result[1] != -1).sum(axis=1).min() >= expected_hits:
+                return selector_result
+
+        try:
+            embeddings = faiss_index.reconstruct_batch(vector_ids)
+        except RuntimeError:
+            # e.g. IVF indexes without a direct map can't reconstruct vectors
+            if selector_result is None:
+                selector_result = self._search_with_id_selector(faiss_index, query_embs, top_k, vector_ids)
+            if selector_result is None:
+                raise DocumentStoreError(
+                    f"Can't apply filters: the FAISS index of type {type(faiss_index).__name__} neither supports "
+                    f"reconstructing vectors nor searching with ID selectors."
+                )
+            return selector_result
+
+        if faiss_index.metric_type == faiss.METRIC_L2:
+            # FAISS returns squared distances for L2, lower is better
+            raw_scores = (
+                (query_embs**2).sum(axis=1)[:, None] - 2 * query_embs @ embeddings.T + (embeddings**2).sum(axis=1)
+            )
+            sort_keys = raw_scores
+        else:
+            raw_scores = query_embs @ embeddings.T
+            sort_keys = -raw_scores
+
+        top_positions = np.argpartition(sort_keys, expected_hits - 1, axis=1)[:, :expected_hits]
+        top_sort_keys = np.take_along_axis(sort_keys, top_positions, axis=1)
+        top_positions = np.take_along_axis(top_positions, np.argsort(top_sort_keys, axis=1), axis=1)
+
+        score_matrix = np.full((len(query_embs), top_k), -np.inf, dtype=np.float32)
+        vector_id_matrix = np.full((len(query_embs), top_k), -1, dtype=np.int64)
+        score_matrix[:, :expected_hits] = np.take_along_axis(raw_scores, top_positions, axis=1)
+        vector_id_matrix[:, :expected_hits] = vector_ids[top_positions]
+        return score_matrix, vector_id_matrix
+
+    def _search_with_id_selector(
+        self, faiss_index: "faiss.swigfaiss.Index", query_embs: np.ndarray, top_k: int, vector_ids: np.ndarray
+    ):
+        """
+        Search `faiss_index` restricted to `vector_ids` with a FAISS ID selector.
+        Returns None if the installed FAISS version or the index type doesn't support search parameters.
+        """
+        if not hasattr(faiss, "SearchParameters"):
+            return None
+
+        if isinstance(faiss_index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            # FAISS doesn't pass search parameters through an id map, so search the wrapped index by positions
+            id_map = faiss.vector_to_array(faiss_index.id_map)
+            positions = np.flatnonzero(np.isin(id_map, vector_ids))
+            result = self._search_with_id_selector(
+                faiss.downcast_index(faiss_index.index), query_embs, top_k, positions
+            )
+            if result is None:
+                return None
+            scores, positions = result
+            return scores, np.where(positions >= 0, id_map[np.maximum(positions, 0)], -1)
+
+        selector = faiss.IDSelectorBatch(vector_ids)
+        # The search parameters of an index type override its own settings, so carry those over
+        if isinstance(faiss_index, faiss.IndexHNSW):
+            search_params = faiss.SearchParametersHNSW(sel=selector, efSearch=faiss_index.hnsw.efSearch)
+        elif isinstance(faiss_index, faiss.IndexIVF):
+            search_params = faiss.SearchParametersIVF(sel=selector, nprobe=faiss_index.nprobe)
+        else:
+            search_params = faiss.SearchParameters(sel=selector)
+
+        try:
+            return faiss_index.search(query_embs, top_k, params=search_params)
+        except RuntimeError as e:
+            logger.debug(f"Searching {type(faiss_index).__name__} with an ID selector failed: {e}")
+            return None
+
+    def _check_index_is_writable(self, index: str):
+        """
+        Memory-mapped IVF indices (see `load()`) are read-only, FAISS aborts the process if vectors are added or removed.
+        """
+        ivf_index = faiss.try_extract_index_ivf(self.faiss_indexes[index])
+        if ivf_index is not None and getattr(faiss.downcast_InvertedLists(ivf_index.invlists), "read_only", False):
+            raise DocumentStoreError(
+                f"FAISS index '{index}' is memory-mapped and read-only. Load it with `mmap=False` to modify it."
+            )
 
     def save(self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None):
         """
@@ -616,7 +1017,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         faiss.write_index(self.faiss_indexes[self.index], str(index_path))
 
         config_to_save = deepcopy(self._component_config["params"])
-        keys_to_remove = ["faiss_index", "faiss_index_path"]
+        keys_to_remove = ["faiss_index", "faiss_index_path", "faiss_index_mmap"]
         for key in keys_to_remove:
             if key in config_to_save.keys():
                 del config_to_save[key]
@@ -625,7 +1026,7 @@ class FAISSDocumentStore(SQLDocumentStore):
             json.dump(config_to_save, ipp, default=str)
 
     def _load_init_params_from_config(
-        self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None
+        self, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None, mmap: bool = False
     ):
         if not config_path:
             index_path = Path(index_path)
@@ -642,7 +1043,15 @@ class FAISSDocumentStore(SQLDocumentStore):
                 "to access it."
             ) from e
 
-        faiss_index = faiss.read_index(str(index_path))
+        if mmap:
+            faiss_index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+            if faiss.try_extract_index_ivf(faiss_index) is None:
+                logger.warning(
+                    f"Only the inverted lists of IVF indices can be memory-mapped. "
+                    f"The {type(faiss_index).__name__} in '{index_path}' was read into memory."
+                )
+        else:
+            faiss_index = faiss.read_index(str(index_path))
 
         # Add other init params to override the ones defined in the init params file
         init_params["faiss_index"] = faiss_index
@@ -651,7 +1060,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         return init_params
 
     @classmethod
-    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None):
+    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None, mmap: bool = False):
         """
         Load a saved FAISS index from a file and connect to the SQL database.
         Note: In order to have a correct mapping from FAISS to SQL,
@@ -660,5 +1069,9 @@ class FAISSDocumentStore(SQLDocumentStore):
         :param index_path: Stored FAISS index file. Can be created via calling `save()`
         :param config_path: Stored FAISS initial configuration parameters.
             Can be created via calling `save()`
+        :param mmap: Memory-map the inverted lists of IVF indices from `index_path` instead of reading them into RAM.
+            Several processes that load the same file share the pages in the OS page cache and loading is nearly
+            instant. The index is read-only then: writing, updating or deleting documents raises an error.
+            Other index types (e.g. Flat, HNSW) are read into memory as usual.
         """
-        return cls(faiss_index_path=index_path, faiss_config_path=config_path)
+        return cls(faiss_index_path=index_path, faiss_config_path=config_path, faiss_index_mmap=mmap)
@@ -5,7 +5,7 @@ from collections import defaultdict
 from sqlalchemy.sql import select
 from sqlalchemy import and_, or_
 
-from haystack.document_stores.utils import convert_date_to_rfc3339
+from haystack.document_stores.utils import convert_date_to_rfc3339, convert_meta_value_to_datetime
 
 
 def nested_defaultdict() -> defaultdict:
@@ -257,6 +257,48 @@ class ComparisonOperation(ABC):
         """
         pass
 
+    def _get_sql_column_and_value(self, meta_document_orm, value: Optional[Union[str, int, float, bool]] = None):
+        """
+        Determines the column of the meta table that the comparison value is compared with. Numbers and booleans are
+        compared with the numeric column and ISO 8601 dates with the datetime column, so that range filters compare
+        values instead of strings and can use the indexes on these columns. Any other value is compared with the
+        string column.
+        """
+        if value is None:
+            assert not isinstance(self.comparison_value, list)  # Necessary for mypy
+            value = self.comparison_value
+
+        if isinstance(value, (bool, int, float)):
+            return meta_document_orm.value_number, float(value)
+        date_value = convert_meta_value_to_datetime(value)
+        if date_value is not None:
+            return meta_document_orm.value_datetime, date_value
+        return meta_document_orm.value, value
+
+    @staticmethod
+    def _include_untyped_values(meta_document_orm, column, condition):
+        """
+        Extends a negated condition on a typed column to the values without a typed copy (e.g. strings in a field
+        that mostly contains numbers), as these aren't equal to the comparison value either.
+        """
+        if column is meta_document_orm.value:
+            return condition
+        return or_(condition, column.is_(None))
+
+    def _get_sql_column_and_values(self, meta_document_orm):
+        """
+        Like `_get_sql_column_and_value()` for a list of comparison values. Falls back to the string column if the
+        values don't share the same type.
+        """
+        assert isinstance(self.comparison_value, list), "Comparison value must be a list."
+        columns_and_values = [
+            self._get_sql_column_and_value(meta_document_orm, value) for value in self.comparison_value
+        ]
+        columns = {column.key for column, _ in columns_and_values}
+        if len(columns) == 1:
+            return columns_and_values[0][0], [value for _, value in columns_and_values]
+        return meta_document_orm.value, self.comparison_value
+
     def _get_weaviate_datatype(
         self, value: Optional[Union[str, int, float, bool]] = None
     ) -> Tuple[str, Union[str, int, float, bool]]:
@@ -421,9 +463,8 @@ class EqOperation(ComparisonOperation):
         return {"term": {self.field_name: self.comparison_value}}
 
     def convert_to_sql(self, meta_document_orm):
-        return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value == self.comparison_value
-        )
+        column, value = self._get_sql_column_and_value(meta_document_orm)
+        return select([meta_document_orm.document_id]).where(meta_document_orm.name == self.field_name, column == value)
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, int, float, bool]]:
         comp_value_type, comp_value = self._get_weaviate_datatype()
@@ -452,8 +493,9 @@ class InOperation(ComparisonOperation):
         return {"terms": {self.field_name: self.comparison_value}}
 
     def convert_to_sql(self, meta_document_orm):
+        column, values = self._get_sql_column_and_values(meta_document_orm)
         return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value.in_(self.comparison_value)
+            meta_document_orm.name == self.field_name, column.in_(values)
         )
 
     def convert_to_weaviate(self) -> Dict[str, Union[str, List[Dict]]]:
@@ -491,8 +533,10 @@ class NeOperation(ComparisonOperation):
         return {"bool": {"must_not": {"term": {self.field_name: self.comparison_value}}}}
 
     def convert_to_sql(self, meta_document_orm):
+        column, value = self._get_sql_column_and_value(meta_document_orm)
         return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value != self.comparison_value
+            meta_document_orm.name == self.field_name,
+            self._include_untyped_values(meta_document_orm, column, column != value),
         )
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, int, float, bool]]:
@@ -522,8 +566,10 @@ class NinOperation(ComparisonOperation):
         return {"bool": {"must_not": {"terms": {self.field_name: self.comparison_value}}}}
 
     def convert_to_sql(self, meta_document_orm):
+        column, values = self._get_sql_column_and_values(meta_document_orm)
         return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value.notin_(self.comparison_value)
+            meta_document_orm.name == self.field_name,
+            self._include_untyped_values(meta_document_orm, column, column.notin_(values)),
         )
 
     def convert_to_weaviate(self) -> Dict[str, Union[str, List[Dict]]]:
@@ -561,9 +607,8 @@ class GtOperation(ComparisonOperation):
         return {"range": {self.field_name: {"gt": self.comparison_value}}}
 
     def convert_to_sql(self, meta_document_orm):
-        return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value > self.comparison_value
-        )
+        column, value = self._get_sql_column_and_value(meta_document_orm)
+        return select([meta_document_orm.document_id]).where(meta_document_orm.name == self.field_name, column > value)
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, float, int]]:
         comp_value_type, comp_value = self._get_weaviate_datatype()
@@ -595,9 +640,8 @@ class GteOperation(ComparisonOperation):
         return {"range": {self.field_name: {"gte": self.comparison_value}}}
 
     def convert_to_sql(self, meta_document_orm):
-        return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value >= self.comparison_value
-        )
+        column, value = self._get_sql_column_and_value(meta_document_orm)
+        return select([meta_document_orm.document_id]).where(meta_document_orm.name == self.field_name, column >= value)
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, float, int]]:
         comp_value_type, comp_value = self._get_weaviate_datatype()
@@ -629,9 +673,8 @@ class LtOperation(ComparisonOperation):
         return {"range": {self.field_name: {"lt": self.comparison_value}}}
 
     def convert_to_sql(self, meta_document_orm):
-        return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value < self.comparison_value
-        )
+        column, value = self._get_sql_column_and_value(meta_document_orm)
+        return select([meta_document_orm.document_id]).where(meta_document_orm.name == self.field_name, column < value)
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, float, int]]:
         comp_value_type, comp_value = self._get_weaviate_datatype()
@@ -663,9 +706,8 @@ class LteOperation(ComparisonOperation):
         return {"range": {self.field_name: {"lte": self.comparison_value}}}
 
     def convert_to_sql(self, meta_document_orm):
-        return select([meta_document_orm.document_id]).where(
-            meta_document_orm.name == self.field_name, meta_document_orm.value <= self.comparison_value
-        )
+        column, value = self._get_sql_column_and_value(meta_document_orm)
+        return select([meta_document_orm.document_id]).where(meta_document_orm.name == self.field_name, column <= value)
 
     def convert_to_weaviate(self) -> Dict[str, Union[List[str], str, float, int]]:
         comp_value_type, comp_value = self._get_weaviate_datatype()
@@ -1,18 +1,22 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Generator
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, Generator
 
+import re
+import math
 import time
 import logging
-from copy import deepcopy
-from collections import defaultdict
+from array import array
+from copy import copy, deepcopy
+from itertools import islice
+from collections import Counter, defaultdict
 
 import numpy as np
 import torch
 from tqdm import tqdm
 
 from haystack.schema import Document, Label
-from haystack.errors import DuplicateDocumentError
-from haystack.document_stores import BaseDocumentStore
-from haystack.document_stores.base import get_batches_from_generator
+from haystack.errors import DuplicateDocumentError, DocumentStoreError
+from haystack.document_stores import KeywordDocumentStore
+from haystack.document_stores.base import get_batches_from_generator, expit
 from haystack.modeling.utils import initialize_device_settings
 from haystack.document_stores.filter_utils import LogicalFilterClause
 
@@ -22,7 +26,120 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class InMemoryDocumentStore(BaseDocumentStore):
+class _BM25Index:
+    """
+    Incremental inverted index that scores documents with BM25.
+
+    Postings are stored per term as compact arrays of document slots and term frequencies. Deleted documents are
+    only marked as such and get compacted away once they make up more than half of the slots, so that adding or
+    removing a document never requires re-indexing the whole collection.
+    """
+
+    token_pattern = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.doc_freqs: Dict[str, int] = {}
+        self.slot_ids: List[Optional[str]] = []
+        self.slots: Dict[str, int] = {}
+        self.alive = bytearray()
+        self.doc_lengths = array("I")
+        self.total_length = 0
+
+    def tokenize(self, text: str) -> List[str]:
+        return self.token_pattern.findall(text.lower())
+
+    def add(self, doc_id: str, text: str):
+        tokens = self.tokenize(text)
+        slot = len(self.slot_ids)
+        self.slot_ids.append(doc_id)
+        self.slots[doc_id] = slot
+        self.alive.append(1)
+        self.doc_lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        postings, doc_freqs = self.postings, self.doc_freqs
+        for term, term_freq in Counter(tokens).items():
+            term_postings = postings.get(term)
+            if term_postings is None:
+                term_postings = postings[term] = (array("I"), array("I"))
+            term_postings[0].append(slot)
+            term_postings[1].append(term_freq)
+            doc_freqs[term] = doc_freqs.get(term, 0) + 1
+
+    def remove(self, doc_id: str, text: str):
+        """
+        Remove a document from the index. `text` must be the text the document was indexed with.
+        """
+        slot = self.slots.pop(doc_id, None)
+        if slot is None:
+            return
+        self.slot_ids[slot] = None
+        self.alive[slot] = 0
+        self.total_length -= self.doc_lengths[slot]
+        for term in set(self.tokenize(text)):
+            if term in self.doc_freqs:
+                self.doc_freqs[term] -= 1
+        if len(self.slot_ids) - len(self.slots) > len(self.slots):
+            self._compact()
+
+    def _compact(self):
+        alive = np.frombuffer(self.alive, dtype=np.uint8).astype(bool)
+        new_slots = np.cumsum(alive, dtype=np.int64) - 1
+        for term in list(self.postings.keys()):
+            term_slots = np.frombuffer(self.postings[term][0], dtype=np.uint32)
+            term_freqs = np.frombuffer(self.postings[term][1], dtype=np.uint32)
+            keep = alive[term_slots]
+            if not keep.any():
+                del self.postings[term]
+                del self.doc_freqs[term]
+                continue
+            compacted_slots, compacted_freqs = array("I"), array("I")
+            compacted_slots.frombytes(new_slots[term_slots[keep]].astype(np.uint32).tobytes())
+            compacted_freqs.frombytes(term_freqs[keep].tobytes())
+            self.postings[term] = (compacted_slots, compacted_freqs)
+
+        doc_lengths = np.frombuffer(self.doc_lengths, dtype=np.uint32)[alive]
+        self.doc_lengths = array("I")
+        self.doc_lengths.frombytes(doc_lengths.tobytes())
+        self.slot_ids = [doc_id for doc_id in self.slot_ids if doc_id is not None]
+        self.slots = {doc_id: slot for slot, doc_id in enumerate(self.slot_ids)}  # type: ignore
+        self.alive = bytearray(b"\x01" * len(self.slot_ids))
+
+    def score(self, query: str, all_terms_must_match: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the slots of all documents that match the query together with their BM25 scores.
+        """
+        query_terms = Counter(self.tokenize(query))
+        num_docs = len(self.slots)
+        # Without any tokens in the stored documents, no document can match and the average length is undefined
+        if num_docs == 0 or self.total_length == 0 or not query_terms:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+
+        doc_lengths = np.frombuffer(self.doc_lengths, dtype=np.uint32).astype(np.float32)
+        length_norm = self.k1 * (1 - self.b + self.b * doc_lengths / (self.total_length / num_docs))
+        scores = np.zeros(len(self.slot_ids), dtype=np.float32)
+        matched_terms = np.zeros(len(self.slot_ids), dtype=np.int32)
+        for term, query_term_freq in query_terms.items():
+            if term not in self.postings:
+                continue
+            term_slots = np.frombuffer(self.postings[term][0], dtype=np.uint32)
+            term_freqs = np.frombuffer(self.postings[term][1], dtype=np.uint32).astype(np.float32)
+            doc_freq = self.doc_freqs[term]
+            idf = math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+            scores[term_slots] += (
+                query_term_freq * idf * term_freqs * (self.k1 + 1) / (term_freqs + length_norm[term_slots])
+            )
+            matched_terms[term_slots] += 1
+
+        required_matches = len(query_terms) if all_terms_must_match else 1
+        is_match = (matched_terms >= required_matches) & np.frombuffer(self.alive, dtype=np.uint8).astype(bool)
+        matching_slots = np.nonzero(is_match)[0]
+        return matching_slots, scores[matching_slots]
+
+
+class InMemoryDocumentStore(KeywordDocumentStore):
     """
     In-memory document store
     """
@@ -82,6 +199,15 @@ class InMemoryDocumentStore(BaseDocumentStore):
         self.devices, _ = initialize_device_settings(use_cuda=self.use_gpu)
         self.main_device = self.devices[0]
 
+        # Per-index embedding matrix (float32, L2-normalized for cosine similarity) kept in sync with the stored
+        # documents so that queries don't need to gather and stack the embeddings of the whole corpus each time.
+        self._embedding_matrices: Dict[str, np.ndarray] = {}
+        self._embedding_ids: Dict[str, List[str]] = {}
+        self._embedding_positions: Dict[str, Dict[str, int]] = {}
+        # Per-index BM25 inverted index. It is built on the first keyword query of an index and kept up to date
+        # incrementally afterwards.
+        self._bm25_indexes: Dict[str, _BM25Index] = {}
+
     def write_documents(
         self,
         documents: Union[List[dict], List[Document]],
@@ -125,22 +251,130 @@ class InMemoryDocumentStore(BaseDocumentStore):
             Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents
         ]
         documents_objects = self._drop_duplicate_documents(documents=documents_objects)
-        for document in documents_objects:
-            if document.id in self.indexes[index]:
-                if duplicate_documents == "fail":
+        if duplicate_documents == "fail":
+            for document in documents_objects:
+                if document.id in self.indexes[index]:
                     raise DuplicateDocumentError(
                         f"Document with id '{document.id} already " f"exists in index '{index}'"
                     )
+        written_documents = []
+        replaced_documents = []
+        for document in documents_objects:
+            if document.id in self.indexes[index]:
                 if duplicate_documents == "skip":
                     logger.warning(
                         f"Duplicate Documents: Document with id '{document.id} already exists in index " f"'{index}'"
                     )
                     continue
+                replaced_documents.append(self.indexes[index][document.id])
             self.indexes[index][document.id] = document
+            written_documents.append(document)
+        self._update_embedding_matrix(index=index, documents=written_documents)
+        if index in self._bm25_indexes:
+            bm25_index = self._bm25_indexes[index]
+            for document in replaced_documents:
+                if isinstance(document.content, str):
+                    bm25_index.remove(document.id, document.content)
+            for document in written_documents:
+                if isinstance(document.content, str):
+                    bm25_index.add(document.id, document.content)
 
     def _create_document_field_map(self):
         return {self.embedding_field: "embedding"}
 
+    def _update_embedding_matrix(self, index: str, documents: List[Document]):
+        """
+        Add, replace or remove the rows of the given documents in the embedding matrix of `index`.
+        Documents without an embedding are removed from the matrix.
+        """
+        matrix = self._embedding_matrices.get(index)
+        ids = self._embedding_ids.setdefault(index, [])
+        positions = self._embedding_positions.setdefault(index, {})
+
+        ids_to_remove = []
+        new_ids: List[str] = []
+        new_positions: Dict[str, int] = {}
+        new_rows: List[np.ndarray] = []
+        for document in documents:
+            if document.embedding is None:
+                if document.id in positions:
+                    ids_to_remove.append(document.id)
+                continue
+
+            row = np.asarray(document.embedding, dtype=np.float32).reshape(-1)
+            embedding_dim = matrix.shape[1] if matrix is not None else (new_rows[0].shape[0] if new_rows else None)
+            if embedding_dim is not None and row.shape[0] != embedding_dim:
+                raise DocumentStoreError(
+                    f"Embedding dim. of document '{document.id}' ({row.shape[0]}) doesn't match the embedding dim. "
+                    f"of the other documents in index '{index}' ({embedding_dim})."
+                )
+            if self.similarity == "cosine":
+                row = self._normalize_rows(row.reshape(1, -1))[0]
+
+            if document.id in positions:
+                matrix[positions[document.id]] = row  # type: ignore
+            elif document.id in new_positions:
+                new_rows[new_positions[document.id]] = row
+            else:
+                new_positions[document.id] = len(new_rows)
+                new_ids.append(document.id)
+                new_rows.append(row)
+
+        if new_rows:
+            new_matrix = np.stack(new_rows)
+            offset = len(ids)
+            self._embedding_matrices[index] = new_matrix if matrix is None else np.concatenate([matrix, new_matrix])
+            ids.extend(new_ids)
+            for doc_id, position in new_positions.items():
+                positions[doc_id] = offset + position
+
+        if ids_to_remove:
+            self._remove_from_embedding_matrix(index=index, ids=ids_to_remove)
+
+    def _remove_from_embedding_matrix(self, index: str, ids: Optional[List[str]] = None):
+        """
+        Remove the rows of the given document ids from the embedding matrix of `index`.
+        All rows are removed if no ids are passed.
+        """
+        positions = self._embedding_positions.get(index)
+        if ids is None or not positions:
+            self._embedding_matrices.pop(index, None)
+            self._embedding_ids.pop(index, None)
+            self._embedding_positions.pop(index, None)
+            return
+
+        rows_to_remove = [positions[doc_id] for doc_id in set(ids) if doc_id in positions]
+        if not rows_to_remove:
+            return
+
+        keep = np.ones(len(self._embedding_ids[index]), dtype=bool)
+        keep[rows_to_remove] = False
+        remaining_ids = [doc_id for doc_id, kept in zip(self._embedding_ids[index], keep) if kept]
+        if not remaining_ids:
+            self._remove_from_embedding_matrix(index=index)
+            return
+        self._embedding_matrices[index] = self._embedding_matrices[index][keep]
+        self._embedding_ids[index] = remaining_ids
+        self._embedding_positions[index] = {doc_id: position for position, doc_id in enumerate(remaining_ids)}
+
+    def _get_bm25_index(self, index: str) -> _BM25Index:
+        """
+        Return the BM25 index of `index`, building it from the stored documents if it doesn't exist yet.
+        """
+        if index not in self._bm25_indexes:
+            bm25_index = _BM25Index()
+            for document in self._filter_documents(index=index):
+                if isinstance(document.content, str):
+                    bm25_index.add(document.id, document.content)
+            self._bm25_indexes[index] = bm25_index
+        return self._bm25_indexes[index]
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return matrix / norms
+
     def write_labels(
         self,
         labels: Union[List[dict], List[Label]],
@@ -189,14 +423,53 @@ class InMemoryDocumentStore(BaseDocumentStore):
         else:
             return None
 
-    def get_documents_by_id(self, ids: List[str], index: Optional[str] = None) -> List[Document]:  # type: ignore
+    def get_documents_by_id(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Document]:
         """
         Fetch documents by specifying a list of text id strings.
         """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+
         index = index or self.index
         documents = [self.indexes[index][id] for id in ids]
         return documents
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+
+        index = index or self.index
+        documents = self.indexes.get(index, {})
+        return [id for id in ids if id in documents]
+
+    def get_all_document_ids(
+        self, index: Optional[str] = None, batch_size: int = 10_000, headers: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Return the ids of all documents in the index.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+
+        index = index or self.index
+        documents = self.indexes.get(index, {})
+        return [id for id, doc in documents.items() if isinstance(doc, Document)]
+
     def get_scores_torch(self, query_emb: np.ndarray, document_to_search: List[Document]) -> List[float]:
         """
         Calculate similarity scores between query embedding and a list of documents using torch.
@@ -276,6 +549,95 @@ class InMemoryDocumentStore(BaseDocumentStore):
 
         return scores
 
+    def query(
+        self,
+        query: Optional[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        custom_query: Optional[str] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        all_terms_must_match: bool = False,
+    ) -> List[Document]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to the query as defined by the BM25 algorithm.
+
+        The inverted index of an index is built on its first query and is updated incrementally when documents are
+        written or deleted afterwards.
+
+        :param query: The query. If None, the documents matching `filters` are returned without ranking.
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions.
+                        Filters are defined as nested dictionaries. The keys of the dictionaries can be a logical
+                        operator (`"$and"`, `"$or"`, `"$not"`), a comparison operator (`"$eq"`, `"$in"`, `"$gt"`,
+                        `"$gte"`, `"$lt"`, `"$lte"`) or a metadata field name.
+                        Logical operator keys take a dictionary of metadata field names and/or logical operators as
+                        value. Metadata field names take a dictionary of comparison operators as value. Comparison
+                        operator keys take a single value or (in case of `"$in"`) a list of values as value.
+                        If no logical operator is provided, `"$and"` is used as default operation. If no comparison
+                        operator is provided, `"$eq"` (or `"$in"` if the comparison value is a list) is used as default
+                        operation.
+                        Example:
+                            ```python
+                            filters = {
+                                "$and": {
+                                    "type": {"$eq": "article"},
+                                    "date": {"$gte": "2015-01-01", "$lt": "2021-01-01"},
+                                    "rating": {"$gte": 3},
+                                    "$or": {
+                                        "genre": {"$in": ["economy", "politics"]},
+                                        "publisher": {"$eq": "nytimes"}
+                                    }
+                                }
+                            }
+                            ```
+        :param top_k: How many documents to return per query.
+        :param custom_query: Not supported by the InMemoryDocumentStore.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param all_terms_must_match: Whether all terms of the query must match the document.
+                                     If true all query terms must be present in a document in order to be retrieved (i.e the AND operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy AND fish AND restaurant").
+                                     Otherwise at least one query term must be present in a document in order to be retrieved (i.e the OR operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy OR fish OR restaurant").
+                                     Defaults to False.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+        if custom_query:
+            raise NotImplementedError("InMemoryDocumentStore does not support custom queries.")
+
+        index = index or self.index
+        if query is None:
+            return list(islice(self._query(index=index, filters=filters), top_k))
+
+        bm25_index = self._get_bm25_index(index)
+        slots, scores = bm25_index.score(query, all_terms_must_match=all_terms_must_match)
+        documents = self.indexes[index]
+
+        if filters and len(slots) > 0:
+            parsed_filter = LogicalFilterClause.parse(filters)
+            is_match = np.array(
+                [parsed_filter.evaluate(documents[bm25_index.slot_ids[slot]].meta) for slot in slots], dtype=bool
+            )
+            slots, scores = slots[is_match], scores[is_match]
+
+        top_k = min(top_k, len(scores))
+        if top_k <= 0:
+            return []
+        if top_k < len(scores):
+            top_positions = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top_positions = np.arange(len(scores))
+        top_positions = top_positions[np.argsort(-scores[top_positions], kind="stable")]
+
+        result = []
+        for position in top_positions:
+            document = self._copy_document(
+                documents[bm25_index.slot_ids[slots[position]]], return_embedding=self.return_embedding
+            )
+            document.score = float(expit(np.asarray(scores[position] / 8)))  # scaling probability from BM25
+            result.append(document)
+        return result
+
     def query_by_embedding(
         self,
         query_emb: np.ndarray,
@@ -351,7 +713,8 @@ class InMemoryDocumentStore(BaseDocumentStore):
                             ```
         :param top_k: How many documents to return
         :param index: Index name for storing the docs and metadata
-        :param return_embedding: To return document embedding
+        :param return_embedding: To return document embedding. Returned embeddings are read-only views on the
+                                 stored embeddings.
         :return:
         """
         if headers:
@@ -364,20 +727,65 @@ class InMemoryDocumentStore(BaseDocumentStore):
         if query_emb is None:
             return []
 
-        document_to_search = self.get_all_documents(index=index, filters=filters, return_embedding=True)
-        scores = self.get_scores(query_emb, document_to_search)
+        embedding_matrix = self._embedding_matrices.get(index)
+        if embedding_matrix is None:
+            return []
+        embedding_ids = self._embedding_ids[index]
+        documents = self.indexes[index]
+
+        if filters:
+            parsed_filter = LogicalFilterClause.parse(filters)
+            candidate_rows = np.array(
+                [row for row, doc_id in enumerate(embedding_ids) if parsed_filter.evaluate(documents[doc_id].meta)],
+                dtype=np.int64,
+            )
+            if len(candidate_rows) == 0:
+                return []
+            embedding_matrix = embedding_matrix[candidate_rows]
+        else:
+            candidate_rows = None
+
+        scores = self._get_scores_from_matrix(query_emb, embedding_matrix)
+
+        # Only the top_k best candidates need to be sorted and turned into Documents
+        top_k = min(top_k, len(scores))
+        if top_k <= 0:
+            return []
+        if top_k < len(scores):
+            top_rows = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top_rows = np.arange(len(scores))
+        top_rows = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+
+        result = []
+        for row in top_rows:
+            doc = documents[embedding_ids[row if candidate_rows is None else candidate_rows[row]]]
+            new_document = self._copy_document(doc, return_embedding=return_embedding)
+            new_document.score = self.finalize_raw_score(float(scores[row]), self.similarity)
+            result.append(new_document)
+
+        return result
 
-        candidate_docs = []
-        for doc, score in zip(document_to_search, scores):
-            curr_meta = deepcopy(doc.meta)
-            new_document = Document(id=doc.id, content=doc.content, meta=curr_meta, embedding=doc.embedding)
-            new_document.embedding = doc.embedding if return_embedding is True else None
+    def _get_scores_from_matrix(self, query_emb: np.ndarray, embedding_matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate similarity scores between a single query embedding and the rows of the (already normalized for
+        cosine similarity) embedding matrix of an index.
+        """
+        query_emb = np.asarray(query_emb, dtype=np.float32).reshape(-1)
+        if self.similarity == "cosine":
+            query_emb = self._normalize_rows(query_emb.reshape(1, -1))[0]
 
-            new_document.embedding = doc.embedding if return_embedding is True else None
-            new_document.score = self.finalize_raw_score(score, self.similarity)
-            candidate_docs.append(new_document)
+        if self.main_device.type != "cuda":
+            return embedding_matrix @ query_emb
 
-        return sorted(candidate_docs, key=lambda x: x.score if x.score is not None else 0.0, reverse=True)[0:top_k]
+        query_emb_tensor = torch.as_tensor(query_emb).to(self.main_device)
+        scores = []
+        with torch.no_grad():
+            for curr_pos in range(0, len(embedding_matrix), self.scoring_batch_size):
+                doc_embeds_slice = torch.as_tensor(embedding_matrix[curr_pos : curr_pos + self.scoring_batch_size])
+                doc_embeds_slice = doc_embeds_slice.to(self.main_device)
+                scores.append(torch.matmul(doc_embeds_slice, query_emb_tensor).cpu().numpy())
+        return np.concatenate(scores)
 
     def update_embeddings(
         self,
@@ -430,11 +838,15 @@ class InMemoryDocumentStore(BaseDocumentStore):
         if not self.embedding_field:
             raise RuntimeError("Specify the arg embedding_field when initializing InMemoryDocumentStore()")
 
-        # TODO Index embeddings every X batches to avoid OOM for huge document collections
-        result = self._query(
+        document_count = self.get_document_count(
             index=index, filters=filters, only_documents_without_embedding=not update_existing_embeddings
         )
-        document_count = len(result)
+        result = self._query(
+            index=index,
+            filters=filters,
+            return_embedding=False,
+            only_documents_without_embedding=not update_existing_embeddings,
+        )
         logger.info(f"Updating embeddings for {document_count} docs ...")
         batched_documents = get_batches_from_generator(result, batch_size)
         with tqdm(
@@ -453,6 +865,9 @@ class InMemoryDocumentStore(BaseDocumentStore):
 
                 for doc, emb in zip(document_batch, embeddings):
                     self.indexes[index][doc.id].embedding = emb
+                self._update_embedding_matrix(
+                    index=index, documents=[self.indexes[index][doc.id] for doc in document_batch]
+                )
                 progress_bar.set_description_str("Documents Processed")
                 progress_bar.update(batch_size)
 
@@ -469,16 +884,16 @@ class InMemoryDocumentStore(BaseDocumentStore):
         if headers:
             raise NotImplementedError("InMemoryDocumentStore does not support headers.")
 
-        documents = self._query(
+        documents = self._filter_documents(
             index=index, filters=filters, only_documents_without_embedding=only_documents_without_embedding
         )
-        return len(documents)
+        return sum(1 for _ in documents)
 
     def get_embedding_count(self, filters: Optional[Dict[str, List[str]]] = None, index: Optional[str] = None) -> int:
         """
         Return the count of embeddings in the document store.
         """
-        documents = self.get_all_documents(filters=filters, index=index)
+        documents = self._filter_documents(index=index, filters=filters)
         embedding_count = sum(doc.embedding is not None for doc in documents)
         return embedding_count
 
@@ -492,32 +907,61 @@ class InMemoryDocumentStore(BaseDocumentStore):
         index = index or self.label_index
         return len(self.indexes[index].items())
 
-    def _query(
+    def _filter_documents(
         self,
         index: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,  # TODO: Adapt type once we allow extended filters in InMemoryDocStore
-        return_embedding: Optional[bool] = None,
         only_documents_without_embedding: bool = False,
-    ):
+    ) -> Generator[Document, None, None]:
+        """
+        Iterate over the stored documents of an index that match the given filters. The documents are yielded
+        as they are stored, so callers must not modify them.
+        """
         index = index or self.index
-        documents = deepcopy(list(self.indexes[index].values()))
-        documents = [d for d in documents if isinstance(d, Document)]
+        parsed_filter = LogicalFilterClause.parse(filters) if filters else None
+        for doc in self.indexes[index].values():
+            if not isinstance(doc, Document):
+                continue
+            if only_documents_without_embedding and doc.embedding is not None:
+                continue
+            if parsed_filter and not parsed_filter.evaluate(doc.meta):
+                continue
+            yield doc
+
+    @staticmethod
+    def _copy_document(document: Document, return_embedding: bool) -> Document:
+        """
+        Create a lightweight copy of a stored document to hand out to callers. The meta dict and table content are
+        copied, text content is shared and the embedding is returned as a read-only view on the stored array.
+        """
+        new_document = copy(document)
+        new_document.meta = deepcopy(document.meta)
+        if document.content_type == "table":
+            # DataFrames are mutable, so callers must not get the stored one
+            new_document.content = deepcopy(document.content)
+        if return_embedding and document.embedding is not None:
+            embedding = document.embedding.view()
+            embedding.flags.writeable = False
+            new_document.embedding = embedding
+        else:
+            new_document.embedding = None
+        return new_document
 
+    def _query(
+        self,
+        index: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,  # TODO: Adapt type once we allow extended filters in InMemoryDocStore
+        return_embedding: Optional[bool] = None,
+        only_documents_without_embedding: bool = False,
+    ) -> Generator[Document, None, None]:
         if return_embedding is None:
             return_embedding = self.return_embedding
-        if return_embedding is False:
-            for doc in documents:
-                doc.embedding = None
 
-        if only_documents_without_embedding:
-            documents = [doc for doc in documents if doc.embedding is None]
-        if filters:
-            parsed_filter = LogicalFilterClause.parse(filters)
-            filtered_documents = list(filter(lambda doc: parsed_filter.evaluate(doc.meta), documents))
-        else:
-            filtered_documents = documents
-
-        return filtered_documents
+        documents = self._filter_documents(
+            index=index, filters=filters, only_documents_without_embedding=only_documents_without_embedding
+        )
+        for doc in documents:
+            yield self._copy_document(doc, return_embedding=return_embedding)
 
     def get_all_documents(
         self,
@@ -556,7 +1000,8 @@ class InMemoryDocumentStore(BaseDocumentStore):
                                 }
                             }
                             ```
-        :param return_embedding: Whether to return the document embeddings.
+        :param return_embedding: Whether to return the document embeddings. Returned embeddings are read-only views
+                                 on the stored embeddings.
         """
         if headers:
             raise NotImplementedError("InMemoryDocumentStore does not support headers.")
@@ -605,7 +1050,8 @@ class InMemoryDocumentStore(BaseDocumentStore):
                                 }
                             }
                             ```
-        :param return_embedding: Whether to return the document embeddings.
+        :param return_embedding: Whether to return the document embeddings. Returned embeddings are read-only views
+                                 on the stored embeddings.
         """
         if headers:
             raise NotImplementedError("InMemoryDocumentStore does not support headers.")
@@ -735,12 +1181,24 @@ class InMemoryDocumentStore(BaseDocumentStore):
         index = index or self.index
         if not filters and not ids:
             self.indexes[index] = {}
+            self._remove_from_embedding_matrix(index=index)
+            self._bm25_indexes.pop(index, None)
             return
-        docs_to_delete = self.get_all_documents(index=index, filters=filters)
-        if ids:
-            docs_to_delete = [doc for doc in docs_to_delete if doc.id in ids]
-        for doc in docs_to_delete:
-            del self.indexes[index][doc.id]
+        if filters:
+            ids_to_delete = [doc.id for doc in self._filter_documents(index=index, filters=filters)]
+            if ids:
+                ids_set = set(ids)
+                ids_to_delete = [doc_id for doc_id in ids_to_delete if doc_id in ids_set]
+        else:
+            ids_to_delete = [
+                doc_id for doc_id in set(ids) if isinstance(self.indexes[index].get(doc_id), Document)  # type: ignore
+            ]
+        bm25_index = self._bm25_indexes.get(index)
+        for doc_id in ids_to_delete:
+            document = self.indexes[index].pop(doc_id)
+            if bm25_index and isinstance(document.content, str):
+                bm25_index.remove(doc_id, document.content)
+        self._remove_from_embedding_matrix(index=index, ids=ids_to_delete)
 
     def delete_index(self, index: str):
         """
@@ -755,6 +1213,8 @@ class InMemoryDocumentStore(BaseDocumentStore):
                 f"If you plan to use this index again, please reinstantiate '{self.__class__.__name__}' in order to avoid side-effects."
             )
         del self.indexes[index]
+        self._remove_from_embedding_matrix(index=index)
+        self._bm25_indexes.pop(index, None)
 
     def delete_labels(
         self,
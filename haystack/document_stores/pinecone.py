@@ -455,6 +455,24 @@ class PineconeDocumentStore(SQLDocumentStore):
 
         return documents
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index. The ids are looked up in the SQL
+        database that holds the document contents, so no vectors are fetched from Pinecone.
+        """
+        if headers:
+            raise NotImplementedError("PineconeDocumentStore does not support headers.")
+
+        index = index or self.index
+        index = self._sanitize_index_name(index)
+        return super().get_existing_ids(ids=ids, index=index, batch_size=batch_size)
+
     def get_embedding_count(
         self, index: Optional[str] = None, filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None
     ) -> int:
@@ -13,13 +13,19 @@ try:
         create_engine,
         Column,
         String,
+        Float,
         DateTime,
         Boolean,
         Text,
         text,
         JSON,
         ForeignKeyConstraint,
+        Index,
+        bindparam,
+        inspect,
+        select,
     )
+    from sqlalchemy.dialects import mysql, postgresql, sqlite
     from sqlalchemy.ext.declarative import declarative_base
     from sqlalchemy.orm import relationship, sessionmaker
     from sqlalchemy.sql import case, null
@@ -31,6 +37,7 @@ except (ImportError, ModuleNotFoundError) as ie:
 from haystack.schema import Document, Label, Answer
 from haystack.document_stores.base import BaseDocumentStore
 from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.utils import convert_meta_value_to_datetime, convert_meta_value_to_number
 
 
 logger = logging.getLogger(__name__)
@@ -60,16 +67,26 @@ class DocumentORM(ORMBase):
 class MetaDocumentORM(ORMBase):
     __tablename__ = "meta_document"
 
-    name = Column(String(100), index=True)
-    value = Column(String(1000), index=True)
+    name = Column(String(100))
+    value = Column(String(1000))
+    # typed copies of value, so that filters compare numbers and dates by value (see ComparisonOperation.convert_to_sql)
+    value_number = Column(Float(precision=53), nullable=True)
+    value_datetime = Column(DateTime, nullable=True)
     documents = relationship("DocumentORM", back_populates="meta")
 
-    document_id = Column(String(100), nullable=False, index=True)
-    document_index = Column(String(100), nullable=False, index=True)
+    document_id = Column(String(100), nullable=False)
+    document_index = Column(String(100), nullable=False)
     __table_args__ = (
         ForeignKeyConstraint(
             [document_id, document_index], [DocumentORM.id, DocumentORM.index], ondelete="CASCADE", onupdate="CASCADE"
         ),
+        # meta of a batch of documents is fetched by (document_id, document_index), filters look up (name, value)
+        Index("ix_meta_document_document_id_document_index", document_id, document_index),
+        # MySQL limits InnoDB keys to 3072 bytes, which name and value exceed with utf8mb4, so only a prefix of value
+        # is indexed there
+        Index("ix_meta_document_name_value", name, value, mysql_length={"value": 255}),
+        Index("ix_meta_document_name_value_number", name, value_number),
+        Index("ix_meta_document_name_value_datetime", name, value_datetime),
         {},
     )  # type: ignore
 
@@ -143,6 +160,9 @@ class SQLDocumentStore(BaseDocumentStore):
         else:
             engine = create_engine(url, **create_engine_params)
         Base.metadata.create_all(engine)
+        self._add_typed_meta_columns(engine)
+        self._create_missing_indexes(engine)
+        self._drop_superseded_indexes(engine)
         Session = sessionmaker(bind=engine)
         self.session = Session()
         self.index: str = index
@@ -151,11 +171,99 @@ class SQLDocumentStore(BaseDocumentStore):
         if getattr(self, "similarity", None) is None:
             self.similarity = None
         self.use_windowed_query = True
+        self.use_upsert = True
         if "sqlite" in url:
             import sqlite3
 
             if sqlite3.sqlite_version < "3.25":
                 self.use_windowed_query = False
+            # ON CONFLICT ... DO UPDATE was added in SQLite 3.24
+            if sqlite3.sqlite_version_info < (3, 24):
+                self.use_upsert = False
+
+    @staticmethod
+    def _add_typed_meta_columns(engine, batch_size: int = 10_000):
+        """
+        Add the typed copies of the meta values to a meta_document table created with an earlier version and fill
+        them from the string values.
+        """
+        table = MetaDocumentORM.__table__
+        existing_columns = {column["name"] for column in inspect(engine).get_columns(table.name)}
+        missing_columns = [table.c[name] for name in ("value_number", "value_datetime") if name not in existing_columns]
+        if not missing_columns:
+            return
+
+        logger.info(f"Adding the columns {[column.name for column in missing_columns]} to the table {table.name}.")
+        quote = engine.dialect.identifier_preparer.quote
+        with engine.begin() as connection:
+            for column in missing_columns:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} "
+                        f"{column.type.compile(dialect=engine.dialect)}"
+                    )
+                )
+
+            update = (
+                table.update()
+                .where(table.c.id == bindparam("row_id"))
+                .values(value_number=bindparam("number_value"), value_datetime=bindparam("datetime_value"))
+            )
+            # page through the rows by id, so that large tables are not loaded at once
+            last_row_id = ""
+            while True:
+                rows = connection.execute(
+                    select([table.c.id, table.c.value])
+                    .where(table.c.id > last_row_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                ).fetchall()
+                if not rows:
+                    break
+                last_row_id = rows[-1][0]
+                updates = [
+                    {
+                        "row_id": row_id,
+                        "number_value": convert_meta_value_to_number(value),
+                        "datetime_value": convert_meta_value_to_datetime(value),
+                    }
+                    for row_id, value in rows
+                ]
+                updates = [u for u in updates if u["number_value"] is not None or u["datetime_value"] is not None]
+                if updates:
+                    connection.execute(update, updates)
+
+    @staticmethod
+    def _create_missing_indexes(engine):
+        """
+        `create_all()` doesn't change tables that already exist. Create the indexes that were added to the tables
+        in later versions, so that databases created with earlier versions use them as well.
+        """
+        for table in Base.metadata.sorted_tables:
+            for table_index in table.indexes:
+                table_index.create(bind=engine, checkfirst=True)
+
+    @staticmethod
+    def _drop_superseded_indexes(engine):
+        """
+        Drop the single-column indexes on the meta_document table that were created by earlier versions. The
+        composite indexes cover the same lookups, and keeping both would slow down every meta insert.
+        """
+        table = MetaDocumentORM.__table__
+        existing_indexes = {table_index["name"] for table_index in inspect(engine).get_indexes(table.name)}
+        superseded_indexes = [
+            f"ix_{table.name}_{column}" for column in ("name", "value", "document_id", "document_index")
+        ]
+        quote = engine.dialect.identifier_preparer.quote
+        with engine.begin() as connection:
+            for index_name in superseded_indexes:
+                if index_name not in existing_indexes:
+                    continue
+                logger.info(f"Dropping the index {index_name}, which is superseded by the composite indexes.")
+                drop_statement = f"DROP INDEX {quote(index_name)}"
+                if engine.dialect.name == "mysql":
+                    drop_statement += f" ON {quote(table.name)}"
+                connection.execute(text(drop_statement))
 
     def get_document_by_id(
         self, id: str, index: Optional[str] = None, headers: Optional[Dict[str, str]] = None
@@ -191,6 +299,44 @@ class SQLDocumentStore(BaseDocumentStore):
 
         return documents
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given document ids that already exist in the index. Only the id column is queried.
+        """
+        if headers:
+            raise NotImplementedError("SQLDocumentStore does not support headers.")
+
+        index = index or self.index
+
+        existing_ids = []
+        for i in range(0, len(ids), batch_size):
+            query = self.session.query(DocumentORM.id).filter(
+                DocumentORM.id.in_(ids[i : i + batch_size]), DocumentORM.index == index
+            )
+            existing_ids.extend(row.id for row in query.all())
+
+        return existing_ids
+
+    def get_all_document_ids(
+        self, index: Optional[str] = None, batch_size: int = 10_000, headers: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Return the ids of all documents in the index. Only the id column is queried.
+        """
+        if headers:
+            raise NotImplementedError("SQLDocumentStore does not support headers.")
+
+        index = index or self.index
+
+        query = self.session.query(DocumentORM.id).filter(DocumentORM.index == index)
+        return [row.id for row in query.yield_per(batch_size)]
+
     def get_documents_by_vector_ids(self, vector_ids: List[str], index: Optional[str] = None, batch_size: int = 10_000):
         """Fetch documents by specifying a list of text vector id strings"""
         index = index or self.index
@@ -203,9 +349,26 @@ class SQLDocumentStore(BaseDocumentStore):
             for row in query.all():
                 documents.append(self._convert_sql_row_to_document(row))
 
-        sorted_documents = sorted(documents, key=lambda doc: vector_ids.index(doc.meta["vector_id"]))
+        positions = {vector_id: position for position, vector_id in enumerate(vector_ids)}
+        sorted_documents = sorted(documents, key=lambda doc: positions[doc.meta["vector_id"]])
         return sorted_documents
 
+    def _get_vector_ids_by_filters(
+        self,
+        filters: Dict[str, Any],  # TODO: Adapt type once we allow extended filters in SQLDocStore
+        index: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Fetch the vector ids of all documents that have a vector id and match the given filters.
+        Only the vector id column is loaded, so this is cheap even for a large number of matches.
+        """
+        index = index or self.index
+        select_ids = LogicalFilterClause.parse(filters).convert_to_sql(MetaDocumentORM)
+        query = self.session.query(DocumentORM.vector_id).filter(
+            DocumentORM.index == index, DocumentORM.id.in_(select_ids), DocumentORM.vector_id.isnot(None)
+        )
+        return [row.vector_id for row in query.all()]
+
     def get_all_documents(
         self,
         index: Optional[str] = None,
@@ -308,18 +471,18 @@ class SQLDocumentStore(BaseDocumentStore):
                 }
             )
             if i % batch_size == 0:
-                documents_map = self._get_documents_meta(documents_map)
+                documents_map = self._get_documents_meta(documents_map, index=index)
                 yield from documents_map.values()
                 documents_map = {}
         if documents_map:
-            documents_map = self._get_documents_meta(documents_map)
+            documents_map = self._get_documents_meta(documents_map, index=index)
             yield from documents_map.values()
 
-    def _get_documents_meta(self, documents_map):
+    def _get_documents_meta(self, documents_map, index: str):
         doc_ids = documents_map.keys()
         meta_query = self.session.query(
             MetaDocumentORM.document_id, MetaDocumentORM.name, MetaDocumentORM.value
-        ).filter(MetaDocumentORM.document_id.in_(doc_ids))
+        ).filter(MetaDocumentORM.document_id.in_(doc_ids), MetaDocumentORM.document_index == index)
 
         for row in meta_query.all():
             documents_map[row.document_id].meta[row.name] = row.value
@@ -362,7 +525,7 @@ class SQLDocumentStore(BaseDocumentStore):
                                     Parameter options : ( 'skip','overwrite','fail')
                                     skip: Ignore the duplicates documents
                                     overwrite: Update any existing documents with the same ID when adding documents
-                                    but is considerably slower (default).
+                                    (default).
                                     fail: an error is raised if the document ID of the document being added already
                                     exists.
 
@@ -384,32 +547,42 @@ class SQLDocumentStore(BaseDocumentStore):
         document_objects = self._handle_duplicate_documents(
             documents=document_objects, index=index, duplicate_documents=duplicate_documents
         )
+        if duplicate_documents == "overwrite":
+            # a single upsert statement must not touch the same row twice, the last version of a document wins
+            document_objects = list({doc.id: doc for doc in document_objects}.values())
+
         for i in range(0, len(document_objects), batch_size):
-            docs_orm = []
+            document_rows = []
+            meta_rows = []
             for doc in document_objects[i : i + batch_size]:
                 meta_fields = doc.meta or {}
                 vector_id = meta_fields.pop("vector_id", None)
-                meta_orms = [MetaDocumentORM(name=key, value=value) for key, value in meta_fields.items()]
-                doc_mapping = {
-                    "id": doc.id,
-                    "content": doc.to_dict()["content"],
-                    "content_type": doc.content_type,
-                    "vector_id": vector_id,
-                    "meta": meta_orms,
-                    "index": index,
-                }
+                document_rows.append(
+                    {
+                        "id": doc.id,
+                        "content": doc.to_dict()["content"],
+                        "content_type": doc.content_type,
+                        "vector_id": vector_id,
+                        "index": index,
+                    }
+                )
+                meta_rows.extend(
+                    self._get_meta_row(name=key, value=value, document_id=doc.id, document_index=index)
+                    for key, value in meta_fields.items()
+                )
+
+            try:
                 if duplicate_documents == "overwrite":
-                    doc_orm = DocumentORM(**doc_mapping)
                     # First old meta data cleaning is required
-                    self.session.query(MetaDocumentORM).filter_by(document_id=doc.id).delete()
-                    self.session.merge(doc_orm)
+                    self.session.query(MetaDocumentORM).filter(
+                        MetaDocumentORM.document_index == index,
+                        MetaDocumentORM.document_id.in_([row["id"] for row in document_rows]),
+                    ).delete(synchronize_session=False)
+                    self._upsert_document_rows(document_rows)
                 else:
-                    docs_orm.append(doc_mapping)
-
-            if docs_orm:
-                self.session.bulk_insert_mappings(DocumentORM, docs_orm)
-
-            try:
+                    self.session.execute(DocumentORM.__table__.insert(), document_rows)
+                if meta_rows:
+                    self.session.execute(MetaDocumentORM.__table__.insert(), meta_rows)
                 self.session.commit()
             except Exception as ex:
                 logger.error(f"Transaction rollback: {ex.__cause__}")
@@ -417,6 +590,33 @@ class SQLDocumentStore(BaseDocumentStore):
                 self.session.rollback()
                 raise ex
 
+    def _upsert_document_rows(self, document_rows: List[Dict[str, Any]]):
+        """
+        Insert the rows into the document table in a single executemany, replacing the rows that already exist.
+        Uses the native upsert of SQLite, PostgreSQL and MySQL and falls back to deleting the existing rows first.
+        """
+        table = DocumentORM.__table__
+        update_columns = ["content", "content_type", "vector_id"]
+        dialect = self.session.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql") and self.use_upsert:
+            statement = (sqlite.insert if dialect == "sqlite" else postgresql.insert)(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.id, table.c.index],
+                set_={**{column: statement.excluded[column] for column in update_columns}, "updated_at": func.now()},
+            )
+        elif dialect == "mysql":
+            statement = mysql.insert(table)
+            statement = statement.on_duplicate_key_update(
+                **{column: statement.inserted[column] for column in update_columns}, updated_at=func.now()
+            )
+        else:
+            self.session.query(DocumentORM).filter(
+                DocumentORM.index == document_rows[0]["index"], DocumentORM.id.in_([row["id"] for row in document_rows])
+            ).delete(synchronize_session=False)
+            statement = table.insert()
+        self.session.execute(statement, document_rows)
+
     def write_labels(self, labels, index=None, headers: Optional[Dict[str, str]] = None):
         """Write annotation labels into document store."""
         if headers:
@@ -501,13 +701,29 @@ class SQLDocumentStore(BaseDocumentStore):
         if not index:
             index = self.index
         self.session.query(MetaDocumentORM).filter_by(document_id=id, document_index=index).delete()
-        meta_orms = [
-            MetaDocumentORM(name=key, value=value, document_id=id, document_index=index) for key, value in meta.items()
+        meta_rows = [
+            self._get_meta_row(name=key, value=value, document_id=id, document_index=index)
+            for key, value in meta.items()
         ]
-        for m in meta_orms:
-            self.session.add(m)
+        if meta_rows:
+            self.session.execute(MetaDocumentORM.__table__.insert(), meta_rows)
         self.session.commit()
 
+    @staticmethod
+    def _get_meta_row(name: str, value: Any, document_id: str, document_index: str) -> Dict[str, Any]:
+        """
+        Create a row of the meta_document table, including the typed copies of the value.
+        """
+        return {
+            "id": str(uuid4()),
+            "name": name,
+            "value": value,
+            "value_number": convert_meta_value_to_number(value),
+            "value_datetime": convert_meta_value_to_datetime(value),
+            "document_id": document_id,
+            "document_index": document_index,
+        }
+
     def get_document_count(
         self,
         filters: Optional[Dict[str, Any]] = None,  # TODO: Adapt type once we allow extended filters in SQLDocStore
@@ -1,9 +1,11 @@
 import typing
 from typing import Dict, List, Optional, Tuple, Union, Generator
 
+import re
 import json
+import math
 import logging
-from datetime import datetime
+from datetime import date, datetime, timezone
 
 from haystack.schema import Document, Label, Answer, Span
 from haystack.nodes.preprocessor import PreProcessor
@@ -275,3 +277,46 @@ def convert_date_to_rfc3339(date: str) -> str:
         converted_date = parsed_datetime.isoformat()
 
     return converted_date
+
+
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def convert_meta_value_to_number(value) -> Optional[float]:
+    """
+    Converts a meta value to a number so that it can be compared numerically, e.g. by the typed meta columns of the
+    SQLDocumentStore. Numbers, booleans and strings containing a finite number are converted, anything else
+    results in None.
+    """
+    if isinstance(value, (bool, int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def convert_meta_value_to_datetime(value) -> Optional[datetime]:
+    """
+    Converts a date or a string starting with an ISO 8601 date (e.g. "2021-12-31" or "2021-12-31T23:59:59+01:00") to
+    a naive datetime in UTC so that it can be compared chronologically. Anything else results in None.
+    """
+    if isinstance(value, str):
+        if not ISO_DATE_PATTERN.match(value):
+            return None
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    elif not isinstance(value, datetime):
+        return None
+
+    if value.utcoffset() is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
@@ -302,6 +302,30 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 documents.append(document)
         return documents
 
+    def get_existing_ids(
+        self,
+        ids: List[str],
+        index: Optional[str] = None,
+        batch_size: int = 10_000,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Return those of the given uuid strings that already exist. Unlike `get_documents_by_id()`, this doesn't
+        fetch the objects and their vectors but only checks for their existence.
+        """
+        if headers:
+            raise NotImplementedError("WeaviateDocumentStore does not support headers.")
+
+        index = self._sanitize_index_name(index) or self.index
+        existing_ids = []
+        for id in ids:
+            try:
+                if self.weaviate_client.data_object.exists(self._sanitize_id(id=id, index=index)):
+                    existing_ids.append(id)
+            except weaviate.exceptions.UnexpectedStatusCodeException as usce:
+                logging.debug(f"Weaviate could not check the existence of the document requested: {usce}")
+        return existing_ids
+
     def _sanitize_id(self, id: str, index: Optional[str] = None) -> str:
         """
         Generate a valid uuid if the provided id is not in uuid format.
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Union, Generator, Set, Any
+from typing import List, Optional, Dict, Union, Generator, Set, Any, Iterable
 
 import os
 import logging
@@ -47,6 +47,7 @@ class Inferencer:
         extraction_layer: Optional[int] = None,
         num_processes: Optional[int] = None,
         disable_tqdm: bool = False,
+        bucket_by_length: bool = False,
     ):
         """
         Initializes Inferencer from an AdaptiveModel and a Processor instance.
@@ -71,6 +72,10 @@ class Inferencer:
                               :func:`~farm.infer.Inferencer.close_multiprocessing_pool` after you are
                               done using this class. The garbage collector will not do this for you!
         :param disable_tqdm: Whether to disable tqdm logging (can get very verbose in multiprocessing)
+        :param bucket_by_length: Whether to batch samples of similar token length together and cut the padding of each
+                                 batch down to its longest sample. This speeds up inference on short texts a lot, but
+                                 changes confidence scores slightly as they are computed over the padding, too.
+                                 Only used for tasks that aggregate predictions across samples, e.g. question answering.
         :return: An instance of the Inferencer.
 
         """
@@ -86,6 +91,7 @@ class Inferencer:
         self.language = self.model.get_language()
         self.task_type = task_type
         self.disable_tqdm = disable_tqdm
+        self.bucket_by_length = bucket_by_length
         self.problematic_sample_ids: Set[List[int]] = set()  # type ignore
 
         if task_type == "embeddings":
@@ -130,6 +136,7 @@ class Inferencer:
         multithreading_rust: bool = True,
         devices: Optional[List[torch.device]] = None,
         use_auth_token: Union[bool, str] = None,
+        bucket_by_length: bool = False,
         **kwargs,
     ):
         """
@@ -170,6 +177,8 @@ class Inferencer:
                                     Note: Enabling multithreading in Rust AND multiprocessing in python might cause
                                     deadlocks.
         :param devices: List of devices to perform inference on. (Currently, only the first device in the list is used.)
+        :param bucket_by_length: Whether to batch samples of similar token length together and cut the padding of each
+                                 batch down to its longest sample. See `Inferencer.__init__()`.
         :return: An instance of the Inferencer.
         """
         if tokenizer_args is None:
@@ -241,6 +250,7 @@ class Inferencer:
             extraction_layer=extraction_layer,
             num_processes=num_processes,
             disable_tqdm=disable_tqdm,
+            bucket_by_length=bucket_by_length,
         )
 
     def _set_multiprocessing_pool(self, num_processes: Optional[int]) -> None:
@@ -497,8 +507,14 @@ class Inferencer:
                         Example: QA - input string to convert the predicted answer from indices back to string space
         :return: list of predictions
         """
+        if self.bucket_by_length and "padding_mask" in tensor_names:
+            sample_order = self._get_samples_sorted_by_length(dataset, tensor_names)
+            sampler: Iterable[int] = sample_order
+        else:
+            sample_order = None
+            sampler = SequentialSampler(dataset)
         data_loader = NamedDataLoader(
-            dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names
+            dataset=dataset, sampler=sampler, batch_size=self.batch_size, tensor_names=tensor_names
         )  # type ignore
         # TODO Sometimes this is the preds of one head, sometimes of two. We need a more advanced stacking operation
         # TODO so that preds of the right shape are passed in to formatted_preds
@@ -508,6 +524,8 @@ class Inferencer:
             tqdm(data_loader, desc=f"Inferencing Samples", unit=" Batches", disable=self.disable_tqdm)
         ):
 
+            if sample_order is not None:
+                batch = self._trim_padding(batch)
             batch = {key: batch[key].to(self.devices[0]) for key in batch}
 
             # get logits
@@ -519,6 +537,9 @@ class Inferencer:
                 preds = self.model.logits_to_preds(logits, **batch)
                 unaggregated_preds_all.append(preds)
 
+        if sample_order is not None:
+            unaggregated_preds_all = self._restore_sample_order(unaggregated_preds_all, sample_order)
+
         # In some use cases we want to aggregate the individual predictions.
         # This is mostly useful, if the input text is longer than the max_seq_len that the model can process.
         # In QA we can use this to get answers from long input texts by first getting predictions for smaller passages
@@ -535,6 +556,46 @@ class Inferencer:
         )  # type ignore
         return preds_all
 
+    @staticmethod
+    def _get_samples_sorted_by_length(dataset: Dataset, tensor_names: List) -> List[int]:
+        """
+        Indices of the samples in the dataset, from the longest to the shortest sample (in tokens).
+        """
+        padding_mask_idx = tensor_names.index("padding_mask")
+        lengths = [int(sample[padding_mask_idx].sum()) for sample in dataset]  # type: ignore
+        return sorted(range(len(lengths)), key=lambda idx: lengths[idx], reverse=True)
+
+    @staticmethod
+    def _trim_padding(batch: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """
+        Cut all tensors of token level features down to the last position that is not padding in any sample.
+        """
+        padding_mask = batch["padding_mask"]
+        max_seq_len = padding_mask.shape[1]
+        used_positions = torch.nonzero(padding_mask.any(dim=0))
+        seq_len = int(used_positions.max()) + 1 if len(used_positions) > 0 else max_seq_len
+        return {
+            key: tensor[:, :seq_len] if tensor.dim() > 1 and tensor.shape[1] == max_seq_len else tensor
+            for key, tensor in batch.items()
+        }
+
+    @staticmethod
+    def _restore_sample_order(preds: List[List[List[Any]]], sample_order: List[int]) -> List[List[List[Any]]]:
+        """
+        Reorder predictions of shape [n_batches][n_heads][n_samples] of samples that were fed to the model in
+        `sample_order` to the order of the dataset. They are returned as one batch.
+        """
+        if not preds:
+            return preds
+        preds_per_head = []
+        for head_idx in range(len(preds[0])):
+            head_preds = [sample_preds for batch_preds in preds for sample_preds in batch_preds[head_idx]]
+            ordered_preds = [None] * len(head_preds)
+            for position, sample_idx in enumerate(sample_order):
+                ordered_preds[sample_idx] = head_preds[position]
+            preds_per_head.append(ordered_preds)
+        return [preds_per_head]
+
     def extract_vectors(
         self, dicts: List[Dict], extraction_strategy: Optional[str] = "cls_token", extraction_layer: Optional[int] = -1
     ):
@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 import os
 from pathlib import Path
 from typing import List, Tuple, Optional, Union, Dict
@@ -419,21 +420,157 @@ class QuestionAnsweringHead(PredictionHead):
         Get the predicted index of start and end token of the answer. Note that the output is at token level
         and not word level. Note also that these logits correspond to the tokens of a sample
         (i.e. special tokens, question tokens, passage_tokens)
+
+        Instead of scoring all max_seq_len^2 spans, only the spans between the best start and end tokens are scored.
+        A span outside of them can't score higher than the best excluded start (or end) logit plus the best end (or
+        start) logit. If a candidate scores lower than that bound, the sample falls back to scoring all spans, so the
+        predictions are the same either way.
         """
+        # logits is of shape [batch_size, max_seq_len, 2]. The final dimension corresponds to [start, end]
+        start_logits, end_logits = logits.split(1, dim=-1)
+        start_logits = start_logits.squeeze(-1)
+        end_logits = end_logits.squeeze(-1)
+        batch_size, max_seq_len = start_logits.shape
+
+        # Positions that can be the start or end of an answer. The first token only forms the no_answer span (0, 0)
+        valid_positions = span_mask != 0
+        valid_positions[:, 0] = False
+        start_logits_valid = start_logits.masked_fill(~valid_positions, -math.inf)
+        end_logits_valid = end_logits.masked_fill(~valid_positions, -math.inf)
+
+        # Each accepted candidate blocks up to 2 * duplicate_filtering + 1 start and end tokens
+        n_top = 4 * self.n_best_per_sample * (2 * max(self.duplicate_filtering, 0) + 1)
+        n_top = min(max_seq_len, max(20, n_top))
+        top_start_logits, top_starts = start_logits_valid.topk(min(n_top + 1, max_seq_len), dim=1)
+        top_end_logits, top_ends = end_logits_valid.topk(min(n_top + 1, max_seq_len), dim=1)
+        if n_top < max_seq_len:
+            bounds = torch.maximum(
+                top_start_logits[:, n_top] + top_end_logits[:, 0], top_start_logits[:, 0] + top_end_logits[:, n_top]
+            )
+        else:
+            bounds = torch.full((batch_size,), -math.inf, device=start_logits.device)
+        top_start_logits, top_starts = top_start_logits[:, :n_top], top_starts[:, :n_top]
+        top_end_logits, top_ends = top_end_logits[:, :n_top], top_ends[:, :n_top]
+
+        # Score all pairs of the top start and end tokens, disqualifying answers where end < start
+        # or where the answer span is greater than max_answer_length
+        pair_scores = top_start_logits.unsqueeze(2) + top_end_logits.unsqueeze(1)
+        span_lengths = top_ends.unsqueeze(1) - top_starts.unsqueeze(2)
+        invalid_pairs = (span_lengths < 0) | (span_lengths >= max_answer_length)
+        pair_scores = pair_scores.masked_fill(invalid_pairs, -math.inf)
+
+        sorted_scores, sorted_pairs = pair_scores.view(batch_size, -1).sort(dim=1, descending=True)
+        sorted_starts = top_starts.gather(1, torch.div(sorted_pairs, n_top, rounding_mode="floor"))
+        sorted_ends = top_ends.gather(1, sorted_pairs % n_top)
+
+        # The no_answer span (0, 0) is disqualified like any other span if it's masked or too long
+        no_answer_scores = start_logits[:, 0] + end_logits[:, 0]
+        if max_answer_length <= 0:
+            no_answer_scores = torch.full_like(no_answer_scores, -777)
+        no_answer_scores = no_answer_scores.masked_fill(span_mask[:, 0] == 0, -999)
+
+        start_probs = torch.softmax(start_logits, dim=-1)
+        end_probs = torch.softmax(end_logits, dim=-1)
 
         # Will be populated with the top-n predictions of each sample in the batch
         # shape = batch_size x ~top_n
         # Note that ~top_n = n   if no_answer is     within the top_n predictions
         #           ~top_n = n+1 if no_answer is not within the top_n predictions
         all_top_n = []
+        for sample_idx, (starts, ends, scores, bound) in enumerate(
+            zip(sorted_starts.tolist(), sorted_ends.tolist(), sorted_scores.tolist(), bounds.tolist())
+        ):
+            sample_start_probs = start_probs[sample_idx]
+            sample_end_probs = end_probs[sample_idx]
+            sample_top_n = self._select_top_candidates(
+                starts, ends, scores, bound, sample_start_probs, sample_end_probs, sample_idx
+            )
+            if sample_top_n is None:
+                sample_top_n = self._get_top_candidates_of_all_spans(
+                    logits[sample_idx : sample_idx + 1],
+                    span_mask[sample_idx : sample_idx + 1],
+                    max_answer_length=max_answer_length,
+                    sample_idx=sample_idx,
+                )
+            else:
+                no_answer_confidence = (sample_start_probs[0].item() + sample_end_probs[0].item()) / 2
+                sample_top_n.append(
+                    QACandidate(
+                        offset_answer_start=0,
+                        offset_answer_end=0,
+                        score=no_answer_scores[sample_idx].item(),
+                        answer_type="no_answer",
+                        offset_unit="token",
+                        aggregation_level="passage",
+                        passage_id=None,
+                        confidence=no_answer_confidence,
+                    )
+                )
+            all_top_n.append(sample_top_n)
 
-        # logits is of shape [batch_size, max_seq_len, 2]. The final dimension corresponds to [start, end]
+        return all_top_n
+
+    def _select_top_candidates(
+        self,
+        starts: List[int],
+        ends: List[int],
+        scores: List[float],
+        bound: float,
+        start_probs: torch.Tensor,
+        end_probs: torch.Tensor,
+        sample_idx: int,
+    ) -> Optional[List[QACandidate]]:
+        """
+        Pick the n_best_per_sample positive candidates of a sample from spans sorted by score, filtering duplicates.
+        Returns None if spans that were not scored might be better than the picked ones.
+        """
+        top_candidates: List[QACandidate] = []
+        start_idx_candidates = set()
+        end_idx_candidates = set()
+        for start_idx, end_idx, score in zip(starts, ends, scores):
+            if len(top_candidates) == self.n_best_per_sample:
+                break
+            if score == -math.inf or score < bound:
+                return None
+            if self.duplicate_filtering > -1 and (start_idx in start_idx_candidates or end_idx in end_idx_candidates):
+                continue
+            confidence = (start_probs[start_idx].item() + end_probs[end_idx].item()) / 2
+            top_candidates.append(
+                QACandidate(
+                    offset_answer_start=start_idx,
+                    offset_answer_end=end_idx,
+                    score=score,
+                    answer_type="span",
+                    offset_unit="token",
+                    aggregation_level="passage",
+                    passage_id=str(sample_idx),
+                    confidence=confidence,
+                )
+            )
+            if self.duplicate_filtering > -1:
+                for i in range(0, self.duplicate_filtering + 1):
+                    start_idx_candidates.add(start_idx + i)
+                    start_idx_candidates.add(start_idx - i)
+                    end_idx_candidates.add(end_idx + i)
+                    end_idx_candidates.add(end_idx - i)
+        if len(top_candidates) < self.n_best_per_sample:
+            return None
+        return top_candidates
+
+    def _get_top_candidates_of_all_spans(
+        self, logits: torch.Tensor, span_mask: torch.Tensor, max_answer_length: int, sample_idx: int
+    ) -> List[QACandidate]:
+        """
+        Get the top candidates of a single sample by scoring all max_seq_len^2 spans. Used by `logits_to_preds()` if
+        the spans between the best start and end tokens are not enough to find the top candidates, e.g. for passages
+        with fewer valid spans than n_best_per_sample.
+        """
+        # logits is of shape [1, max_seq_len, 2]. The final dimension corresponds to [start, end]
         start_logits, end_logits = logits.split(1, dim=-1)
         start_logits = start_logits.squeeze(-1)
         end_logits = end_logits.squeeze(-1)
 
         # Calculate a few useful variables
-        batch_size = start_logits.size()[0]
         max_seq_len = start_logits.shape[1]  # target dim
 
         # get scores for all combinations of start and end logits => candidate answers
@@ -468,29 +605,19 @@ class QuestionAnsweringHead(PredictionHead):
         start_end_matrix[invalid_indices[0][:], invalid_indices[1][:], invalid_indices[2][:]] = -999
 
         # Sort the candidate answers by their score. Sorting happens on the flattened matrix.
-        # flat_sorted_indices.shape: (batch_size, max_seq_len^2, 1)
-        flat_scores = start_end_matrix.view(batch_size, -1)
-        flat_sorted_indices_2d = flat_scores.sort(descending=True)[1]
-        flat_sorted_indices = flat_sorted_indices_2d.unsqueeze(2)
+        # flat_sorted_indices.shape: (max_seq_len^2, 1)
+        flat_scores = start_end_matrix[0].view(-1)
+        flat_sorted_indices = flat_scores.sort(descending=True)[1].unsqueeze(1)
 
         # The returned indices are then converted back to the original dimensionality of the matrix.
-        # sorted_candidates.shape : (batch_size, max_seq_len^2, 2)
+        # sorted_candidates.shape : (max_seq_len^2, 2)
         start_indices = flat_sorted_indices // max_seq_len
         end_indices = flat_sorted_indices % max_seq_len
-        sorted_candidates = torch.cat((start_indices, end_indices), dim=2)
-
-        # Get the n_best candidate answers for each sample
-        for sample_idx in range(batch_size):
-            sample_top_n = self.get_top_candidates(
-                sorted_candidates[sample_idx],
-                start_end_matrix[sample_idx],
-                sample_idx,
-                start_matrix=start_matrix[sample_idx],
-                end_matrix=end_matrix[sample_idx],
-            )
-            all_top_n.append(sample_top_n)
+        sorted_candidates = torch.cat((start_indices, end_indices), dim=1)
 
-        return all_top_n
+        return self.get_top_candidates(
+            sorted_candidates, start_end_matrix[0], sample_idx, start_matrix=start_matrix[0], end_matrix=end_matrix[0]
+        )
 
     def get_top_candidates(self, sorted_candidates, start_end_matrix, sample_idx: int, start_matrix, end_matrix):
         """
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Optional, Dict, FrozenSet, List, Tuple
 
 from copy import deepcopy
 from abc import ABC, abstractmethod
@@ -8,7 +8,7 @@ import inspect
 import logging
 
 from haystack.schema import Document, MultiLabel
-from haystack.errors import PipelineSchemaError
+from haystack.errors import PipelineError, PipelineSchemaError
 from haystack.telemetry import send_custom_event
 
 
@@ -57,6 +57,9 @@ class BaseComponent(ABC):
     outgoing_edges: int
     _subclasses: dict = {}
     _component_config: dict = {}
+    _run_signature_args: Dict[Tuple[type, str], FrozenSet[str]] = {}
+    # Names of the inputs that run() modifies in place. They are copied even if the Pipeline passes inputs by reference.
+    copied_inputs: Tuple[str, ...] = ()
 
     def __init__(self):
         # a small subset of the component's parameters is sent in an event after applying filters defined in haystack.telemetry.NonPrivateParameters
@@ -171,21 +174,94 @@ class BaseComponent(ABC):
         """
         pass
 
-    def _dispatch_run(self, **kwargs) -> Tuple[Dict, str]:
+    def _dispatch_run(self, pass_by_reference: bool = False, **kwargs) -> Tuple[Dict, str]:
         """
         The Pipelines call this method which in turn executes the run() method of Component.
 
         It takes care of the following:
           - inspect run() signature to validate if all necessary arguments are available
+          - deep-copy the inputs or, if `pass_by_reference` is set, only the `copied_inputs` of this node
           - pop `debug` and sets them on the instance to control debug output
           - call run() with the corresponding arguments and gather output
           - collate `_debug` information if present
           - merge component output with the preceding output and pass it on to the subsequent Component in the Pipeline
         """
-        arguments = deepcopy(kwargs)
-        params = arguments.get("params") or {}
+        return self._dispatch_run_general("run", pass_by_reference=pass_by_reference, **kwargs)
 
-        run_signature_args = inspect.signature(self.run).parameters.keys()
+    def _dispatch_run_batch(self, pass_by_reference: bool = False, **kwargs) -> Tuple[Dict, str]:
+        """
+        Pipeline.run_batch() calls this method which in turn executes the run_batch() method of Component.
+
+        In batch mode, the inputs and outputs of a node are lists with one entry per query in `queries`. Only `queries`,
+        `params`, `root_node`, `node_id` and `_debug` are shared by the whole batch.
+        Components that do not implement run_batch() are run once per query.
+        """
+        if callable(getattr(self, "run_batch", None)):
+            return self._dispatch_run_general("run_batch", pass_by_reference=pass_by_reference, **kwargs)
+
+        queries = kwargs["queries"]
+        outputs = []
+        streams = set()
+        debug_infos = []
+        for idx, query in enumerate(queries):
+            query_kwargs = self._get_query_from_batch(kwargs, idx)
+            query_kwargs["query"] = query
+            output, stream = self._dispatch_run_general("run", pass_by_reference=pass_by_reference, **query_kwargs)
+            debug_infos.append(output.pop("_debug", {}).get(self.name))
+            outputs.append(output)
+            streams.add(stream)
+        if len(streams) > 1:
+            raise PipelineError(
+                f"The node '{self.name}' routed the queries of one batch to different outputs ({', '.join(streams)}). "
+                f"Use Pipeline.run() for each query instead."
+            )
+
+        batch_output: Dict[str, Any] = {
+            key: value for key, value in kwargs.items() if key in ("root_node", "node_id", "params", "_debug")
+        }
+        for output in outputs:
+            for key in output.keys():
+                if key not in ("query", "root_node", "node_id", "params") and key not in batch_output:
+                    batch_output[key] = [query_output.get(key) for query_output in outputs]
+        if outputs:
+            batch_output["params"] = outputs[-1]["params"]
+        if any(debug_infos):
+            batch_output["_debug"] = {**kwargs.get("_debug", {}), self.name: debug_infos}
+        batch_output["queries"] = queries
+        return batch_output, streams.pop() if streams else "output_1"
+
+    @staticmethod
+    def _get_query_from_batch(batch: Dict[str, Any], idx: int) -> Dict[str, Any]:
+        """
+        Select the inputs of the query at position `idx` from the inputs of a batch.
+        """
+        query_input: Dict[str, Any] = {}
+        for key, value in batch.items():
+            if key in ("queries", "_debug"):
+                continue
+            if key in ("root_node", "node_id", "params"):
+                query_input[key] = value
+            elif key == "inputs":  # inputs of a join node, each of them is a batch
+                query_input[key] = [BaseComponent._get_query_from_batch(batch_input, idx) for batch_input in value]
+            else:
+                query_input[key] = value[idx] if value is not None else None
+        return query_input
+
+    def _dispatch_run_general(self, method_name: str, pass_by_reference: bool = False, **kwargs) -> Tuple[Dict, str]:
+        if pass_by_reference:
+            arguments = dict(kwargs)
+            for key in self.copied_inputs:
+                if key in arguments:
+                    arguments[key] = deepcopy(arguments[key])
+            # only the params targeted at this node are modified below (`debug` is popped from them)
+            params = dict(arguments.get("params") or {})
+            if isinstance(params.get(self.name), dict):
+                params[self.name] = dict(params[self.name])
+        else:
+            arguments = deepcopy(kwargs)
+            params = arguments.get("params") or {}
+
+        run_signature_args = self._get_run_signature_args(method_name)
 
         run_params: Dict[str, Any] = {}
         for key, value in params.items():
@@ -209,7 +285,7 @@ class BaseComponent(ABC):
             if key in run_signature_args:
                 run_inputs[key] = value
 
-        output, stream = self.run(**run_inputs, **run_params)
+        output, stream = getattr(self, method_name)(**run_inputs, **run_params)
 
         # Collect debug information
         debug_info = {}
@@ -228,7 +304,7 @@ class BaseComponent(ABC):
             debug_info["runtime"] = custom_debug
 
         # append _debug information from nodes
-        all_debug = arguments.get("_debug", {})
+        all_debug = dict(arguments.get("_debug", {}))
         if debug_info:
             all_debug[self.name] = debug_info
         if all_debug:
@@ -242,6 +318,19 @@ class BaseComponent(ABC):
         output["params"] = params
         return output, stream
 
+    def _get_run_signature_args(self, method_name: str = "run") -> FrozenSet[str]:
+        """
+        Return the names of the arguments of run() or run_batch(). They are inspected once per class and cached.
+        """
+        if method_name in self.__dict__:  # the method was replaced on the instance
+            return frozenset(inspect.signature(getattr(self, method_name)).parameters.keys())
+        cache_key = (type(self), method_name)
+        run_signature_args = BaseComponent._run_signature_args.get(cache_key)
+        if run_signature_args is None:
+            run_signature_args = frozenset(inspect.signature(getattr(self, method_name)).parameters.keys())
+            BaseComponent._run_signature_args[cache_key] = run_signature_args
+        return run_signature_args
+
     @classmethod
     def _get_signature(cls) -> Dict[str, inspect.Parameter]:
         component_classes = inspect.getmro(cls)
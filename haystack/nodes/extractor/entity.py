@@ -1,4 +1,5 @@
-from typing import List, Union, Dict, Optional, Tuple
+import logging
+from typing import Any, List, Union, Dict, Optional, Tuple
 
 from transformers import AutoTokenizer, AutoModelForTokenClassification
 from transformers import pipeline
@@ -8,6 +9,9 @@ from haystack.nodes.base import BaseComponent
 from haystack.modeling.utils import initialize_device_settings
 
 
+logger = logging.getLogger(__name__)
+
+
 class EntityExtractor(BaseComponent):
     """
     This node is used to extract entities out of documents.
@@ -19,8 +23,27 @@ class EntityExtractor(BaseComponent):
     """
 
     outgoing_edges = 1
+    copied_inputs = ("documents",)
 
-    def __init__(self, model_name_or_path: str = "dslim/bert-base-NER", use_gpu: bool = True):
+    def __init__(
+        self,
+        model_name_or_path: str = "dslim/bert-base-NER",
+        use_gpu: bool = True,
+        batch_size: int = 16,
+        max_seq_len: Optional[int] = None,
+        doc_stride: int = 64,
+    ):
+        """
+        :param model_name_or_path: Directory of a saved model or the name of a public model e.g. "dslim/bert-base-NER".
+                                   See https://huggingface.co/models for full list of available models.
+        :param use_gpu: Whether to use GPU or the CPU. Falls back on CPU if no GPU is available.
+        :param batch_size: Number of texts (or windows of long texts) the model processes in one batch.
+        :param max_seq_len: Max sequence length of one input text for the model. Longer texts are split into
+                            overlapping windows instead of being truncated. Defaults to the maximum length the model
+                            supports.
+        :param doc_stride: Number of tokens by which consecutive windows of a long text overlap. Entities found in
+                           an overlap are only kept from the window in which they are further from the window's edge.
+        """
         super().__init__()
 
         self.devices, _ = initialize_device_settings(use_cuda=use_gpu, multi_gpu=False)
@@ -35,19 +58,36 @@ class EntityExtractor(BaseComponent):
             aggregation_strategy="simple",
             device=0 if self.devices[0].type == "cuda" else -1,
         )
+        self.batch_size = batch_size
+        if max_seq_len is None:
+            max_seq_len = min(tokenizer.model_max_length, token_classifier.config.max_position_embeddings)
+        # Leave room for the special tokens the pipeline adds to each window
+        self.max_window_len = max_seq_len - tokenizer.num_special_tokens_to_add()
+        if doc_stride >= self.max_window_len:
+            raise ValueError(
+                f"doc_stride ({doc_stride}) must be smaller than the number of tokens per window "
+                f"({self.max_window_len}) with max_seq_len={max_seq_len}."
+            )
+        self.doc_stride = doc_stride
+        if not tokenizer.is_fast:
+            logger.warning(
+                f"EntityExtractor needs a fast tokenizer to split long texts into windows, but '{model_name_or_path}' "
+                f"has none. Texts longer than {max_seq_len} tokens will be truncated."
+            )
 
     def run(self, documents: Optional[Union[List[Document], List[dict]]] = None) -> Tuple[Dict, str]:  # type: ignore
         """
         This is the method called when this node is used in a pipeline
         """
         if documents:
-            for doc in documents:
-                # In a querying pipeline, doc is a haystack.schema.Document object
-                try:
-                    doc.meta["entities"] = self.extract(doc.content)  # type: ignore
-                # In an indexing pipeline, doc is a dictionary
-                except AttributeError:
-                    doc["meta"]["entities"] = self.extract(doc["content"])  # type: ignore
+            # In a querying pipeline, a document is a haystack.schema.Document object
+            # In an indexing pipeline, a document is a dictionary
+            texts = [doc["content"] if isinstance(doc, dict) else doc.content for doc in documents]
+            for doc, entities in zip(documents, self.extract_batch(texts)):
+                if isinstance(doc, dict):
+                    doc["meta"]["entities"] = entities
+                else:
+                    doc.meta["entities"] = entities
         output = {"documents": documents}
         return output, "output_1"
 
@@ -55,8 +95,114 @@ class EntityExtractor(BaseComponent):
         """
         This function can be called to perform entity extraction when using the node in isolation.
         """
-        entities = self.model(text)
-        return entities
+        return self.extract_batch([text])[0]
+
+    def extract_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        This function can be called to perform entity extraction on many texts when using the node in isolation.
+        Texts longer than `max_seq_len` are split into overlapping windows. The windows of all texts are fed to the
+        model in batches and the entities' offsets are mapped back to the full texts.
+
+        :param texts: Texts to extract entities from.
+        :param batch_size: Number of texts (or windows of long texts) the model processes in one batch.
+        :return: List of extracted entities per text.
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+
+        window_texts: List[str] = []
+        window_spans: List[List[Tuple[int, int]]] = []  # character spans of the windows of each text
+        for text in texts:
+            spans = self._get_window_spans(text)
+            window_spans.append(spans)
+            if len(spans) == 1:
+                window_texts.append(text)
+            else:
+                window_texts.extend(text[start:end] for start, end in spans)
+
+        if len(window_texts) == 1:
+            # A single text is passed as a string, for which the pipeline returns a flat list of entities
+            entities_per_window = [self.model(window_texts[0])]
+        else:
+            # For a list of texts, the pipeline returns a list of entities per text
+            entities_per_window = self.model(window_texts, batch_size=batch_size) if window_texts else []
+
+        entities_per_text = []
+        window_idx = 0
+        for spans in window_spans:
+            entities_per_text.append(
+                self._merge_window_entities(spans, entities_per_window[window_idx : window_idx + len(spans)])
+            )
+            window_idx += len(spans)
+        return entities_per_text
+
+    def _get_window_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split the text into windows of at most `max_window_len` tokens that overlap by `doc_stride` tokens and
+        don't cut through words. Returns the character spans of the windows.
+        """
+        if not self.model.tokenizer.is_fast:
+            return [(0, len(text))]
+
+        encoding = self.model.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        offsets = encoding["offset_mapping"]
+        n_tokens = len(offsets)
+        if n_tokens <= self.max_window_len:
+            return [(0, len(text))]
+
+        word_ids = encoding.word_ids()
+        spans = []
+        start = 0
+        while True:
+            end = min(start + self.max_window_len, n_tokens)
+            if end < n_tokens:
+                # Don't split a word between two windows
+                while end > start + 1 and word_ids[end] == word_ids[end - 1]:
+                    end -= 1
+            spans.append((offsets[start][0], offsets[end - 1][1]))
+            if end == n_tokens:
+                break
+            next_start = max(end - self.doc_stride, start + 1)
+            while next_start < end and word_ids[next_start] == word_ids[next_start - 1]:
+                next_start += 1
+            start = next_start
+        return spans
+
+    @staticmethod
+    def _merge_window_entities(
+        spans: List[Tuple[int, int]], entities_per_window: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Map the entities' offsets from the windows to the text. Where windows overlap, an entity is kept from the
+        window that covers its start in the first half of the overlap and from the next window otherwise, so that
+        entities found in both windows are not duplicated. An entity that reaches the end of its window might be cut
+        off, so it's taken from the next window if that one finds an entity with the same start.
+        """
+        if len(spans) == 1:
+            return entities_per_window[0]
+
+        merged_entities = []
+        cut_off_entity: Optional[Dict[str, Any]] = None
+        for window_idx, ((window_start, window_end), window_entities) in enumerate(zip(spans, entities_per_window)):
+            is_last_window = window_idx == len(spans) - 1
+            lower_bound = 0 if window_idx == 0 else (window_start + spans[window_idx - 1][1]) / 2
+            upper_bound = float("inf") if is_last_window else (spans[window_idx + 1][0] + window_end) / 2
+            next_cut_off_entity = None
+            for entity in window_entities:
+                entity = {**entity, "start": entity["start"] + window_start, "end": entity["end"] + window_start}
+                if cut_off_entity is not None and entity["start"] == cut_off_entity["start"]:
+                    cut_off_entity = None
+                elif not lower_bound <= entity["start"] < upper_bound:
+                    continue
+                elif entity["end"] == window_end and not is_last_window:
+                    next_cut_off_entity = entity
+                    continue
+                merged_entities.append(entity)
+            if cut_off_entity is not None:
+                merged_entities.append(cut_off_entity)
+            cut_off_entity = next_cut_off_entity
+
+        return sorted(merged_entities, key=lambda entity: entity["start"])
 
 
 def simplify_ner_for_qa(output):
@@ -12,6 +12,7 @@ class Docs2Answers(BaseComponent):
     """
 
     outgoing_edges = 1
+    copied_inputs = ("documents",)
 
     def run(self, query: str, documents: List[Document]):  # type: ignore
         # conversion from Document -> Answer
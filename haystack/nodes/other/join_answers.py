@@ -9,6 +9,8 @@ class JoinAnswers(BaseComponent):
     A node to join `Answer`s produced by multiple `Reader` nodes.
     """
 
+    copied_inputs = ("inputs",)
+
     def __init__(
         self, join_mode: str = "concatenate", weights: Optional[List[float]] = None, top_k_join: Optional[int] = None
     ):
@@ -17,6 +17,7 @@ class JoinDocuments(BaseComponent):
     """
 
     outgoing_edges = 1
+    copied_inputs = ("inputs",)
 
     def __init__(
         self, join_mode: str = "concatenate", weights: Optional[List[float]] = None, top_k_join: Optional[int] = None
@@ -1,4 +1,5 @@
-from typing import List
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from transformers import AutoModelForSeq2SeqLM
 from transformers import AutoTokenizer
@@ -35,6 +36,7 @@ class QuestionGenerator(BaseComponent):
         split_overlap=10,
         use_gpu=True,
         prompt="generate questions:",
+        batch_size: int = 16,
     ):
         """
         Uses the valhalla/t5-base-e2e-qg model by default. This class supports any question generation model that is
@@ -46,6 +48,8 @@ class QuestionGenerator(BaseComponent):
                                    See https://huggingface.co/models for full list of available models.
         :param model_version: The version of model to use from the HuggingFace model hub. Can be tag name, branch name, or commit hash.
         :param use_gpu: Whether to use GPU or the CPU. Falls back on CPU if no GPU is available.
+        :param batch_size: Number of text splits the model generates questions for in one batch. Splits of similar
+                           length are batched together, also across documents.
         """
         super().__init__()
         self.devices, _ = initialize_device_settings(use_cuda=use_gpu, multi_gpu=False)
@@ -61,17 +65,69 @@ class QuestionGenerator(BaseComponent):
         self.split_overlap = split_overlap
         self.preprocessor = PreProcessor()
         self.prompt = prompt
+        self.batch_size = batch_size
 
     def run(self, documents: List[Document]):  # type: ignore
-        generated_questions = []
-        for d in documents:
-            questions = self.generate(d.content)
-            curr_dict = {"document_id": d.id, "document_sample": d.content[:200], "questions": questions}
-            generated_questions.append(curr_dict)
+        generated_questions = list(self.stream_questions(documents))
         output = {"generated_questions": generated_questions, "documents": documents}
         return output, "output_1"
 
-    def generate(self, text):
+    def stream_questions(
+        self, documents: Iterable[Document], batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, object]]:
+        """
+        Generate questions for a stream of documents, e.g. a large corpus read lazily from a DocumentStore.
+        Only the splits of a few consecutive documents are held in memory at a time. The results are yielded
+        in the order of the documents, one dictionary per document as in the output of `run()`.
+
+        :param documents: Documents to generate questions for.
+        :param batch_size: Number of text splits the model generates questions for in one batch.
+        """
+        buffered_documents: Deque[Document] = deque()
+
+        def texts():
+            for document in documents:
+                buffered_documents.append(document)
+                yield document.content
+
+        for questions in self._generate_in_batches(texts(), batch_size=batch_size):
+            document = buffered_documents.popleft()
+            yield {"document_id": document.id, "document_sample": document.content[:200], "questions": questions}
+
+    def generate(self, text: str) -> List[str]:
+        return self.generate_batch([text])[0]
+
+    def generate_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[str]]:
+        """
+        Generate questions for each of the texts. The splits of all texts are fed to the model in batches of
+        splits with a similar length.
+
+        :param texts: Texts to generate questions for.
+        :param batch_size: Number of text splits the model generates questions for in one batch.
+        :return: List of generated questions per text.
+        """
+        return list(self._generate_in_batches(texts, batch_size=batch_size))
+
+    def _generate_in_batches(self, texts: Iterable[str], batch_size: Optional[int] = None) -> Iterator[List[str]]:
+        if batch_size is None:
+            batch_size = self.batch_size
+        # Splits of consecutive texts are gathered until they fill a few batches, so that they can be
+        # sorted by length without holding all splits of a large corpus in memory.
+        max_pending_splits = batch_size * 10
+
+        pending_splits: List[Tuple[int, str]] = []  # (index of text in window, split text)
+        n_pending_texts = 0
+        for text in texts:
+            pending_splits.extend((n_pending_texts, split_text) for split_text in self._split(text))
+            n_pending_texts += 1
+            if len(pending_splits) >= max_pending_splits:
+                yield from self._generate_for_splits(pending_splits, n_pending_texts, batch_size)
+                pending_splits = []
+                n_pending_texts = 0
+        if n_pending_texts > 0:
+            yield from self._generate_for_splits(pending_splits, n_pending_texts, batch_size)
+
+    def _split(self, text: str) -> List[str]:
         # Performing splitting because T5 has a max input length
         # Also currently, it seems that it only generates about 3 questions for the beginning section of text
         split_texts_dict = self.preprocessor.split(
@@ -81,12 +137,23 @@ class QuestionGenerator(BaseComponent):
             split_overlap=self.split_overlap,
             split_length=self.split_length,
         )
-        split_texts = [x.content for x in split_texts_dict]
-        ret = []
-        for split_text in split_texts:
+        split_texts = []
+        for split in split_texts_dict:
+            split_text = split.content
             if self.prompt not in split_text:
                 split_text = self.prompt + " " + split_text
-            tokenized = self.tokenizer([split_text], return_tensors="pt")
+            split_texts.append(split_text)
+        return split_texts
+
+    def _generate_for_splits(self, splits: List[Tuple[int, str]], n_texts: int, batch_size: int) -> List[List[str]]:
+        questions_per_split: List[List[str]] = [[] for _ in splits]
+        # Sort splits by length so that each batch only needs little padding
+        sorted_split_indices = sorted(range(len(splits)), key=lambda idx: len(splits[idx][1]), reverse=True)
+        for i in range(0, len(sorted_split_indices), batch_size):
+            batch_indices = sorted_split_indices[i : i + batch_size]
+            tokenized = self.tokenizer(
+                [splits[split_idx][1] for split_idx in batch_indices], padding=True, return_tensors="pt"
+            )
             input_ids = tokenized["input_ids"].to(self.devices[0])
             attention_mask = tokenized["attention_mask"].to(
                 self.devices[0]
@@ -101,14 +168,17 @@ class QuestionGenerator(BaseComponent):
                 early_stopping=self.early_stopping,
             )
 
-            string_output = self.tokenizer.decode(tokens_output[0])
-            string_output = string_output.replace("<pad>", "").replace("</s>", "")
-            questions_string = string_output.split("<sep>")
-            questions = [x for x in questions_string if x]
+            for split_idx, output in zip(batch_indices, tokens_output):
+                string_output = self.tokenizer.decode(output)
+                string_output = string_output.replace("<pad>", "").replace("</s>", "")
+                questions_string = string_output.split("<sep>")
+                questions_per_split[split_idx] = [x for x in questions_string if x]
 
+        ret: List[List[str]] = [[] for _ in range(n_texts)]
+        for (text_idx, _), questions in zip(splits, questions_per_split):
             # Doing this instead of set to maintain order since the generated questions seem to have answers
             # that occur in order in the text
             for q in questions:
-                if q not in ret:
-                    ret.append(q)
+                if q not in ret[text_idx]:
+                    ret[text_idx].append(q)
         return ret
@@ -40,6 +40,32 @@ class BaseRanker(BaseComponent):
 
         return output, "output_1"
 
+    def run_batch(  # type: ignore
+        self, queries: List[str], documents: List[List[Document]], top_k: Optional[int] = None
+    ):
+        """
+        Rerank the documents of each query in a batch of queries.
+
+        :param queries: The queries
+        :param documents: One list of documents per query
+        :param top_k: The maximum number of documents to return per query
+        """
+        self.query_count += len(queries)
+        predict_batch = self.timing(self.predict_batch, "query_time")
+        try:
+            results = predict_batch(
+                query_doc_list=[{"query": query, "docs": docs} for query, docs in zip(queries, documents)], top_k=top_k
+            )
+            ranked_documents = [result["documents"] for result in results]
+        except NotImplementedError:
+            predict = self.timing(self.predict, "query_time")
+            ranked_documents = [
+                predict(query=query, documents=docs, top_k=top_k) if docs else []
+                for query, docs in zip(queries, documents)
+            ]
+
+        return {"documents": ranked_documents}, "output_1"
+
     def timing(self, fn, attr_name):
         """Wrapper method used to time functions."""
 
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Dict
 import logging
 from pathlib import Path
 
@@ -42,6 +42,7 @@ class SentenceTransformersRanker(BaseRanker):
         top_k: int = 10,
         use_gpu: bool = True,
         devices: Optional[List[Union[str, torch.device]]] = None,
+        batch_size: int = 16,
     ):
         """
         :param model_name_or_path: Directory of a saved model or the name of a public model e.g.
@@ -54,10 +55,13 @@ class SentenceTransformersRanker(BaseRanker):
                         The strings will be converted into pytorch devices, so use the string notation described here:
                         https://pytorch.org/docs/stable/tensor_attributes.html?highlight=torch%20device#torch.torch.device
                         (e.g. ["cuda:0"]).
+        :param batch_size: Number of query-document pairs the model scores at once. Pairs of similar length are
+                           batched together, so memory use is bounded by `batch_size` times the longest pair.
         """
         super().__init__()
 
         self.top_k = top_k
+        self.batch_size = batch_size
 
         if devices is not None:
             self.devices = [torch.device(device) for device in devices]
@@ -76,18 +80,36 @@ class SentenceTransformersRanker(BaseRanker):
         if len(self.devices) > 1:
             self.model = DataParallel(self.transformer_model, device_ids=self.devices)
 
-    def predict_batch(self, query_doc_list: List[dict], top_k: int = None, batch_size: int = None):
+    def predict_batch(
+        self, query_doc_list: List[dict], top_k: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> List[Dict]:
         """
         Use loaded Ranker model to, for a list of queries, rank each query's supplied list of Document.
+        The query-document pairs of all queries are scored together in batches.
 
         Returns list of dictionary of query and list of document sorted by (desc.) similarity with query
 
-        :param query_doc_list: List of dictionaries containing queries with their retrieved documents
+        :param query_doc_list: List of dictionaries containing a query (key `query`) with its retrieved documents
+                               (key `docs`)
         :param top_k: The maximum number of answers to return for each query
         :param batch_size: Number of samples the model receives in one batch for inference
-        :return: List of dictionaries containing query and ranked list of Document
+        :return: List of dictionaries containing query and ranked list of Document (key `documents`)
         """
-        raise NotImplementedError
+        if top_k is None:
+            top_k = self.top_k
+
+        queries = [query_docs["query"] for query_docs in query_doc_list]
+        documents = [query_docs["docs"] for query_docs in query_doc_list]
+        scores = self._get_scores(
+            queries=[query for query, docs in zip(queries, documents) for _ in docs],
+            documents=[doc for docs in documents for doc in docs],
+            batch_size=batch_size,
+        )
+
+        results = []
+        for query, docs, query_scores in zip(queries, documents, scores.split([len(docs) for docs in documents])):
+            results.append({"query": query, "documents": self._get_top_documents(docs, query_scores, top_k)})
+        return results
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> List[Document]:
         """
@@ -103,30 +125,49 @@ class SentenceTransformersRanker(BaseRanker):
         if top_k is None:
             top_k = self.top_k
 
-        features = self.transformer_tokenizer(
-            [query for doc in documents],
-            [doc.content for doc in documents],
-            padding=True,
-            truncation=True,
-            return_tensors="pt",
-        ).to(self.devices[0])
-
-        # SentenceTransformerRanker uses:
-        # 1. the logit as similarity score/answerable classification
-        # 2. the logits as answerable classification  (no_answer / has_answer)
-        # https://www.sbert.net/docs/pretrained-models/ce-msmarco.html#usage-with-transformers
-        with torch.no_grad():
-            similarity_scores = self.transformer_model(**features).logits
-
-        logits_dim = similarity_scores.shape[1]  # [batch_size, logits_dim]
-        sorted_scores_and_documents = sorted(
-            zip(similarity_scores, documents),
-            key=lambda similarity_document_tuple:
+        scores = self._get_scores(queries=[query for doc in documents], documents=documents)
+        return self._get_top_documents(documents, scores, top_k)
+
+    def _get_scores(
+        self, queries: List[str], documents: List[Document], batch_size: Optional[int] = None
+    ) -> torch.Tensor:
+        """
+        Score each query-document pair. The pairs are sorted by length and scored in batches, so each batch is only
+        padded to its longest pair.
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+
+        scores = torch.empty(len(documents))
+        lengths = [len(query) + len(doc.content) for query, doc in zip(queries, documents)]
+        sorted_pairs = sorted(range(len(lengths)), key=lambda pair_idx: lengths[pair_idx], reverse=True)
+
+        for i in range(0, len(sorted_pairs), batch_size):
+            batch_pairs = sorted_pairs[i : i + batch_size]
+            features = self.transformer_tokenizer(
+                [queries[pair_idx] for pair_idx in batch_pairs],
+                [documents[pair_idx].content for pair_idx in batch_pairs],
+                padding=True,
+                truncation=True,
+                return_tensors="pt",
+            ).to(self.devices[0])
+
+            # SentenceTransformerRanker uses:
+            # 1. the logit as similarity score/answerable classification
+            # 2. the logits as answerable classification  (no_answer / has_answer)
+            # https://www.sbert.net/docs/pretrained-models/ce-msmarco.html#usage-with-transformers
+            with torch.no_grad():
+                similarity_scores = self.transformer_model(**features).logits
+
             # assume the last element in logits represents the `has_answer` label
-            similarity_document_tuple[0][-1] if logits_dim >= 2 else similarity_document_tuple[0],
-            reverse=True,
-        )
+            scores[batch_pairs] = similarity_scores[:, -1].float().cpu()
 
-        # rank documents according to scores
-        sorted_documents = [doc for _, doc in sorted_scores_and_documents]
-        return sorted_documents[:top_k]
+        return scores
+
+    @staticmethod
+    def _get_top_documents(documents: List[Document], scores: torch.Tensor, top_k: int) -> List[Document]:
+        """
+        Rank documents according to their scores and return the top_k ones.
+        """
+        top_indices = torch.topk(scores, k=min(top_k, len(documents))).indices
+        return [documents[idx] for idx in top_indices.tolist()]
@@ -103,7 +103,52 @@ class BaseReader(BaseComponent):
 
         return results, "output_1"
 
-    def run_batch(self, query_doc_list: List[Dict], top_k: Optional[int] = None):
+    def run_batch(  # type: ignore
+        self,
+        query_doc_list: Optional[List[Dict]] = None,
+        top_k: Optional[int] = None,
+        queries: Optional[List[str]] = None,
+        documents: Optional[List[List[Document]]] = None,
+    ):
+        """
+        Find the answers for a batch of queries, each with its own list of documents.
+
+        In a Pipeline, `queries` and `documents` hold one entry per query and the answers are returned the same way.
+        All query-document pairs go to the model in one call of `predict_batch()` if the Reader implements it.
+
+        :param query_doc_list: Deprecated format of the input, a list of dictionaries with keys `queries` (a single
+                               query) and `docs`. If given, a dictionary with the `results` per query is returned.
+        :param top_k: The maximum number of answers to return per query
+        :param queries: The queries
+        :param documents: One list of documents per query
+        """
+        if query_doc_list is not None:
+            return self._run_query_doc_list(query_doc_list=query_doc_list, top_k=top_k)
+
+        queries = queries or []
+        documents = documents or [[] for _ in queries]
+        self.query_count += len(queries)
+        predict_batch = self.timing(self.predict_batch, "query_time")
+        try:
+            results = predict_batch(
+                query_doc_list=[{"question": query, "docs": docs} for query, docs in zip(queries, documents)],
+                top_k=top_k,
+            )
+        except NotImplementedError:
+            predict = self.timing(self.predict, "query_time")
+            results = [
+                predict(query=query, documents=docs, top_k=top_k) if docs else {"answers": []}
+                for query, docs in zip(queries, documents)
+            ]
+
+        # Add corresponding document_name and more meta data, if an answer contains the document_id
+        answers = [
+            [BaseReader.add_doc_meta_data_to_answer(documents=docs, answer=answer) for answer in result["answers"]]
+            for result, docs in zip(results, documents)
+        ]
+        return {"answers": answers}, "output_1"
+
+    def _run_query_doc_list(self, query_doc_list: List[Dict], top_k: Optional[int] = None):
         """A unoptimized implementation of running Reader queries in batch"""
         self.query_count += len(query_doc_list)
         results = []
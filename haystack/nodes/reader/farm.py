@@ -62,6 +62,7 @@ class FARMReader(BaseReader):
         local_files_only=False,
         force_download=False,
         use_auth_token: Optional[Union[str, bool]] = None,
+        bucket_by_length: bool = False,
         **kwargs,
     ):
 
@@ -117,6 +118,9 @@ class FARMReader(BaseReader):
         :param use_auth_token:  API token used to download private models from Huggingface. If this parameter is set to `True`,
                                 the local token will be used, which must be previously created via `transformer-cli login`.
                                 Additional information can be found here https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
+        :param bucket_by_length: Whether to batch passages of similar token length together and cut the padding of each
+                                 batch down to its longest passage. This speeds up inference on short documents a lot,
+                                 but changes confidence scores slightly as they are computed over the padding, too.
         """
         super().__init__()
 
@@ -140,6 +144,7 @@ class FARMReader(BaseReader):
             force_download=force_download,
             devices=self.devices,
             use_auth_token=use_auth_token,
+            bucket_by_length=bucket_by_length,
             **kwargs,
         )
         self.inferencer.model.prediction_heads[0].context_window_size = context_window_size
@@ -700,7 +705,8 @@ class FARMReader(BaseReader):
 
         Returns list of dictionaries containing answers sorted by (desc.) score
 
-        :param query_doc_list: List of dictionaries containing queries with their retrieved documents
+        :param query_doc_list: List of dictionaries containing queries with their retrieved documents. The query under
+                               the key `question` can be a string or a label with a `query` attribute.
         :param top_k: The maximum number of answers to return for each query
         :param batch_size: Number of samples the model receives in one batch for inference
         :return: List of dictionaries containing query and answers
@@ -712,23 +718,29 @@ class FARMReader(BaseReader):
         inputs = []
         number_of_docs = []
         labels = []
+        query_texts = []
 
         # build input objects for inference_from_objects
         for query_with_docs in query_doc_list:
             documents = query_with_docs["docs"]
             query = query_with_docs["question"]
+            query_text = query if isinstance(query, str) else query.query
             labels.append(query)
+            query_texts.append(query_text)
             number_of_docs.append(len(documents))
 
             for doc in documents:
-                cur = QAInput(doc_text=doc.content, questions=Question(text=query.query, uid=doc.id))
+                cur = QAInput(doc_text=doc.content, questions=Question(text=query_text, uid=doc.id))
                 inputs.append(cur)
 
-        self.inferencer.batch_size = batch_size
+        if batch_size is not None:
+            self.inferencer.batch_size = batch_size
         # make predictions on all document-query pairs
-        predictions = self.inferencer.inference_from_objects(
-            objects=inputs, return_json=False, multiprocessing_chunksize=10
-        )
+        predictions = []
+        if inputs:
+            predictions = self.inferencer.inference_from_objects(
+                objects=inputs, return_json=False, multiprocessing_chunksize=10
+            )
 
         # group predictions together
         grouped_predictions = []
@@ -741,6 +753,9 @@ class FARMReader(BaseReader):
 
         result = []
         for idx, group in enumerate(grouped_predictions):
+            if not group:  # no documents for this query
+                result.append({"query": query_texts[idx], "no_ans_gap": 0.0, "answers": [], "label": labels[idx]})
+                continue
             answers, max_no_ans_gap = self._extract_answers_of_predictions(group, top_k)
             query = group[0].query
             cur_label = labels[idx]
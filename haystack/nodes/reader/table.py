@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union
 
 import logging
 from statistics import mean
@@ -17,7 +17,7 @@ from transformers import (
 )
 from transformers.models.tapas.modeling_tapas import TapasPreTrainedModel
 
-from haystack.schema import Document, Answer, Span
+from haystack.schema import Document, Answer, Span, Label
 from haystack.nodes.reader.base import BaseReader
 from haystack.modeling.utils import initialize_device_settings
 
@@ -25,6 +25,39 @@ from haystack.modeling.utils import initialize_device_settings
 logger = logging.getLogger(__name__)
 
 
+def _get_query_text(query: Union[str, Label]) -> str:
+    return query if isinstance(query, str) else query.query
+
+
+def _get_tables(documents: List[Document], reader_name: str) -> List[Document]:
+    """
+    Select the documents a table reader can process: tables with at least one row.
+    """
+    tables = []
+    for document in documents:
+        if document.content_type != "table":
+            logger.warning(f"Skipping document with id '{document.id}' in {reader_name} as it is not of type table.")
+            continue
+
+        table: pd.DataFrame = document.content
+        if table.shape[0] == 0:
+            logger.warning(
+                f"Skipping document with id '{document.id}' in {reader_name} as it does not contain any rows."
+            )
+            continue
+        tables.append(document)
+    return tables
+
+
+def _get_batches_sorted_by_length(lengths: List[int], batch_size: int) -> List[List[int]]:
+    """
+    Split the indices of the inputs into batches, from the longest to the shortest inputs, so that each batch only
+    needs padding up to inputs of a similar length.
+    """
+    sorted_indices = sorted(range(len(lengths)), key=lambda idx: lengths[idx], reverse=True)
+    return [sorted_indices[i : i + batch_size] for i in range(0, len(sorted_indices), batch_size)]
+
+
 class TableReader(BaseReader):
     """
     Transformer-based model for extractive Question Answering on Tables with TaPas
@@ -62,6 +95,7 @@ class TableReader(BaseReader):
         top_k_per_candidate: int = 3,
         return_no_answer: bool = False,
         max_seq_len: int = 256,
+        batch_size: int = 16,
     ):
         """
         Load a TableQA model from Transformers.
@@ -94,6 +128,8 @@ class TableReader(BaseReader):
         :param max_seq_len: Max sequence length of one input table for the model. If the number of tokens of
                             query + table exceed max_seq_len, the table will be truncated by removing rows until the
                             input size fits the model.
+        :param batch_size: Number of query-table pairs the model receives in one batch for inference. Pairs with a
+                           similar number of tokens are batched together.
         """
         super().__init__()
 
@@ -114,6 +150,7 @@ class TableReader(BaseReader):
         self.top_k_per_candidate = top_k_per_candidate
         self.max_seq_len = max_seq_len
         self.return_no_answer = return_no_answer
+        self.batch_size = batch_size
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> Dict:
         """
@@ -130,121 +167,152 @@ class TableReader(BaseReader):
         :param top_k: The maximum number of answers to return
         :return: Dict containing query and answers
         """
-        if top_k is None:
-            top_k = self.top_k
-
-        answers = []
-        no_answer_score = 1.0
-        for document in documents:
-            if document.content_type != "table":
-                logger.warning(f"Skipping document with id '{document.id}' in TableReader as it is not of type table.")
-                continue
+        return self.predict_batch(query_doc_list=[{"question": query, "docs": documents}], top_k=top_k)[0]
 
-            table: pd.DataFrame = document.content
-            if table.shape[0] == 0:
-                logger.warning(
-                    f"Skipping document with id '{document.id}' in TableReader as it does not contain any rows."
-                )
-                continue
-            # Tokenize query and current table
-            inputs = self.tokenizer(
-                table=table, queries=query, max_length=self.max_seq_len, return_tensors="pt", truncation=True
-            )
-            inputs.to(self.devices[0])
+    def predict_batch(
+        self, query_doc_list: List[dict], top_k: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Use loaded TableQA model to find answers for a list of queries in each query's supplied list of Documents
+        of content_type ``'table'``. The query-table pairs of all queries are fed to the model together, in batches
+        of pairs with a similar number of tokens.
 
-            if isinstance(self.model, TapasForQuestionAnswering):
-                current_answer = self._predict_tapas_for_qa(inputs, document)
-                answers.append(current_answer)
-            elif isinstance(self.model, self.TapasForScoredQA):
-                current_answers, current_no_answer_score = self._predict_tapas_for_scored_qa(inputs, document)
-                answers.extend(current_answers)
-                if current_no_answer_score < no_answer_score:
-                    no_answer_score = current_no_answer_score
+        Returns list of dictionaries containing query and list of Answer objects sorted by (desc.) score.
 
-        if self.return_no_answer and isinstance(self.model, self.TapasForScoredQA):
-            answers.append(
-                Answer(
-                    answer="",
-                    type="extractive",
-                    score=no_answer_score,
-                    context=None,
-                    offsets_in_context=[Span(start=0, end=0)],
-                    offsets_in_document=[Span(start=0, end=0)],
-                    document_id=None,
-                    meta=None,
+        :param query_doc_list: List of dictionaries containing queries with their retrieved documents. The query under
+                               the key `question` can be a string or a label with a `query` attribute.
+        :param top_k: The maximum number of answers to return for each query
+        :param batch_size: Number of query-table pairs the model receives in one batch for inference
+        :return: List of dictionaries containing query and answers
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if batch_size is None:
+            batch_size = self.batch_size
+
+        queries = [_get_query_text(query_docs["question"]) for query_docs in query_doc_list]
+
+        # Tokenize each query with each of its tables
+        pairs: List[Tuple[int, Document]] = []
+        encodings = []
+        for query_idx, (query, query_docs) in enumerate(zip(queries, query_doc_list)):
+            for document in _get_tables(query_docs["docs"], reader_name="TableReader"):
+                encodings.append(
+                    self.tokenizer(table=document.content, queries=query, max_length=self.max_seq_len, truncation=True)
                 )
-            )
-        answers = sorted(answers, reverse=True)
-        answers = answers[:top_k]
+                pairs.append((query_idx, document))
 
-        results = {"query": query, "answers": answers}
+        answers_per_query: List[List[Answer]] = [[] for _ in queries]
+        no_answer_scores = [1.0 for _ in queries]
+        lengths = [len(encoding["input_ids"]) for encoding in encodings]
+        for batch_pairs in _get_batches_sorted_by_length(lengths, batch_size):
+            inputs = self.tokenizer.pad([encodings[pair_idx] for pair_idx in batch_pairs], return_tensors="pt")
+            inputs.to(self.devices[0])
+            documents = [pairs[pair_idx][1] for pair_idx in batch_pairs]
+            query_indices = [pairs[pair_idx][0] for pair_idx in batch_pairs]
+
+            with torch.no_grad():
+                if isinstance(self.model, TapasForQuestionAnswering):
+                    for query_idx, answer in zip(query_indices, self._predict_tapas_for_qa(inputs, documents)):
+                        answers_per_query[query_idx].append(answer)
+                elif isinstance(self.model, self.TapasForScoredQA):
+                    for query_idx, (current_answers, current_no_answer_score) in zip(
+                        query_indices, self._predict_tapas_for_scored_qa(inputs, documents)
+                    ):
+                        answers_per_query[query_idx].extend(current_answers)
+                        if current_no_answer_score < no_answer_scores[query_idx]:
+                            no_answer_scores[query_idx] = current_no_answer_score
+
+        results = []
+        for query, answers, no_answer_score in zip(queries, answers_per_query, no_answer_scores):
+            if self.return_no_answer and isinstance(self.model, self.TapasForScoredQA):
+                answers.append(
+                    Answer(
+                        answer="",
+                        type="extractive",
+                        score=no_answer_score,
+                        context=None,
+                        offsets_in_context=[Span(start=0, end=0)],
+                        offsets_in_document=[Span(start=0, end=0)],
+                        document_id=None,
+                        meta=None,
+                    )
+                )
+            answers = sorted(answers, reverse=True)
+            answers = answers[:top_k]
+            results.append({"query": query, "answers": answers})
 
         return results
 
-    def _predict_tapas_for_qa(self, inputs: BatchEncoding, document: Document) -> Answer:
-        table: pd.DataFrame = document.content
-
-        # Forward query and table through model and convert logits to predictions
+    def _predict_tapas_for_qa(self, inputs: BatchEncoding, documents: List[Document]) -> List[Answer]:
+        # Forward queries and tables through model and convert logits to predictions
         outputs = self.model(**inputs)
         inputs.to("cpu")
+        logits = outputs.logits.cpu().detach()
         if self.model.config.num_aggregation_labels > 0:
             aggregation_logits = outputs.logits_aggregation.cpu().detach()
         else:
             aggregation_logits = None
 
-        predicted_output = self.tokenizer.convert_logits_to_predictions(
-            inputs, outputs.logits.cpu().detach(), aggregation_logits
-        )
+        predicted_output = self.tokenizer.convert_logits_to_predictions(inputs, logits, aggregation_logits)
         if len(predicted_output) == 1:
             predicted_answer_coordinates = predicted_output[0]
         else:
             predicted_answer_coordinates, predicted_aggregation_indices = predicted_output
 
-        # Get cell values
-        current_answer_coordinates = predicted_answer_coordinates[0]
-        current_answer_cells = []
-        for coordinate in current_answer_coordinates:
-            current_answer_cells.append(table.iat[coordinate])
+        answers = []
+        for idx, document in enumerate(documents):
+            table: pd.DataFrame = document.content
 
-        # Get aggregation operator
-        if self.model.config.aggregation_labels is not None:
-            current_aggregation_operator = self.model.config.aggregation_labels[predicted_aggregation_indices[0]]
-        else:
-            current_aggregation_operator = "NONE"
+            # Get cell values
+            current_answer_coordinates = predicted_answer_coordinates[idx]
+            current_answer_cells = []
+            for coordinate in current_answer_coordinates:
+                current_answer_cells.append(table.iat[coordinate])
+
+            # Get aggregation operator
+            if self.model.config.aggregation_labels is not None:
+                current_aggregation_operator = self.model.config.aggregation_labels[predicted_aggregation_indices[idx]]
+            else:
+                current_aggregation_operator = "NONE"
+
+            # Calculate answer score
+            current_score = self._calculate_answer_score(
+                logits[idx], inputs.attention_mask[idx], inputs.token_type_ids[idx], current_answer_coordinates
+            )
 
-        # Calculate answer score
-        current_score = self._calculate_answer_score(outputs.logits.cpu().detach(), inputs, current_answer_coordinates)
+            if current_aggregation_operator == "NONE":
+                answer_str = ", ".join(current_answer_cells)
+            else:
+                answer_str = self._aggregate_answers(current_aggregation_operator, current_answer_cells)
 
-        if current_aggregation_operator == "NONE":
-            answer_str = ", ".join(current_answer_cells)
-        else:
-            answer_str = self._aggregate_answers(current_aggregation_operator, current_answer_cells)
-
-        answer_offsets = self._calculate_answer_offsets(current_answer_coordinates, document.content)
-
-        answer = Answer(
-            answer=answer_str,
-            type="extractive",
-            score=current_score,
-            context=document.content,
-            offsets_in_document=answer_offsets,
-            offsets_in_context=answer_offsets,
-            document_id=document.id,
-            meta={"aggregation_operator": current_aggregation_operator, "answer_cells": current_answer_cells},
-        )
+            answer_offsets = self._calculate_answer_offsets(current_answer_coordinates, document.content)
 
-        return answer
+            answers.append(
+                Answer(
+                    answer=answer_str,
+                    type="extractive",
+                    score=current_score,
+                    context=document.content,
+                    offsets_in_document=answer_offsets,
+                    offsets_in_context=answer_offsets,
+                    document_id=document.id,
+                    meta={"aggregation_operator": current_aggregation_operator, "answer_cells": current_answer_cells},
+                )
+            )
 
-    def _predict_tapas_for_scored_qa(self, inputs: BatchEncoding, document: Document) -> Tuple[List[Answer], float]:
-        table: pd.DataFrame = document.content
+        return answers
 
+    def _predict_tapas_for_scored_qa(
+        self, inputs: BatchEncoding, documents: List[Document]
+    ) -> List[Tuple[List[Answer], float]]:
         # Forward pass through model
         outputs = self.model.tapas(**inputs)
 
-        # Get general table score
-        table_score = self.model.classifier(outputs.pooler_output)
-        table_score_softmax = torch.nn.functional.softmax(table_score, dim=1)
-        table_relevancy_prob = table_score_softmax[0][1].item()
+        # Get general table scores
+        table_scores = self.model.classifier(outputs.pooler_output)
+        table_scores_softmax = torch.nn.functional.softmax(table_scores, dim=1)
+        table_relevancy_probs: List[float] = table_scores_softmax[:, 1].tolist()
 
         # Get possible answer spans
         token_types = [
@@ -256,89 +324,107 @@ class TableReader(BaseReader):
             "inv_column_ranks",
             "numeric_relations",
         ]
-        row_ids: List[int] = inputs.token_type_ids[:, :, token_types.index("row_ids")].tolist()[0]
-        column_ids: List[int] = inputs.token_type_ids[:, :, token_types.index("column_ids")].tolist()[0]
-
-        possible_answer_spans: List[
-            Tuple[int, int, int, int]
-        ] = []  # List of tuples: (row_idx, col_idx, start_token, end_token)
-        current_start_idx = -1
-        current_column_id = -1
-        for idx, (row_id, column_id) in enumerate(zip(row_ids, column_ids)):
-            if row_id == 0 or column_id == 0:
-                continue
-            # Beginning of new cell
-            if column_id != current_column_id:
-                if current_start_idx != -1:
-                    possible_answer_spans.append(
-                        (row_ids[current_start_idx] - 1, column_ids[current_start_idx] - 1, current_start_idx, idx - 1)
-                    )
-                current_start_idx = idx
-                current_column_id = column_id
-        possible_answer_spans.append(
-            (row_ids[current_start_idx] - 1, column_ids[current_start_idx] - 1, current_start_idx, len(row_ids) - 1)
-        )
-
-        # Concat logits of start token and end token of possible answer spans
-        sequence_output = outputs.last_hidden_state
-        concatenated_logits = []
-        for possible_span in possible_answer_spans:
-            start_token_logits = sequence_output[0, possible_span[2], :]
-            end_token_logits = sequence_output[0, possible_span[3], :]
-            concatenated_logits.append(torch.cat((start_token_logits, end_token_logits)))
-        concatenated_logit_tensors = torch.unsqueeze(torch.stack(concatenated_logits), dim=0)
-
-        # Calculate score for each possible span
-        span_logits = (
-            torch.einsum("bsj,j->bs", concatenated_logit_tensors, self.model.span_output_weights)
-            + self.model.span_output_bias
-        )
-        span_logits_softmax = torch.nn.functional.softmax(span_logits, dim=1)
-
-        top_k_answer_spans = torch.topk(span_logits[0], min(self.top_k_per_candidate, len(possible_answer_spans)))
+        all_row_ids: List[List[int]] = inputs.token_type_ids[:, :, token_types.index("row_ids")].tolist()
+        all_column_ids: List[List[int]] = inputs.token_type_ids[:, :, token_types.index("column_ids")].tolist()
+        seq_lens: List[int] = inputs.attention_mask.sum(dim=1).tolist()
 
-        answers = []
-        for answer_span_idx in top_k_answer_spans.indices:
-            current_answer_span = possible_answer_spans[answer_span_idx]
-            answer_str = table.iat[current_answer_span[:2]]
-            answer_offsets = self._calculate_answer_offsets([current_answer_span[:2]], document.content)
-            # As the general table score is more important for the final score, it is double weighted.
-            current_score = ((2 * table_relevancy_prob) + span_logits_softmax[0, answer_span_idx].item()) / 3
+        results = []
+        for idx, document in enumerate(documents):
+            table: pd.DataFrame = document.content
+            table_relevancy_prob = table_relevancy_probs[idx]
+            # Leave out the padding of the batch
+            row_ids = all_row_ids[idx][: seq_lens[idx]]
+            column_ids = all_column_ids[idx][: seq_lens[idx]]
+
+            possible_answer_spans: List[
+                Tuple[int, int, int, int]
+            ] = []  # List of tuples: (row_idx, col_idx, start_token, end_token)
+            current_start_idx = -1
+            current_column_id = -1
+            for token_idx, (row_id, column_id) in enumerate(zip(row_ids, column_ids)):
+                if row_id == 0 or column_id == 0:
+                    continue
+                # Beginning of new cell
+                if column_id != current_column_id:
+                    if current_start_idx != -1:
+                        possible_answer_spans.append(
+                            (
+                                row_ids[current_start_idx] - 1,
+                                column_ids[current_start_idx] - 1,
+                                current_start_idx,
+                                token_idx - 1,
+                            )
+                        )
+                    current_start_idx = token_idx
+                    current_column_id = column_id
+            possible_answer_spans.append(
+                (row_ids[current_start_idx] - 1, column_ids[current_start_idx] - 1, current_start_idx, len(row_ids) - 1)
+            )
 
-            answers.append(
-                Answer(
-                    answer=answer_str,
-                    type="extractive",
-                    score=current_score,
-                    context=document.content,
-                    offsets_in_document=answer_offsets,
-                    offsets_in_context=answer_offsets,
-                    document_id=document.id,
-                    meta={"aggregation_operator": "NONE", "answer_cells": table.iat[current_answer_span[:2]]},
-                )
+            # Concat logits of start token and end token of possible answer spans
+            sequence_output = outputs.last_hidden_state[idx]
+            start_tokens = [possible_span[2] for possible_span in possible_answer_spans]
+            end_tokens = [possible_span[3] for possible_span in possible_answer_spans]
+            concatenated_logit_tensors = torch.cat(
+                (sequence_output[start_tokens, :], sequence_output[end_tokens, :]), dim=1
+            ).unsqueeze(0)
+
+            # Calculate score for each possible span
+            span_logits = (
+                torch.einsum("bsj,j->bs", concatenated_logit_tensors, self.model.span_output_weights)
+                + self.model.span_output_bias
             )
+            span_logits_softmax = torch.nn.functional.softmax(span_logits, dim=1)
+
+            top_k_answer_spans = torch.topk(span_logits[0], min(self.top_k_per_candidate, len(possible_answer_spans)))
+
+            answers = []
+            for answer_span_idx in top_k_answer_spans.indices:
+                current_answer_span = possible_answer_spans[answer_span_idx]
+                answer_str = table.iat[current_answer_span[:2]]
+                answer_offsets = self._calculate_answer_offsets([current_answer_span[:2]], document.content)
+                # As the general table score is more important for the final score, it is double weighted.
+                current_score = ((2 * table_relevancy_prob) + span_logits_softmax[0, answer_span_idx].item()) / 3
+
+                answers.append(
+                    Answer(
+                        answer=answer_str,
+                        type="extractive",
+                        score=current_score,
+                        context=document.content,
+                        offsets_in_document=answer_offsets,
+                        offsets_in_context=answer_offsets,
+                        document_id=document.id,
+                        meta={"aggregation_operator": "NONE", "answer_cells": table.iat[current_answer_span[:2]]},
+                    )
+                )
 
-        no_answer_score = 1 - table_relevancy_prob
+            no_answer_score = 1 - table_relevancy_prob
+            results.append((answers, no_answer_score))
 
-        return answers, no_answer_score
+        return results
 
     def _calculate_answer_score(
-        self, logits: torch.Tensor, inputs: BatchEncoding, answer_coordinates: List[Tuple[int, int]]
+        self,
+        logits: torch.Tensor,
+        attention_mask: torch.Tensor,
+        token_type_ids: torch.Tensor,
+        answer_coordinates: List[Tuple[int, int]],
     ) -> float:
         """
         Calculates the answer score by computing each cell's probability of being part of the answer
-        and taking the mean probability of the answer cells.
+        and taking the mean probability of the answer cells. Expects the inputs of a single query-table pair.
         """
         # Calculate answer score
         # Values over 88.72284 will overflow when passed through exponential, so logits are truncated.
         logits[logits < -88.7] = -88.7
-        token_probabilities = 1 / (1 + np.exp(-logits)) * inputs.attention_mask
+        token_probabilities = 1 / (1 + np.exp(-logits)) * attention_mask
 
-        segment_ids = inputs.token_type_ids[0, :, 0].tolist()
-        column_ids = inputs.token_type_ids[0, :, 1].tolist()
-        row_ids = inputs.token_type_ids[0, :, 2].tolist()
+        segment_ids = token_type_ids[:, 0].tolist()
+        column_ids = token_type_ids[:, 1].tolist()
+        row_ids = token_type_ids[:, 2].tolist()
         all_cell_probabilities = self.tokenizer._get_mean_cell_probs(
-            token_probabilities[0].tolist(), segment_ids, row_ids, column_ids
+            token_probabilities.tolist(), segment_ids, row_ids, column_ids
         )
         # _get_mean_cell_probs seems to index cells by (col, row). DataFrames are, however, indexed by (row, col).
         all_cell_probabilities = {(row, col): prob for (col, row), prob in all_cell_probabilities.items()}
@@ -398,9 +484,6 @@ class TableReader(BaseReader):
 
         return answer_offsets
 
-    def predict_batch(self, query_doc_list: List[dict], top_k: Optional[int] = None, batch_size: Optional[int] = None):
-        raise NotImplementedError("Batch prediction not yet available in TableReader.")
-
     class TapasForScoredQA(TapasPreTrainedModel):
         def __init__(self, config):
             super().__init__(config)
@@ -451,6 +534,7 @@ class RCIReader(BaseReader):
         use_gpu: bool = True,
         top_k: int = 10,
         max_seq_len: int = 256,
+        batch_size: int = 16,
     ):
         """
         Load an RCI model from Transformers.
@@ -474,6 +558,8 @@ class RCIReader(BaseReader):
         :param max_seq_len: Max sequence length of one input table for the model. If the number of tokens of
                             query + table exceed max_seq_len, the table will be truncated by removing rows until the
                             input size fits the model.
+        :param batch_size: Number of query-row or query-column pairs the models receive in one batch for inference.
+                           Pairs of similar length are batched together, also across tables and queries.
         """
         super().__init__()
 
@@ -508,6 +594,7 @@ class RCIReader(BaseReader):
         self.top_k = top_k
         self.max_seq_len = max_seq_len
         self.return_no_answers = False
+        self.batch_size = batch_size
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> Dict:
         """
@@ -524,84 +611,127 @@ class RCIReader(BaseReader):
         :param top_k: The maximum number of answers to return
         :return: Dict containing query and answers
         """
-        if top_k is None:
-            top_k = self.top_k
+        return self.predict_batch(query_doc_list=[{"question": query, "docs": documents}], top_k=top_k)[0]
 
-        answers = []
-        for document in documents:
-            if document.content_type != "table":
-                logger.warning(f"Skipping document with id '{document.id}' in RCIReader as it is not of type table.")
-                continue
+    def predict_batch(
+        self, query_doc_list: List[dict], top_k: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Use loaded RCI models to find answers for a list of queries in each query's supplied list of Documents
+        of content_type ``'table'``. The rows and columns of all tables and queries are scored together, in batches
+        of rows or columns with a similar length.
 
-            table: pd.DataFrame = document.content
-            if table.shape[0] == 0:
-                logger.warning(
-                    f"Skipping document with id '{document.id}' in RCIReader as it does not contain any rows."
+        Returns list of dictionaries containing query and list of Answer objects sorted by (desc.) score.
+
+        :param query_doc_list: List of dictionaries containing queries with their retrieved documents. The query under
+                               the key `question` can be a string or a label with a `query` attribute.
+        :param top_k: The maximum number of answers to return for each query
+        :param batch_size: Number of query-row or query-column pairs the models receive in one batch for inference
+        :return: List of dictionaries containing query and answers
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if batch_size is None:
+            batch_size = self.batch_size
+
+        queries = [_get_query_text(query_docs["question"]) for query_docs in query_doc_list]
+
+        # Create row and column representations of all tables
+        tables: List[Tuple[int, Document, pd.DataFrame, int, int]] = []
+        row_pairs: List[Tuple[str, str]] = []
+        column_pairs: List[Tuple[str, str]] = []
+        for query_idx, (query, query_docs) in enumerate(zip(queries, query_doc_list)):
+            for document in _get_tables(query_docs["docs"], reader_name="RCIReader"):
+                table = document.content.astype(str)
+                row_reps, column_reps = self._create_row_column_representations(table)
+                tables.append((query_idx, document, table, len(row_pairs), len(column_pairs)))
+                row_pairs.extend((query, row_rep) for row_rep in row_reps)
+                column_pairs.extend((query, column_rep) for column_rep in column_reps)
+
+        # Get row and column logits
+        row_logits = self._get_logits(self.row_model, self.row_tokenizer, row_pairs, batch_size)
+        column_logits = self._get_logits(self.column_model, self.column_tokenizer, column_pairs, batch_size)
+
+        answers_per_query: List[List[Answer]] = [[] for _ in queries]
+        for query_idx, document, table, row_start, column_start in tables:
+            n_rows, n_columns = table.shape
+            answers_per_query[query_idx].extend(
+                self._create_answers(
+                    document,
+                    table,
+                    row_logits[row_start : row_start + n_rows],
+                    column_logits[column_start : column_start + n_columns],
                 )
-                continue
-            table = table.astype(str)
-            # Create row and column representations
-            row_reps, column_reps = self._create_row_column_representations(table)
-
-            # Get row logits
-            row_inputs = self.row_tokenizer.batch_encode_plus(
-                batch_text_or_text_pairs=[(query, row_rep) for row_rep in row_reps],
-                max_length=self.max_seq_len,
-                return_tensors="pt",
-                add_special_tokens=True,
-                truncation=True,
-                padding=True,
             )
-            row_inputs.to(self.devices[0])
-            row_logits = self.row_model(**row_inputs)[0].detach().cpu().numpy()[:, 1]
 
-            # Get column logits
-            column_inputs = self.column_tokenizer.batch_encode_plus(
-                batch_text_or_text_pairs=[(query, column_rep) for column_rep in column_reps],
+        results = []
+        for query, answers in zip(queries, answers_per_query):
+            # Sort answers by score and select top-k answers
+            answers = sorted(answers, reverse=True)
+            answers = answers[:top_k]
+            results.append({"query": query, "answers": answers})
+
+        return results
+
+    def _get_logits(
+        self,
+        model: AutoModelForSequenceClassification,
+        tokenizer: AutoTokenizer,
+        text_pairs: List[Tuple[str, str]],
+        batch_size: int,
+    ) -> np.ndarray:
+        """
+        Get the logits of the positive label for each query-row or query-column pair.
+        """
+        logits = np.zeros(len(text_pairs), dtype=np.float32)
+        lengths = [len(query) + len(text) for query, text in text_pairs]
+        for batch_pairs in _get_batches_sorted_by_length(lengths, batch_size):
+            inputs = tokenizer.batch_encode_plus(
+                batch_text_or_text_pairs=[text_pairs[pair_idx] for pair_idx in batch_pairs],
                 max_length=self.max_seq_len,
                 return_tensors="pt",
                 add_special_tokens=True,
                 truncation=True,
                 padding=True,
             )
-            column_inputs.to(self.devices[0])
-            column_logits = self.column_model(**column_inputs)[0].detach().cpu().numpy()[:, 1]
-
-            # Calculate cell scores
-            current_answers: List[Answer] = []
-            cell_scores_table: List[List[float]] = []
-            for row_idx, row_score in enumerate(row_logits):
-                cell_scores_table.append([])
-                for col_idx, col_score in enumerate(column_logits):
-                    current_cell_score = float(row_score + col_score)
-                    cell_scores_table[-1].append(current_cell_score)
-
-                    answer_str = table.iloc[row_idx, col_idx]
-                    answer_offsets = self._calculate_answer_offsets(row_idx, col_idx, table)
-                    current_answers.append(
-                        Answer(
-                            answer=answer_str,
-                            type="extractive",
-                            score=current_cell_score,
-                            context=table,
-                            offsets_in_document=[answer_offsets],
-                            offsets_in_context=[answer_offsets],
-                            document_id=document.id,
-                        )
-                    )
-
-            # Add cell scores to Answers' meta to be able to use as heatmap
-            for answer in current_answers:
-                answer.meta = {"table_scores": cell_scores_table}
-            answers.extend(current_answers)
-
-        # Sort answers by score and select top-k answers
-        answers = sorted(answers, reverse=True)
-        answers = answers[:top_k]
+            inputs.to(self.devices[0])
+            with torch.no_grad():
+                logits[batch_pairs] = model(**inputs)[0].detach().cpu().numpy()[:, 1]
+        return logits
 
-        results = {"query": query, "answers": answers}
+    def _create_answers(
+        self, document: Document, table: pd.DataFrame, row_logits: np.ndarray, column_logits: np.ndarray
+    ) -> List[Answer]:
+        """
+        Create an Answer for each cell of the table, scored by the sum of its row and column logit.
+        """
+        # Calculate cell scores
+        current_answers: List[Answer] = []
+        cell_scores_table: List[List[float]] = []
+        for row_idx, row_score in enumerate(row_logits):
+            cell_scores_table.append([])
+            for col_idx, col_score in enumerate(column_logits):
+                current_cell_score = float(row_score + col_score)
+                cell_scores_table[-1].append(current_cell_score)
+
+                answer_str = table.iloc[row_idx, col_idx]
+                answer_offsets = self._calculate_answer_offsets(row_idx, col_idx, table)
+                current_answers.append(
+                    Answer(
+                        answer=answer_str,
+                        type="extractive",
+                        score=current_cell_score,
+                        context=table,
+                        offsets_in_document=[answer_offsets],
+                        offsets_in_context=[answer_offsets],
+                        document_id=document.id,
+                    )
+                )
 
-        return results
+        # Add cell scores to Answers' meta to be able to use as heatmap
+        for answer in current_answers:
+            answer.meta = {"table_scores": cell_scores_table}
+        return current_answers
 
     @staticmethod
     def _create_row_column_representations(table: pd.DataFrame) -> Tuple[List[str], List[str]]:
@@ -626,6 +756,3 @@ class RCIReader(BaseReader):
         answer_cell_offset = (row_idx * n_columns) + column_index
 
         return Span(start=answer_cell_offset, end=answer_cell_offset + 1)
-
-    def predict_batch(self, query_doc_list: List[dict], top_k: Optional[int] = None, batch_size: Optional[int] = None):
-        raise NotImplementedError("Batch prediction not yet available in RCIReader.")
@@ -11,7 +11,7 @@ from tqdm import tqdm
 from haystack.schema import Document, MultiLabel
 from haystack.errors import HaystackError
 from haystack.nodes.base import BaseComponent
-from haystack.document_stores.base import BaseDocumentStore, BaseKnowledgeGraph
+from haystack.document_stores.base import BaseDocumentStore, BaseKnowledgeGraph, get_filters_per_query
 
 
 logger = logging.getLogger(__name__)
@@ -72,6 +72,33 @@ class BaseRetriever(BaseComponent):
         """
         pass
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to each of the queries.
+
+        This implementation retrieves the documents for one query after the other. Retrievers that can process several
+        queries at once override it.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param headers: Custom HTTP headers to pass to document store client if supported (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='} for basic authentication)
+        """
+        return [
+            self.retrieve(query=query, filters=query_filters, top_k=top_k, index=index, headers=headers)
+            for query, query_filters in zip(queries, get_filters_per_query(filters, len(queries)))
+        ]
+
     def timing(self, fn, attr_name):
         """Wrapper method used to time functions."""
 
@@ -272,6 +299,23 @@ class BaseRetriever(BaseComponent):
 
         return output, "output_1"
 
+    def run_batch(  # type: ignore
+        self,
+        root_node: str,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        if root_node != "Query":
+            raise HaystackError("Retrievers can only run in batch mode in pipelines where Query is the root node.")
+        self.query_count += len(queries)
+        retrieve_batch = self.timing(self.retrieve_batch, "query_time")
+        documents = retrieve_batch(queries=queries, filters=filters, top_k=top_k, index=index, headers=headers)
+        logger.debug(f"Retrieved documents with IDs: {[[doc.id for doc in docs] for docs in documents]}")
+        return {"documents": documents}, "output_1"
+
     def run_indexing(self, documents: List[Union[dict, Document]]):
         if self.__class__.__name__ in ["DensePassageRetriever", "EmbeddingRetriever"]:
             documents = deepcopy(documents)
@@ -234,6 +234,41 @@ class DensePassageRetriever(BaseRetriever):
         )
         return documents
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to each of the queries. All queries are embedded in one pass.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not self.document_store:
+            logger.error(
+                "Cannot perform retrieve_batch() since DensePassageRetriever initialized with document_store=None"
+            )
+            return [[] for _ in queries]
+        if index is None:
+            index = self.document_store.index
+        if not queries:
+            return []
+        query_embs = self.embed_queries(texts=queries)
+        documents = self.document_store.query_by_embedding_batch(
+            query_embs=query_embs, top_k=top_k, filters=filters, index=index, headers=headers
+        )
+        return documents
+
     def _get_predictions(self, dicts):
         """
         Feed a preprocessed dataset to the model and get the actual predictions (forward pass + formatting).
@@ -734,6 +769,41 @@ class TableTextRetriever(BaseRetriever):
         )
         return documents
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to each of the queries. All queries are embedded in one pass.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not self.document_store:
+            logger.error(
+                "Cannot perform retrieve_batch() since TableTextRetriever initialized with document_store=None"
+            )
+            return [[] for _ in queries]
+        if index is None:
+            index = self.document_store.index
+        if not queries:
+            return []
+        query_embs = self.embed_queries(texts=queries)
+        documents = self.document_store.query_by_embedding_batch(
+            query_embs=query_embs, top_k=top_k, filters=filters, index=index, headers=headers
+        )
+        return documents
+
     def _get_predictions(self, dicts: List[Dict]) -> Dict[str, List[np.ndarray]]:
         """
         Feed a preprocessed dataset to the model and get the actual predictions (forward pass + formatting).
@@ -1179,6 +1249,36 @@ class EmbeddingRetriever(BaseRetriever):
         )
         return documents
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to each of the queries. All queries are embedded in one pass.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if index is None:
+            index = self.document_store.index
+        if not queries:
+            return []
+        query_embs = self.embed_queries(texts=queries)
+        documents = self.document_store.query_by_embedding_batch(
+            query_embs=query_embs, top_k=top_k, filters=filters, index=index, headers=headers
+        )
+        return documents
+
     def embed_queries(self, texts: List[str]) -> List[np.ndarray]:
         """
         Create embeddings for a list of queries.
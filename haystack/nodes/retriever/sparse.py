@@ -1,14 +1,17 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import logging
-from collections import OrderedDict, namedtuple
+import threading
+from collections import namedtuple
 
-import pandas as pd
+import numpy as np
+from scipy.sparse import vstack
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from haystack.schema import Document
-from haystack.document_stores.base import BaseDocumentStore
-from haystack.document_stores.elasticsearch import KeywordDocumentStore
+from haystack.document_stores.base import BaseDocumentStore, KeywordDocumentStore
+from haystack.document_stores.filter_utils import LogicalFilterClause
 from haystack.nodes.retriever import BaseRetriever
 
 
@@ -24,7 +27,8 @@ class ElasticsearchRetriever(BaseRetriever):
         custom_query: Optional[str] = None,
     ):
         """
-        :param document_store: an instance of an ElasticsearchDocumentStore to retrieve documents from.
+        :param document_store: an instance of a KeywordDocumentStore (e.g. ElasticsearchDocumentStore or
+                               InMemoryDocumentStore) to retrieve documents from.
         :param all_terms_must_match: Whether all terms of the query must match the document.
                                      If true all query terms must be present in a document in order to be retrieved (i.e the AND operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy AND fish AND restaurant").
                                      Otherwise at least one query term must be present in a document in order to be retrieved (i.e the OR operator is being used implicitly between query terms: "cozy fish restaurant" -> "cozy OR fish OR restaurant").
@@ -138,6 +142,42 @@ class ElasticsearchRetriever(BaseRetriever):
         )
         return documents
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Scan through documents in DocumentStore and return a small number documents
+        that are most relevant to each of the queries. All queries are sent to the document store at once.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param headers: Custom HTTP headers to pass to elasticsearch client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
+                Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if index is None:
+            index = self.document_store.index
+
+        documents = self.document_store.query_batch(
+            queries=queries,
+            filters=filters,
+            top_k=top_k,
+            all_terms_must_match=self.all_terms_must_match,
+            custom_query=self.custom_query,
+            index=index,
+            headers=headers,
+        )
+        return documents
+
 
 class ElasticsearchFilterOnlyRetriever(ElasticsearchRetriever):
     """
@@ -173,6 +213,39 @@ class ElasticsearchFilterOnlyRetriever(ElasticsearchRetriever):
         )
         return documents
 
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Union[dict, List[Optional[dict]]]] = None,
+        top_k: Optional[int] = None,
+        index: str = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Return the documents that match the filters for each of the queries. The queries themselves are ignored.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field.
+                        Either one dictionary that applies to all queries or a list with one (or None) per query.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param headers: Custom HTTP headers to pass to elasticsearch client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
+                Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if index is None:
+            index = self.document_store.index
+        documents = self.document_store.query_batch(
+            queries=[None] * len(queries),
+            filters=filters,
+            top_k=top_k,
+            custom_query=self.custom_query,
+            index=index,
+            headers=headers,
+        )
+        return documents
+
 
 # TODO make Paragraph generic for configurable units of text eg, pages, paragraphs, or split by a char_limit
 Paragraph = namedtuple("Paragraph", ["paragraph_id", "document_id", "content", "meta"])
@@ -188,11 +261,26 @@ class TfidfRetriever(BaseRetriever):
     It uses sklearn's TfidfVectorizer to compute a tf-idf matrix.
     """
 
-    def __init__(self, document_store: BaseDocumentStore, top_k: int = 10, auto_fit=True):
+    def __init__(
+        self,
+        document_store: BaseDocumentStore,
+        top_k: int = 10,
+        auto_fit=True,
+        incremental_fit: bool = False,
+        refit_threshold: float = 0.1,
+    ):
         """
         :param document_store: an instance of a DocumentStore to retrieve documents from.
         :param top_k: How many documents to return per query.
         :param auto_fit: Whether to automatically update tf-idf matrix by calling fit() after new documents have been added
+        :param incremental_fit: Whether to vectorize documents that were added (or drop documents that were deleted)
+                                since the last fit against the existing vocabulary instead of refitting on the whole
+                                corpus. Requires `auto_fit`. A full refit is started in a background thread as soon as
+                                the number of paragraphs added or deleted since the last fit exceeds `refit_threshold`
+                                times the number of paragraphs of the last fit. Queries keep using the previous matrix
+                                until it is done.
+        :param refit_threshold: Fraction of incrementally added or deleted paragraphs that triggers a background refit
+                                when `incremental_fit` is enabled.
         """
         super().__init__()
 
@@ -202,21 +290,30 @@ class TfidfRetriever(BaseRetriever):
 
         self.document_store = document_store
         self.paragraphs = self._get_all_paragraphs()
-        self.df = None
+        self.tfidf_matrix = None
         self.top_k = top_k
         self.auto_fit = auto_fit
+        self.incremental_fit = incremental_fit
+        self.refit_threshold = refit_threshold
         self.document_count = 0
+        self._fitted_paragraph_count = 0
+        self._changed_paragraph_count = 0
+        self._lock = threading.Lock()
+        self._refit_thread: Optional[threading.Thread] = None
         self.fit()
 
-    def _get_all_paragraphs(self) -> List[Paragraph]:
+    def _get_all_paragraphs(self, documents: Optional[Iterable[Document]] = None) -> List[Paragraph]:
         """
         Split the list of documents in paragraphs
         """
-        documents = self.document_store.get_all_documents()
+        if documents is None:
+            documents = self.document_store.get_all_documents_generator(return_embedding=False)
 
         paragraphs = []
         p_id = 0
+        doc_count = 0
         for doc in documents:
+            doc_count += 1
             for p in doc.content.split(
                 "\n\n"
             ):  # TODO: this assumes paragraphs are separated by "\n\n". Can be switched to paragraph tokenizer.
@@ -224,16 +321,58 @@ class TfidfRetriever(BaseRetriever):
                     continue
                 paragraphs.append(Paragraph(document_id=doc.id, paragraph_id=p_id, content=(p,), meta=doc.meta))
                 p_id += 1
-        logger.info(f"Found {len(paragraphs)} candidate paragraphs from {len(documents)} docs in DB")
+        logger.info(f"Found {len(paragraphs)} candidate paragraphs from {doc_count} docs in DB")
         return paragraphs
 
-    def _calc_scores(self, query: str) -> dict:
+    def _calc_scores(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the indices of all paragraphs that share at least one term with the query and their scores.
+        """
         question_vector = self.vectorizer.transform([query])
 
-        scores = self.tfidf_matrix.dot(question_vector.T).toarray()
-        idx_scores = [(idx, score) for idx, score in enumerate(scores)]
-        indices_and_scores = OrderedDict(sorted(idx_scores, key=(lambda tup: tup[1]), reverse=True))
-        return indices_and_scores
+        scores = self.tfidf_matrix.dot(question_vector.T).tocoo()  # type: ignore
+        is_match = scores.data > 0
+        return scores.row[is_match], scores.data[is_match]
+
+    def _rank_paragraphs(
+        self, indices: np.ndarray, scores: np.ndarray, top_k: int, filters: Optional[dict] = None
+    ) -> List[int]:
+        """
+        Select the `top_k` best paragraphs without sorting all of them. Ties are broken by paragraph position and, as
+        long as there are fewer matches than `top_k`, paragraphs without any matching term are appended in order.
+        """
+        parsed_filter = LogicalFilterClause.parse(filters) if filters else None
+
+        def is_allowed(idx: int) -> bool:
+            return parsed_filter is None or parsed_filter.evaluate(self.paragraphs[idx].meta)
+
+        ranked: List[int] = []
+        candidates = top_k
+        start = 0
+        while len(ranked) < top_k and start < len(scores):
+            if candidates < len(scores):
+                # keep every paragraph tied with the k-th best score so that the sorted prefix is stable across rounds
+                threshold = -np.partition(-scores, candidates - 1)[candidates - 1]
+                selected = np.flatnonzero(scores >= threshold)
+            else:
+                selected = np.arange(len(scores))
+            selected = selected[np.lexsort((indices[selected], -scores[selected]))]
+            for idx in indices[selected[start:]]:
+                if is_allowed(idx):
+                    ranked.append(int(idx))
+                    if len(ranked) == top_k:
+                        break
+            start = len(selected)
+            candidates *= 4
+
+        if len(ranked) < top_k:
+            matched = set(indices.tolist())
+            for idx in range(len(self.paragraphs)):
+                if idx not in matched and is_allowed(idx):
+                    ranked.append(idx)
+                    if len(ranked) == top_k:
+                        break
+        return ranked
 
     def retrieve(
         self,
@@ -254,44 +393,38 @@ class TfidfRetriever(BaseRetriever):
         """
         if self.auto_fit:
             if self.document_store.get_document_count(headers=headers) != self.document_count:
-                # run fit() to update self.df, self.tfidf_matrix and self.document_count
-                logger.warning(
-                    "Indexed documents have been updated and fit() method needs to be run before retrieval. Running it now."
-                )
-                self.fit()
-        if self.df is None:
+                if self.incremental_fit and self.tfidf_matrix is not None:
+                    self._update(headers=headers)
+                else:
+                    # run fit() to update self.paragraphs, self.tfidf_matrix and self.document_count
+                    logger.warning(
+                        "Indexed documents have been updated and fit() method needs to be run before retrieval. Running it now."
+                    )
+                    self.fit()
+        if self.tfidf_matrix is None:
             raise Exception(
-                "Retrieval requires dataframe df and tf-idf matrix but fit() did not calculate them probably due to an empty document store."
+                "Retrieval requires a tf-idf matrix but fit() did not calculate it probably due to an empty document store."
             )
 
-        if filters:
-            raise NotImplementedError("Filters are not implemented in TfidfRetriever.")
         if index:
             raise NotImplementedError("Switching index is not supported in TfidfRetriever.")
 
         if top_k is None:
             top_k = self.top_k
-        # get scores
-        indices_and_scores = self._calc_scores(query)
 
-        # rank paragraphs
-        df_sliced = self.df.loc[indices_and_scores.keys()]
-        df_sliced = df_sliced[:top_k]
-
-        logger.debug(
-            f"Identified {df_sliced.shape[0]} candidates via retriever:\n {df_sliced.to_string(col_space=10, index=False)}"
-        )
+        with self._lock:
+            # get scores and rank paragraphs
+            indices, scores = self._calc_scores(query)
+            ranked_indices = self._rank_paragraphs(indices=indices, scores=scores, top_k=top_k, filters=filters)
+            paragraphs = [self.paragraphs[idx] for idx in ranked_indices]
 
-        # get actual content for the top candidates
-        paragraphs = list(df_sliced.content.values)
-        meta_data = [
-            {"document_id": row["document_id"], "paragraph_id": row["paragraph_id"], "meta": row.get("meta", {})}
-            for idx, row in df_sliced.iterrows()
-        ]
+        logger.debug(f"Identified {len(paragraphs)} candidates via retriever: {[p.paragraph_id for p in paragraphs]}")
 
         documents = []
-        for para, meta in zip(paragraphs, meta_data):
-            documents.append(Document(id=meta["document_id"], content=para, meta=meta.get("meta", {})))
+        for paragraph in paragraphs:
+            documents.append(
+                Document(id=paragraph.document_id, content=" ".join(paragraph.content), meta=paragraph.meta or {})
+            )
 
         return documents
 
@@ -299,13 +432,69 @@ class TfidfRetriever(BaseRetriever):
         """
         Performing training on this class according to the TF-IDF algorithm.
         """
-        if not self.paragraphs or len(self.paragraphs) == 0:
-            self.paragraphs = self._get_all_paragraphs()
-            if not self.paragraphs or len(self.paragraphs) == 0:
+        document_count = self.document_store.get_document_count()
+        paragraphs = self.paragraphs
+        if not paragraphs or len(paragraphs) == 0 or self.tfidf_matrix is not None:
+            paragraphs = self._get_all_paragraphs()
+            if not paragraphs or len(paragraphs) == 0:
                 logger.warning("Fit method called with empty document store")
                 return
 
-        self.df = pd.DataFrame.from_dict(self.paragraphs)
-        self.df["content"] = self.df["content"].apply(lambda x: " ".join(x))  # pylint: disable=unnecessary-lambda
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.df["content"])
-        self.document_count = self.document_store.get_document_count()
+        vectorizer = clone(self.vectorizer)
+        tfidf_matrix = vectorizer.fit_transform([" ".join(p.content) for p in paragraphs])
+        with self._lock:
+            self.vectorizer = vectorizer
+            self.paragraphs = paragraphs
+            self.tfidf_matrix = tfidf_matrix
+            self.document_count = document_count
+            self._fitted_paragraph_count = len(paragraphs)
+            self._changed_paragraph_count = 0
+
+    def _update(self, headers: Optional[Dict[str, str]] = None):
+        """
+        Vectorize the documents that were added to the document store since the last update with the existing
+        vocabulary and drop the paragraphs of documents that were deleted. Only the ids of the stored documents are
+        listed, the documents themselves are fetched just for the new ids.
+        """
+        document_count = self.document_store.get_document_count(headers=headers)
+        stored_ids = self.document_store.get_all_document_ids(headers=headers)
+        with self._lock:
+            known_paragraphs = self.paragraphs
+        known_ids = {p.document_id for p in known_paragraphs}
+        new_ids = [doc_id for doc_id in stored_ids if doc_id not in known_ids]
+        new_documents = self.document_store.get_documents_by_id(ids=new_ids, headers=headers) if new_ids else []
+        new_paragraphs = self._get_all_paragraphs(documents=new_documents)
+
+        stored_id_set = set(stored_ids)
+        with self._lock:
+            if self.paragraphs is not known_paragraphs:
+                # A background refit or another update replaced the paragraphs since known_ids was computed
+                current_ids = {p.document_id for p in self.paragraphs}
+                new_paragraphs = [p for p in new_paragraphs if p.document_id not in current_ids]
+            keep = np.array([p.document_id in stored_id_set for p in self.paragraphs], dtype=bool)
+            tfidf_matrix = self.tfidf_matrix[keep] if not keep.all() else self.tfidf_matrix  # type: ignore
+            paragraphs = [p for p, kept in zip(self.paragraphs, keep) if kept]
+            if new_paragraphs:
+                new_vectors = self.vectorizer.transform([" ".join(p.content) for p in new_paragraphs])
+                tfidf_matrix = vstack([tfidf_matrix, new_vectors], format="csr")
+            self.paragraphs = [
+                Paragraph(paragraph_id=p_id, document_id=p.document_id, content=p.content, meta=p.meta)
+                for p_id, p in enumerate(paragraphs + new_paragraphs)
+            ]
+            self.tfidf_matrix = tfidf_matrix
+            self.document_count = document_count
+            n_deleted_paragraphs = len(keep) - int(keep.sum())
+            # Count additions and deletions separately, so that replacing paragraphs also leads to a refit
+            self._changed_paragraph_count += len(new_paragraphs) + n_deleted_paragraphs
+            changed_paragraph_count = self._changed_paragraph_count
+
+        logger.info(f"Vectorized {len(new_paragraphs)} new paragraphs and dropped {n_deleted_paragraphs} deleted ones.")
+        if changed_paragraph_count > self.refit_threshold * max(self._fitted_paragraph_count, 1):
+            self._start_background_refit()
+
+    def _start_background_refit(self):
+        if self._refit_thread is not None and self._refit_thread.is_alive():
+            return
+        logger.info("Refitting the tf-idf matrix in the background.")
+        self._refit_thread = threading.Thread(target=self.fit, daemon=True)
+        self._refit_thread.start()
@@ -12,6 +12,7 @@ class BaseTranslator(BaseComponent):
     """
 
     outgoing_edges = 1
+    copied_inputs = ("documents", "answers")
 
     @abstractmethod
     def translate(
@@ -50,7 +51,8 @@ class BaseTranslator(BaseComponent):
             translation_results["query"] = self.translate(query=query)  # type: ignore
         # This will cover retriever and summarizer
         if documents:
-            _dict_key = dict_key or "text"
+            # Documents of indexing pipelines are dictionaries with their text under the key "content"
+            _dict_key = dict_key or "content"
             translation_results["documents"] = self.translate(documents=documents, dict_key=_dict_key)  # type: ignore
 
         if answers:
@@ -1,4 +1,6 @@
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
@@ -39,6 +41,8 @@ class TransformersTranslator(BaseTranslator):
         max_seq_len: Optional[int] = None,
         clean_up_tokenization_spaces: Optional[bool] = True,
         use_gpu: bool = True,
+        batch_size: int = 16,
+        cache_size: int = 0,
     ):
         """Initialize the translator with a model that fits your targeted languages. While we support all seq2seq
         models from Hugging Face's model hub, we recommend using the OPUS models from Helsiniki NLP. They provide plenty
@@ -59,6 +63,11 @@ class TransformersTranslator(BaseTranslator):
         :param max_seq_len: The maximum sentence length the model accepts. (Optional)
         :param clean_up_tokenization_spaces: Whether or not to clean up the tokenization spaces. (default True)
         :param use_gpu: Whether to use GPU or the CPU. Falls back on CPU if no GPU is available.
+        :param batch_size: Number of texts the model translates in one batch. Texts of similar length are batched
+                           together, so that little padding is needed.
+        :param cache_size: Number of translations to keep in a least recently used cache, so that repeated texts
+                           (e.g. frequent queries and answers) are not translated again. The cache belongs to this
+                           translator and thereby to its model. Set to 0 to disable caching.
         """
         super().__init__()
 
@@ -69,6 +78,11 @@ class TransformersTranslator(BaseTranslator):
         self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
         self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name_or_path)
         self.model.to(str(self.devices[0]))
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.cache: OrderedDict = OrderedDict()
+        # the REST API runs a node from several worker threads, which share the cache
+        self._cache_lock = threading.Lock()
 
     def translate(
         self,
@@ -118,13 +132,7 @@ class TransformersTranslator(BaseTranslator):
         else:
             text_for_translator: List[str] = [query]  # type: ignore
 
-        batch = self.tokenizer.prepare_seq2seq_batch(
-            src_texts=text_for_translator, return_tensors="pt", max_length=self.max_seq_len
-        ).to(self.devices[0])
-        generated_output = self.model.generate(**batch)
-        translated_texts = self.tokenizer.batch_decode(
-            generated_output, skip_special_tokens=True, clean_up_tokenization_spaces=self.clean_up_tokenization_spaces
-        )
+        translated_texts = self._translate_texts(text_for_translator)
 
         if queries_for_translator is not None and answers_for_translator is not None:
             return translated_texts
@@ -145,3 +153,38 @@ class TransformersTranslator(BaseTranslator):
             return documents
 
         raise AttributeError("Translator need query or documents to perform translation")
+
+    def _translate_texts(self, texts: List[str]) -> List[str]:
+        """
+        Translate the texts in batches of texts with a similar length, reusing cached translations.
+        The translations are returned in the order of the texts.
+        """
+        translations: Dict[str, str] = {}
+        with self._cache_lock:
+            for text in texts:
+                if text in self.cache:
+                    translations[text] = self.cache[text]
+                    self.cache.move_to_end(text)
+
+        texts_to_translate = sorted({text for text in texts if text not in translations}, key=len, reverse=True)
+        for i in range(0, len(texts_to_translate), self.batch_size):
+            batch_texts = texts_to_translate[i : i + self.batch_size]
+            batch = self.tokenizer.prepare_seq2seq_batch(
+                src_texts=batch_texts, return_tensors="pt", max_length=self.max_seq_len
+            ).to(self.devices[0])
+            generated_output = self.model.generate(**batch)
+            translated_texts = self.tokenizer.batch_decode(
+                generated_output,
+                skip_special_tokens=True,
+                clean_up_tokenization_spaces=self.clean_up_tokenization_spaces,
+            )
+            translations.update(zip(batch_texts, translated_texts))
+
+        if self.cache_size > 0:
+            with self._cache_lock:
+                for text in texts_to_translate:
+                    self.cache[text] = translations[text]
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+        return [translations[text] for text in texts]
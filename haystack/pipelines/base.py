@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple, Union
 
 import copy
 import json
@@ -7,6 +7,7 @@ import inspect
 import logging
 import tempfile
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -450,6 +451,49 @@ class BasePipeline(ABC):
         client.undeploy(pipeline_config_name=pipeline_config_name, timeout=timeout)
 
 
+class _ExecutionPlan:
+    """
+    Precompiled view of a Pipeline's graph. Pipeline.run() looks up ancestors, successors and valid params here
+    instead of traversing the graph and inspecting the nodes for every request.
+    """
+
+    def __init__(self, graph: DiGraph):
+        self.order: List[str] = list(nx.topological_sort(graph))
+        self.ancestors: Dict[str, FrozenSet[str]] = {
+            node_id: frozenset(nx.ancestors(graph, node_id)) for node_id in self.order
+        }
+        # number of incoming edges, i.e. the number of inputs a join node waits for at most
+        self.fan_in: Dict[str, int] = {node_id: graph.in_degree(node_id) for node_id in self.order}
+        self.position: Dict[str, int] = {node_id: position for position, node_id in enumerate(self.order)}
+        # position of each predecessor among the inputs of a node, in the order they were passed to add_node()
+        self.input_position: Dict[str, Dict[str, int]] = {
+            node_id: {input_node: position for position, input_node in enumerate(graph.predecessors(node_id))}
+            for node_id in self.order
+        }
+        self.successors: Dict[str, List[Tuple[str, str]]] = {
+            node_id: [(data["label"], next_node) for _, next_node, data in graph.edges(node_id, data=True)]
+            for node_id in self.order
+        }
+        self.node_ids: FrozenSet[str] = frozenset(self.order)
+        valid_global_params = {"debug"}  # Debug will be picked up by _dispatch_run, see its code
+        for node_id in self.order:
+            component = graph.nodes[node_id]["component"]
+            if isinstance(component, BaseComponent):
+                valid_global_params |= component._get_run_signature_args()
+                if callable(getattr(component, "run_batch", None)):
+                    valid_global_params |= component._get_run_signature_args("run_batch")
+            else:
+                valid_global_params |= set(inspect.signature(component.run).parameters.keys())
+        self.valid_global_params: FrozenSet[str] = frozenset(valid_global_params)
+
+    def get_next_nodes(self, node_id: str, stream_id: str) -> List[str]:
+        return [
+            next_node
+            for label, next_node in self.successors[node_id]
+            if not stream_id or label == stream_id or stream_id == "output_all"
+        ]
+
+
 class Pipeline(BasePipeline):
     """
     Pipeline brings together building blocks to build a complex search pipeline with Haystack & user-defined components.
@@ -459,9 +503,28 @@ class Pipeline(BasePipeline):
     Reader from multiple Retrievers, or re-ranking of candidate documents.
     """
 
-    def __init__(self):
+    def __init__(self, pass_by_reference: bool = False, parallel_execution: bool = False, max_workers: int = None):
+        """
+        :param pass_by_reference: Whether to pass the inputs from one node to the next by reference instead of
+                                  deep-copying them at every node. Nodes that modify their inputs in place declare them
+                                  in `copied_inputs` and still receive copies of those.
+        :param parallel_execution: Whether to run nodes whose predecessors are all executed at the same time, e.g. the
+                                   two retrievers of a hybrid retrieval pipeline. The nodes run in a thread pool and
+                                   each node starts as soon as its predecessors are executed. A "join" node receives
+                                   its inputs in the order they are listed in `add_node()`.
+                                   Nodes on parallel branches must be safe to call from different threads at the same
+                                   time. In particular, parallel branches must not share a SQL-based document store
+                                   (`SQLDocumentStore`, `FAISSDocumentStore`), because its SQLAlchemy session is not
+                                   thread-safe.
+        :param max_workers: The maximum number of threads used for parallel execution. Defaults to the default of
+                            `concurrent.futures.ThreadPoolExecutor`.
+        """
         self.graph = DiGraph()
         self.root_node = None
+        self.pass_by_reference = pass_by_reference
+        self.parallel_execution = parallel_execution
+        self.max_workers = max_workers
+        self._execution_plan: Optional[_ExecutionPlan] = None
 
     @property
     def components(self) -> Dict[str, BaseComponent]:
@@ -510,6 +573,7 @@ class Pipeline(BasePipeline):
                 )
             # edges_count = self.graph.graph.
             self.graph.add_edge(self.root_node, name, label="output_1")
+            self._execution_plan = _ExecutionPlan(self.graph)
             return
 
         for input_node in inputs:
@@ -547,6 +611,7 @@ class Pipeline(BasePipeline):
         if not nx.is_directed_acyclic_graph(self.graph):
             self.graph.remove_node(name)
             raise PipelineConfigError(f"Cannot add '{name}': it will create a loop in the pipeline.")
+        self._execution_plan = _ExecutionPlan(self.graph)
 
     def get_node(self, name: str) -> Optional[BaseComponent]:
         """
@@ -566,6 +631,15 @@ class Pipeline(BasePipeline):
         :param component: The component object to be set at the node.
         """
         self.graph.nodes[name]["component"] = component
+        self._execution_plan = _ExecutionPlan(self.graph)
+
+    def _get_execution_plan(self) -> _ExecutionPlan:
+        execution_plan = getattr(self, "_execution_plan", None)
+        if execution_plan is None or execution_plan.node_ids != frozenset(self.graph.nodes):
+            # the graph was built or modified without add_node()
+            execution_plan = _ExecutionPlan(self.graph)
+            self._execution_plan = execution_plan
+        return execution_plan
 
     def run(  # type: ignore
         self,
@@ -594,99 +668,220 @@ class Pipeline(BasePipeline):
                       they received and the output they generated. All debug information can
                       then be found in the dict returned by this method under the key "_debug"
         """
-        # validate the node names
-        if params:
-            if not all(node_id in self.graph.nodes for node_id in params.keys()):
-
-                # Might be a non-targeted param. Verify that too
-                not_a_node = set(params.keys()) - set(self.graph.nodes)
-                valid_global_params = set(["debug"])  # Debug will be picked up by _dispatch_run, see its code
-                for node_id in self.graph.nodes:
-                    run_signature_args = inspect.signature(self.graph.nodes[node_id]["component"].run).parameters.keys()
-                    valid_global_params |= set(run_signature_args)
-                invalid_keys = [key for key in not_a_node if key not in valid_global_params]
-
-                if invalid_keys:
-                    raise ValueError(
-                        f"No node(s) or global parameter(s) named {', '.join(invalid_keys)} found in pipeline."
-                    )
-
-        node_output = None
-        queue = {
-            self.root_node: {"root_node": self.root_node, "params": params}
-        }  # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        root_input: Dict[str, Any] = {}
         if query:
-            queue[self.root_node]["query"] = query
+            root_input["query"] = query
         if file_paths:
-            queue[self.root_node]["file_paths"] = file_paths
+            root_input["file_paths"] = file_paths
         if labels:
-            queue[self.root_node]["labels"] = labels
+            root_input["labels"] = labels
         if documents:
-            queue[self.root_node]["documents"] = documents
+            root_input["documents"] = documents
         if meta:
-            queue[self.root_node]["meta"] = meta
-
-        i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
-        while queue:
-            node_id = list(queue.keys())[i]
-            node_input = queue[node_id]
-            node_input["node_id"] = node_id
-
-            # Apply debug attributes to the node input params
-            # NOTE: global debug attributes will override the value specified
-            # in each node's params dictionary.
-            if debug is not None:
-                if node_id not in node_input["params"].keys():
-                    node_input["params"][node_id] = {}
-                node_input["params"][node_id]["debug"] = debug
-
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
-                try:
-                    logger.debug(f"Running node `{node_id}` with input `{node_input}`")
-                    node_output, stream_id = self.graph.nodes[node_id]["component"]._dispatch_run(**node_input)
-                except Exception as e:
-                    tb = traceback.format_exc()
-                    raise Exception(
-                        f"Exception while running node `{node_id}` with input `{node_input}`: {e}, full stack trace: {tb}"
+            root_input["meta"] = meta
+        return self._execute(root_input=root_input, params=params, debug=debug, dispatch_method="_dispatch_run")
+
+    def run_batch(  # type: ignore
+        self,
+        queries: List[str],
+        labels: Optional[List[MultiLabel]] = None,
+        documents: Optional[List[List[Document]]] = None,
+        meta: Optional[List[dict]] = None,
+        params: Optional[dict] = None,
+        debug: Optional[bool] = None,
+    ):
+        """
+        Runs the pipeline for a batch of queries, one node at a time.
+
+        All queries are passed through every node together. Retrievers embed all queries in one pass, Rankers and Readers
+        use their `predict_batch()` method. Nodes without a `run_batch()` method are run once per query.
+
+        :param queries: The search queries
+        :param labels: One MultiLabel per query
+        :param documents: One list of Documents per query
+        :param meta: One meta dictionary per query
+        :param params: Dictionary of parameters to be dispatched to the nodes, see `run()`.
+        :param debug: Whether the pipeline should instruct nodes to collect debug information
+                      about their execution, see `run()`.
+        :return: A dictionary with the `queries` and one entry per query for every other output, e.g. `answers`
+        """
+        if self.root_node != "Query":
+            raise PipelineError("run_batch() is only available for pipelines with a 'Query' root node.")
+
+        root_input: Dict[str, Any] = {"queries": queries}
+        for key, value in (("labels", labels), ("documents", documents), ("meta", meta)):
+            if value:
+                if len(value) != len(queries):
+                    raise PipelineError(
+                        f"Expected one entry in '{key}' per query, got {len(value)} for {len(queries)}."
                     )
-                queue.pop(node_id)
-                #
-                if stream_id == "split_documents":
-                    for stream_id in [key for key in node_output.keys() if key.startswith("output_")]:
-                        current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
-                        current_docs = node_output.pop(stream_id)
-                        current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
-                        for n in next_nodes:
-                            queue[n] = current_node_output
+                root_input[key] = value
+        return self._execute(root_input=root_input, params=params, debug=debug, dispatch_method="_dispatch_run_batch")
+
+    def _execute(self, root_input: Dict[str, Any], params: Optional[dict], debug: Optional[bool], dispatch_method: str):
+        execution_plan = self._get_execution_plan()
+
+        # validate the node names
+        if params:
+            invalid_keys = [
+                key
+                for key in params.keys()
+                if key not in execution_plan.node_ids and key not in execution_plan.valid_global_params
+            ]
+            if invalid_keys:
+                raise ValueError(
+                    f"No node(s) or global parameter(s) named {', '.join(invalid_keys)} found in pipeline."
+                )
+
+        queue = {
+            self.root_node: {"root_node": self.root_node, "params": params, **root_input}
+        }  # ordered dict with "node_id" -> "input" mapping that acts as a FIFO queue
+        received_inputs: Dict[str, int] = {}  # number of inputs each queued node has received so far
+        input_senders: Dict[str, List[str]] = {}  # ids of the nodes each queued node received its inputs from
+
+        def is_ready(node_id: str) -> bool:
+            # a "join" node waits until it received all inputs or until all its predecessors are executed
+            all_inputs_received = received_inputs.get(node_id, 0) >= execution_plan.fan_in[node_id]
+            predecessors_done = execution_plan.ancestors[node_id].isdisjoint(queue)
+            return all_inputs_received or predecessors_done
+
+        def route(node_id: str, node_output: Dict[str, Any], stream_id: str):
+            self._route_node_output(
+                node_id=node_id,
+                node_output=node_output,
+                stream_id=stream_id,
+                queue=queue,
+                received_inputs=received_inputs,
+                input_senders=input_senders,
+                execution_plan=execution_plan,
+                root_input=root_input,
+                params=params,
+            )
+
+        if not self.parallel_execution:
+            node_output = None
+            while queue:
+                # the first node in the queue is executed unless it is a "join" node with unprocessed predecessors
+                node_id = next(node_id for node_id in queue if is_ready(node_id))
+                node_input = self._get_node_input(node_id=node_id, queue=queue, debug=debug)
+                node_output, stream_id = self._run_node(node_id, node_input, dispatch_method)
+                route(node_id, node_output, stream_id)
+            return node_output
+
+        # All nodes whose predecessors are executed run at the same time. Each node is routed as soon as it finishes,
+        # so that its successors can start without waiting for the other running nodes.
+        running: Dict[Future, str] = {}
+        last_node_id = None
+        last_node_output = None
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="haystack-pipeline") as executor:
+            while queue:
+                running_node_ids = set(running.values())
+                for node_id in queue:
+                    if node_id not in running_node_ids and is_ready(node_id):
+                        node_input = self._get_node_input(node_id=node_id, queue=queue, debug=debug)
+                        self._sort_join_inputs(
+                            node_id=node_id,
+                            node_input=node_input,
+                            senders=input_senders.get(node_id, []),
+                            execution_plan=execution_plan,
+                        )
+                        running[executor.submit(self._run_node, node_id, node_input, dispatch_method)] = node_id
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                # nodes that finished at the same time are routed in graph order to keep the result deterministic
+                for future in sorted(done, key=lambda future: execution_plan.position[running[future]]):
+                    node_id = running.pop(future)
+                    node_output, stream_id = future.result()
+                    route(node_id, node_output, stream_id)
+                    # return the output of the last node in graph order rather than of the node that finished last
+                    if last_node_id is None or execution_plan.position[node_id] > execution_plan.position[last_node_id]:
+                        last_node_id, last_node_output = node_id, node_output
+        return last_node_output
+
+    @staticmethod
+    def _get_node_input(node_id: str, queue: Dict[str, Dict[str, Any]], debug: Optional[bool]) -> Dict[str, Any]:
+        node_input = {**queue[node_id], "node_id": node_id}
+
+        # Apply debug attributes to the node input params
+        # NOTE: global debug attributes will override the value specified
+        # in each node's params dictionary.
+        if debug is not None:
+            if node_id not in node_input["params"].keys():
+                node_input["params"][node_id] = {}
+            node_input["params"][node_id]["debug"] = debug
+        return node_input
+
+    @staticmethod
+    def _sort_join_inputs(node_id: str, node_input: Dict[str, Any], senders: List[str], execution_plan: _ExecutionPlan):
+        """
+        Order the inputs of a "join" node like its inputs in `add_node()` instead of by the time they arrived.
+        """
+        inputs = node_input.get("inputs")
+        if not isinstance(inputs, list) or len(inputs) != len(senders) or len(senders) < 2:
+            return
+        input_position = execution_plan.input_position[node_id]
+        order = sorted(range(len(senders)), key=lambda i: input_position[senders[i]])
+        node_input["inputs"] = [inputs[i] for i in order]
+
+    def _run_node(self, node_id: str, node_input: Dict[str, Any], dispatch_method: str) -> Tuple[Dict, str]:
+        try:
+            logger.debug(f"Running node `{node_id}` with input `{node_input}`")
+            component = self.graph.nodes[node_id]["component"]
+            return getattr(component, dispatch_method)(pass_by_reference=self.pass_by_reference, **node_input)
+        except Exception as e:
+            tb = traceback.format_exc()
+            raise Exception(
+                f"Exception while running node `{node_id}` with input `{node_input}`: {e}, full stack trace: {tb}"
+            )
+
+    def _route_node_output(
+        self,
+        node_id: str,
+        node_output: Dict[str, Any],
+        stream_id: str,
+        queue: Dict[str, Dict[str, Any]],
+        received_inputs: Dict[str, int],
+        input_senders: Dict[str, List[str]],
+        execution_plan: _ExecutionPlan,
+        root_input: Dict[str, Any],
+        params: Optional[dict],
+    ):
+        """
+        Remove an executed node from the queue and add its successors with the corresponding inputs.
+        """
+        queue.pop(node_id)
+        received_inputs.pop(node_id, None)
+        input_senders.pop(node_id, None)
+        #
+        if stream_id == "split_documents":
+            for stream_id in [key for key in node_output.keys() if key.startswith("output_")]:
+                current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
+                current_docs = node_output.pop(stream_id)
+                if "queries" in node_output:  # a batch, queries without documents for this output get none
+                    current_docs = [docs or [] for docs in current_docs]
+                current_node_output["documents"] = current_docs
+                next_nodes = execution_plan.get_next_nodes(node_id, stream_id)
+                for n in next_nodes:
+                    queue[n] = current_node_output
+                    received_inputs[n] = received_inputs.get(n, 0) + 1
+                    input_senders[n] = [node_id]
+        else:
+            next_nodes = execution_plan.get_next_nodes(node_id, stream_id)
+            for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
+                if queue.get(n):  # concatenate inputs if it's a join node
+                    existing_input = queue[n]
+                    if "inputs" not in existing_input.keys():
+                        updated_input: dict = {"inputs": [existing_input, node_output], "params": params}
+                        updated_input.update(root_input)
+                    else:
+                        existing_input["inputs"].append(node_output)
+                        updated_input = existing_input
+                    queue[n] = updated_input
+                    input_senders[n].append(node_id)
                 else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
-                    for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
-                        if queue.get(n):  # concatenate inputs if it's a join node
-                            existing_input = queue[n]
-                            if "inputs" not in existing_input.keys():
-                                updated_input: dict = {"inputs": [existing_input, node_output], "params": params}
-                                if query:
-                                    updated_input["query"] = query
-                                if file_paths:
-                                    updated_input["file_paths"] = file_paths
-                                if labels:
-                                    updated_input["labels"] = labels
-                                if documents:
-                                    updated_input["documents"] = documents
-                                if meta:
-                                    updated_input["meta"] = meta
-                            else:
-                                existing_input["inputs"].append(node_output)
-                                updated_input = existing_input
-                            queue[n] = updated_input
-                        else:
-                            queue[n] = node_output
-                i = 0
-            else:
-                i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
-        return node_output
+                    queue[n] = node_output
+                    input_senders[n] = [node_id]
+                received_inputs[n] = received_inputs.get(n, 0) + 1
 
     @classmethod
     def eval_beir(
@@ -1,11 +1,15 @@
-from typing import List
+from typing import List, Optional
 from uuid import uuid4
 
+import asyncio
+import threading
+import warnings
 import numpy as np
 import pandas as pd
 import pytest
 import json
 import responses
+import sqlalchemy
 from responses import matchers
 from unittest.mock import Mock
 from elasticsearch import Elasticsearch
@@ -23,7 +27,7 @@ from .conftest import (
 from haystack.document_stores import WeaviateDocumentStore, DeepsetCloudDocumentStore, InMemoryDocumentStore
 from haystack.document_stores.base import BaseDocumentStore
 from haystack.document_stores.es_converter import elasticsearch_index_to_document_store
-from haystack.errors import DuplicateDocumentError
+from haystack.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.schema import Document, Label, Answer, Span
 from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
 from haystack.document_stores.faiss import FAISSDocumentStore
@@ -117,6 +121,54 @@ def test_init_elastic_doc_store_with_index_recreation():
     assert len(labels) == 0
 
 
+class _RandomEmbeddingRetriever:
+    def __init__(self, fail_on_batch: Optional[int] = None):
+        self.fail_on_batch = fail_on_batch
+        self.embedded_batches = 0
+
+    def embed_documents(self, docs: List[Document]) -> List[np.ndarray]:
+        self.embedded_batches += 1
+        if self.embedded_batches == self.fail_on_batch:
+            raise RuntimeError("Embedding failed")
+        return [np.random.rand(768).astype(np.float32) for _ in docs]
+
+
+@pytest.mark.elasticsearch
+@pytest.mark.parametrize("document_store", ["elasticsearch"], indirect=True)
+def test_elasticsearch_update_embeddings_with_bulk_writer_threads(document_store):
+    documents = [{"content": f"text_{i}", "id": str(i)} for i in range(50)]
+    document_store.write_documents(documents)
+    retriever = _RandomEmbeddingRetriever()
+
+    document_store.update_embeddings(retriever, batch_size=4, bulk_writer_threads=3, max_queued_batches=1)
+    assert retriever.embedded_batches == 13
+    documents = document_store.get_all_documents(return_embedding=True)
+    assert len(documents) == 50
+    assert all(doc.embedding is not None and doc.embedding.shape == (768,) for doc in documents)
+
+
+@pytest.mark.elasticsearch
+@pytest.mark.parametrize("document_store", ["elasticsearch"], indirect=True)
+def test_elasticsearch_update_embeddings_retriever_error(document_store):
+    document_store.write_documents([{"content": f"text_{i}", "id": str(i)} for i in range(50)])
+    threads_before = set(threading.enumerate())
+
+    with pytest.raises(RuntimeError, match="Embedding failed"):
+        document_store.update_embeddings(
+            _RandomEmbeddingRetriever(fail_on_batch=3), batch_size=4, bulk_writer_threads=2, max_queued_batches=1
+        )
+    # the prefetch and bulk writer threads are stopped instead of waiting for further batches
+    assert set(threading.enumerate()) <= threads_before
+
+
+@pytest.mark.elasticsearch
+@pytest.mark.parametrize("document_store", ["elasticsearch"], indirect=True)
+@pytest.mark.parametrize("invalid_params", [{"bulk_writer_threads": 0}, {"max_queued_batches": 0}])
+def test_elasticsearch_update_embeddings_invalid_params(document_store, invalid_params):
+    with pytest.raises(ValueError):
+        document_store.update_embeddings(_RandomEmbeddingRetriever(), **invalid_params)
+
+
 def test_write_with_duplicate_doc_ids(document_store: BaseDocumentStore):
     duplicate_documents = [
         Document(content="Doc1", id_hash_keys=["content"]),
@@ -226,6 +278,110 @@ def test_get_all_documents_with_correct_filters_legacy_sqlite(test_docs_xs, tmp_
     assert {d.meta["meta_field"] for d in documents} == {"test1", "test3"}
 
 
+@pytest.mark.parametrize("use_upsert", [True, False])
+def test_sql_write_documents_meta(tmp_path, use_upsert):
+    document_store = get_document_store("sql", tmp_path)
+    document_store.use_upsert = use_upsert
+    documents = [Document(content=f"doc-{i}", id=str(i), meta={"name": f"name-{i}", "year": "2020"}) for i in range(5)]
+    document_store.write_documents(documents, duplicate_documents="skip", batch_size=2)
+    document_store.write_documents(documents[:2], index="other_index", batch_size=2)
+
+    updated_documents = [
+        Document(content="updated", id="0", meta={"year": "2021"}),
+        Document(content="new", id="5", meta={"year": "2021"}),
+    ]
+    document_store.write_documents(updated_documents, duplicate_documents="overwrite")
+
+    documents_by_id = {doc.id: doc for doc in document_store.get_all_documents()}
+    assert len(documents_by_id) == 6
+    assert documents_by_id["0"].content == "updated"
+    assert documents_by_id["0"].meta == {"year": "2021"}
+    assert documents_by_id["1"].meta == {"name": "name-1", "year": "2020"}
+    assert {doc.id for doc in document_store.get_all_documents(filters={"year": ["2021"]})} == {"0", "5"}
+
+    # documents with the same id in another index are untouched
+    other_documents = document_store.get_all_documents(index="other_index")
+    assert {doc.meta["year"] for doc in other_documents} == {"2020"}
+
+
+def test_sql_create_missing_indexes(tmp_path):
+    document_store = get_document_store("sql", tmp_path)
+    document_store.write_documents([Document(content="a", id="a", meta={"year": "2020"})])
+    # a database created before the composite indexes were added, with an index on each column instead
+    document_store.session.execute("DROP INDEX ix_meta_document_name_value")
+    document_store.session.execute("DROP INDEX ix_meta_document_document_id_document_index")
+    superseded_columns = ("name", "value", "document_id", "document_index")
+    for column in superseded_columns:
+        document_store.session.execute(f"CREATE INDEX ix_meta_document_{column} ON meta_document ({column})")
+    document_store.session.commit()
+    engine = document_store.session.get_bind()
+    assert "ix_meta_document_name_value" not in {
+        index["name"] for index in sqlalchemy.inspect(engine).get_indexes("meta_document")
+    }
+
+    document_store = get_document_store("sql", tmp_path)
+    index_names = {index["name"] for index in sqlalchemy.inspect(engine).get_indexes("meta_document")}
+    assert {"ix_meta_document_name_value", "ix_meta_document_document_id_document_index"} <= index_names
+    assert not {f"ix_meta_document_{column}" for column in superseded_columns} & index_names
+    assert [doc.id for doc in document_store.get_all_documents(filters={"year": ["2020"]})] == ["a"]
+
+
+def test_sql_typed_meta_filters(tmp_path):
+    document_store = get_document_store("sql", tmp_path)
+    documents = [
+        Document(content="a", id="a", meta={"count": 9, "published": "2021-01-01T23:30:00+00:00", "public": True}),
+        Document(content="b", id="b", meta={"count": "10", "published": "2021-01-02T00:30:00+02:00", "public": False}),
+        Document(content="c", id="c", meta={"count": 100.5, "published": "2021-01-02", "public": True}),
+    ]
+    document_store.write_documents(documents)
+
+    def get_ids(filters):
+        return {doc.id for doc in document_store.get_all_documents(filters=filters)}
+
+    # compared as numbers, not as strings
+    assert get_ids({"count": {"$gt": 9}}) == {"b", "c"}
+    assert get_ids({"count": {"$lte": 10}}) == {"a", "b"}
+    assert get_ids({"count": [9, 100.5]}) == {"a", "c"}
+    assert get_ids({"count": 10}) == {"b"}
+    # compared as UTC datetimes
+    assert get_ids({"published": {"$gte": "2021-01-01T22:00:00", "$lt": "2021-01-02"}}) == {"a", "b"}
+    assert get_ids({"public": True}) == {"a", "c"}
+    # plain strings are still compared as strings
+    assert get_ids({"count": "10"}) == {"b"}
+
+    document_store.update_document_meta(id="a", meta={"count": 11})
+    assert get_ids({"count": {"$gt": 10}}) == {"a", "c"}
+
+    # values without a typed copy are not equal to a number either
+    document_store.write_documents([Document(content="d", id="d", meta={"count": "many"})])
+    assert get_ids({"count": {"$ne": 10}}) == {"a", "c", "d"}
+    assert get_ids({"count": {"$nin": [10, 11]}}) == {"c", "d"}
+
+
+def test_sql_add_typed_meta_columns(tmp_path):
+    document_store = get_document_store("sql", tmp_path)
+    document_store.write_documents(
+        [
+            Document(content="a", id="a", meta={"count": 9, "published": "2021-01-01"}),
+            Document(content="b", id="b", meta={"count": "10", "published": "2021-01-02"}),
+        ]
+    )
+    # a database created before the typed columns were added
+    for column in ["value_number", "value_datetime"]:
+        document_store.session.execute(f"DROP INDEX ix_meta_document_name_{column}")
+        document_store.session.execute(f"ALTER TABLE meta_document DROP COLUMN {column}")
+    document_store.session.commit()
+
+    document_store = get_document_store("sql", tmp_path)
+    document_store.write_documents([Document(content="c", id="c", meta={"count": 100.5})])
+
+    def get_ids(filters):
+        return {doc.id for doc in document_store.get_all_documents(filters=filters)}
+
+    assert get_ids({"count": {"$gt": 9}}) == {"b", "c"}
+    assert get_ids({"published": {"$gte": "2021-01-02"}}) == {"b"}
+
+
 def test_get_all_documents_with_incorrect_filter_name(document_store_with_docs):
     documents = document_store_with_docs.get_all_documents(filters={"incorrect_meta_field": ["test2"]})
     assert len(documents) == 0
@@ -385,6 +541,51 @@ def test_get_documents_by_id(document_store: BaseDocumentStore):
     assert set(retrieved_ids) == set(all_ids)
 
 
+def test_get_existing_ids(document_store: BaseDocumentStore):
+    documents = [{"content": "doc-" + str(i)} for i in range(15)]
+    doc_idx = "green_fields"
+    document_store.write_documents(documents, index=doc_idx)
+    all_ids = [doc.id for doc in document_store.get_all_documents(index=doc_idx)]
+
+    existing_ids = document_store.get_existing_ids(all_ids + ["not-an-existing-id"], index=doc_idx, batch_size=4)
+
+    assert sorted(existing_ids) == sorted(all_ids)
+    assert document_store.get_existing_ids(all_ids, index="not_existing_index") == []
+
+
+def test_get_all_document_ids(document_store: BaseDocumentStore):
+    documents = [{"content": "doc-" + str(i)} for i in range(15)]
+    doc_idx = "green_fields"
+    document_store.write_documents(documents, index=doc_idx)
+    document_store.write_documents([{"content": "other doc"}], index="other_index")
+    all_ids = [doc.id for doc in document_store.get_all_documents(index=doc_idx)]
+
+    assert sorted(document_store.get_all_document_ids(index=doc_idx, batch_size=4)) == sorted(all_ids)
+    assert document_store.get_all_document_ids(index="not_existing_index") == []
+
+
+@pytest.mark.parametrize("document_store", ["memory"], indirect=True)
+def test_query_by_embedding_batch_with_filters_per_query(document_store: BaseDocumentStore):
+    documents = [
+        {
+            "content": f"doc-{i}",
+            "meta": {"year": str(2020 + i % 2)},
+            "embedding": np.random.rand(768).astype(np.float32),
+        }
+        for i in range(6)
+    ]
+    document_store.write_documents(documents)
+    query_embs = np.random.rand(2, 768).astype(np.float32)
+
+    results = document_store.query_by_embedding_batch(
+        query_embs=query_embs, filters=[{"year": "2020"}, {"year": "2021"}], top_k=5
+    )
+    assert [{doc.meta["year"] for doc in docs} for docs in results] == [{"2020"}, {"2021"}]
+
+    with pytest.raises(DocumentStoreError):
+        document_store.query_by_embedding_batch(query_embs=query_embs, filters=[{"year": "2020"}])
+
+
 def test_get_document_count(document_store: BaseDocumentStore):
     documents = [
         {"content": "text1", "id": "1", "meta_field_for_count": "a"},
@@ -1221,6 +1422,123 @@ def test_custom_embedding_field(document_store_type, tmp_path):
     np.testing.assert_array_equal(doc_to_write["custom_embedding_field"], documents[0].embedding)
 
 
+@pytest.mark.parametrize("similarity", ["cosine", "dot_product"])
+def test_memory_query_by_embedding_after_updates(similarity):
+    document_store = InMemoryDocumentStore(embedding_dim=8, similarity=similarity, use_gpu=False)
+    embeddings = np.random.rand(20, 8).astype(np.float32)
+    document_store.write_documents(
+        [
+            {"content": f"text_{i}", "id": str(i), "meta": {"odd": i % 2 == 1}, "embedding": embeddings[i]}
+            for i in range(20)
+        ]
+    )
+    # overwrite one embedding, drop the embedding of another document and delete two documents
+    embeddings[3] = np.random.rand(8)
+    document_store.write_documents(
+        [{"content": "text_3", "id": "3", "meta": {"odd": True}, "embedding": embeddings[3]}]
+    )
+    document_store.write_documents([{"content": "text_4", "id": "4", "meta": {"odd": False}}])
+    document_store.delete_documents(ids=["5", "6"])
+
+    query_emb = np.random.rand(8).astype(np.float32)
+    remaining_ids = [i for i in range(20) if i not in (4, 5, 6)]
+    if similarity == "cosine":
+        raw_scores = {
+            i: np.dot(embeddings[i], query_emb) / (np.linalg.norm(embeddings[i]) * np.linalg.norm(query_emb))
+            for i in remaining_ids
+        }
+    else:
+        raw_scores = {i: np.dot(embeddings[i], query_emb) for i in remaining_ids}
+    expected_ids = [str(i) for i in sorted(remaining_ids, key=lambda i: raw_scores[i], reverse=True)]
+
+    results = document_store.query_by_embedding(query_emb, top_k=5)
+    assert [doc.id for doc in results] == expected_ids[:5]
+    assert results[0].score == pytest.approx(
+        document_store.finalize_raw_score(raw_scores[int(expected_ids[0])], similarity), abs=1e-5
+    )
+
+    results = document_store.query_by_embedding(query_emb, top_k=5, filters={"odd": True})
+    assert [doc.id for doc in results] == [doc_id for doc_id in expected_ids if int(doc_id) % 2 == 1][:5]
+
+    assert len(document_store.query_by_embedding(query_emb, top_k=100)) == len(remaining_ids)
+
+
+def test_memory_get_all_documents_returns_copies():
+    document_store = InMemoryDocumentStore(embedding_dim=8, return_embedding=False, use_gpu=False)
+    document_store.write_documents(
+        [
+            {"content": "text_1", "id": "1", "meta": {"name": "name_1", "tags": ["a"]}, "embedding": np.random.rand(8)},
+            {"content": "text_2", "id": "2", "meta": {"name": "name_2", "tags": ["b"]}},
+        ]
+    )
+    assert document_store.get_document_count(only_documents_without_embedding=True) == 1
+    assert document_store.get_document_count(filters={"name": ["name_1"]}) == 1
+    assert document_store.get_embedding_count() == 1
+
+    documents = document_store.get_all_documents(return_embedding=True)
+    documents[0].meta["tags"].append("c")
+    with pytest.raises(ValueError):
+        documents[0].embedding[0] = 0.0
+    assert document_store.get_document_by_id("1").meta["tags"] == ["a"]
+    assert all(doc.embedding is None for doc in document_store.get_all_documents_generator())
+
+
+def test_memory_get_all_documents_copies_tables():
+    document_store = InMemoryDocumentStore(use_gpu=False)
+    table = pd.DataFrame({"actors": ["brad pitt", "george clooney"], "age": ["58", "60"]})
+    document_store.write_documents([Document(content=table, content_type="table", id="table")])
+
+    document = document_store.get_all_documents()[0]
+    document.content.loc[0, "age"] = "59"
+    assert document_store.get_document_by_id("table").content.loc[0, "age"] == "58"
+
+
+def test_memory_bm25_query():
+    document_store = InMemoryDocumentStore(use_gpu=False)
+    document_store.write_documents(
+        [
+            {"content": "Berlin is the capital of Germany", "id": "1", "meta": {"country": "de"}},
+            {"content": "Paris is the capital of France", "id": "2", "meta": {"country": "fr"}},
+            {"content": "Berlin has a lot of museums. Berlin is big.", "id": "3", "meta": {"country": "de"}},
+            {"content": "The Seine flows through Paris", "id": "4", "meta": {"country": "fr"}},
+        ]
+    )
+    results = document_store.query(query="berlin capital", top_k=10)
+    assert [doc.id for doc in results][:2] == ["1", "3"]
+    assert {doc.id for doc in results} == {"1", "2", "3"}
+    assert all(0 < doc.score < 1 for doc in results)
+
+    results = document_store.query(query="berlin capital", top_k=10, all_terms_must_match=True)
+    assert [doc.id for doc in results] == ["1"]
+
+    results = document_store.query(query="capital", filters={"country": "fr"})
+    assert [doc.id for doc in results] == ["2"]
+    assert len(document_store.query(query=None, filters={"country": "fr"})) == 2
+
+    # the index is updated incrementally on writes and deletes
+    document_store.write_documents([{"content": "Madrid is the capital of Spain", "id": "2"}])
+    document_store.write_documents([{"content": "Lisbon is the capital of Portugal", "id": "5"}])
+    document_store.delete_documents(ids=["1"])
+    results = document_store.query(query="capital", top_k=10)
+    assert {doc.id for doc in results} == {"2", "5"}
+    assert [doc.id for doc in document_store.query(query="madrid")] == ["2"]
+    assert [doc.id for doc in document_store.query(query="paris germany")] == ["4"]
+
+    # deleting most of the documents compacts the postings
+    document_store.delete_documents(ids=["3", "4"])
+    assert [doc.id for doc in document_store.query(query="capital portugal")] == ["5", "2"]
+
+    assert len(document_store.query(query=None)) == 2
+
+
+def test_memory_bm25_query_without_tokens():
+    document_store = InMemoryDocumentStore(use_gpu=False)
+    document_store.write_documents([{"content": "", "id": "1"}, {"content": "...", "id": "2"}])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert document_store.query(query="berlin") == []
+
+
 @pytest.mark.parametrize("document_store", ["elasticsearch"], indirect=True)
 def test_get_meta_values_by_key(document_store: BaseDocumentStore):
     documents = [
@@ -1384,6 +1702,74 @@ def test_skip_missing_embeddings():
         document_store.query_by_embedding(np.random.rand(768).astype(np.float32))
 
 
+@pytest.mark.elasticsearch
+def test_async_elasticsearch_document_store():
+    from haystack.document_stores.async_elasticsearch import AsyncElasticsearchDocumentStore
+
+    documents = [
+        {"content": "The capital of Germany is Berlin", "id": "1", "meta": {"year": "2020"}},
+        {"content": "The capital of France is Paris", "id": "2", "meta": {"year": "2021"}},
+        {"content": "The capital of Italy is Rome", "id": "3", "meta": {"year": "2021"}},
+    ]
+    for doc in documents:
+        doc["embedding"] = np.random.rand(768).astype(np.float32)
+
+    async def run():
+        async with AsyncElasticsearchDocumentStore(index="async_test_index", recreate_index=True) as document_store:
+            await document_store.write_documents(documents)
+            with pytest.raises(DuplicateDocumentError):
+                await document_store.write_documents(documents[:1], duplicate_documents="fail")
+
+            queries = ["capital of Germany", "capital of France", "capital of Italy"]
+            results = await asyncio.gather(*[document_store.query(query=query, top_k=1) for query in queries])
+            assert [docs[0].id for docs in results] == ["1", "2", "3"]
+
+            docs = await document_store.query(query="capital", filters={"year": "2021"})
+            assert {doc.id for doc in docs} == {"2", "3"}
+
+            docs = await document_store.query_by_embedding(documents[1]["embedding"], filters={"year": "2021"}, top_k=1)
+            assert docs[0].id == "2"
+
+            docs = await document_store.get_documents_by_id(["1", "3", "4"])
+            assert {doc.id for doc in docs} == {"1", "3"}
+
+            # the synchronous document store sees the same documents
+            assert document_store.sync_document_store.get_document_count() == 3
+
+    asyncio.run(run())
+
+
+@pytest.mark.elasticsearch
+def test_elasticsearch_query_batch():
+    documents = [
+        {"content": "The capital of Germany is Berlin", "id": "1", "meta": {"year": "2020"}},
+        {"content": "The capital of France is Paris", "id": "2", "meta": {"year": "2021"}},
+        {"content": "The capital of Italy is Rome", "id": "3", "meta": {"year": "2021"}},
+    ]
+    for doc in documents:
+        doc["embedding"] = np.random.rand(768).astype(np.float32)
+    document_store = ElasticsearchDocumentStore(index="haystack_test_query_batch", recreate_index=True)
+    document_store.write_documents(documents)
+
+    queries = ["capital of Germany", "capital of France", "capital of Italy"]
+    results = document_store.query_batch(queries=queries, top_k=1, batch_size=2)
+    assert [docs[0].id for docs in results] == ["1", "2", "3"]
+
+    # one filter per query
+    results = document_store.query_batch(queries=["capital"] * 2, filters=[{"year": "2020"}, {"year": "2021"}])
+    assert [{doc.id for doc in docs} for docs in results] == [{"1"}, {"2", "3"}]
+
+    query_embs = np.stack([doc["embedding"] for doc in documents])
+    results = document_store.query_by_embedding_batch(query_embs=query_embs, top_k=3, batch_size=2)
+    for query_emb, docs in zip(query_embs, results):
+        expected = document_store.query_by_embedding(query_emb=query_emb, top_k=3)
+        assert [doc.id for doc in docs] == [doc.id for doc in expected]
+
+    results = document_store.query_by_embedding_batch(query_embs=query_embs[:2], filters=[None, {"year": "2020"}])
+    assert [doc.id for doc in results[1]] == ["1"]
+    assert len(results[0]) == 3
+
+
 @pytest.mark.elasticsearch
 def test_elasticsearch_synonyms():
     synonyms = ["i-pod, i pod, ipod", "sea biscuit, sea biscit, seabiscuit", "foo, foo bar, baz"]
@@ -3,6 +3,7 @@ import pytest
 from haystack.nodes.retriever.sparse import ElasticsearchRetriever
 from haystack.nodes.reader import FARMReader
 from haystack.pipelines import Pipeline
+from haystack.schema import Document
 
 from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
 
@@ -44,3 +45,35 @@ def test_extractor_output_simplifier(document_store_with_docs):
     )
     simplified = simplify_ner_for_qa(prediction)
     assert simplified[0] == {"answer": "Carla", "entities": ["Carla"]}
+
+
+def test_extractor_batch_with_long_texts():
+    ner = EntityExtractor(max_seq_len=32, doc_stride=8)
+    short_text = "Carla lives in Berlin."
+    long_text = " ".join(["My name is Carla and I live in Berlin."] * 50)
+
+    entities_per_text = ner.extract_batch([short_text, long_text], batch_size=4)
+    assert len(entities_per_text) == 2
+    assert entities_per_text[0] == ner.extract(short_text)
+
+    entities = entities_per_text[1]
+    for entity in entities:
+        assert long_text[entity["start"] : entity["end"]] == entity["word"]
+    offsets = [(entity["start"], entity["end"]) for entity in entities]
+    assert len(offsets) == len(set(offsets))
+    assert [entity["word"] for entity in entities].count("Carla") == 50
+    assert [entity["word"] for entity in entities].count("Berlin") == 50
+
+
+def test_extractor_returns_flat_list_of_entities():
+    ner = EntityExtractor()
+    text = "Carla lives in Berlin."
+
+    entities = ner.extract(text)
+    assert len(entities) > 0
+    assert all(isinstance(entity, dict) for entity in entities)
+    assert {entity["word"] for entity in entities} == {"Carla", "Berlin"}
+
+    documents = [Document(content=text)]
+    ner.run(documents=documents)
+    assert documents[0].meta["entities"] == entities
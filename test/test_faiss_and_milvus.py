@@ -6,6 +6,7 @@ import pytest
 import sys
 
 from haystack.schema import Document
+from haystack.errors import DocumentStoreError
 from haystack.pipelines import DocumentSearchPipeline
 from haystack.document_stores.faiss import FAISSDocumentStore
 from haystack.document_stores.weaviate import WeaviateDocumentStore
@@ -158,6 +159,84 @@ def test_faiss_index_save_and_load_custom_path(tmp_path, sql_url):
     assert not new_document_store.progress_bar
 
 
+@pytest.mark.skipif(sys.platform in ["win32", "cygwin"], reason="Test with tmp_path not working on windows runner")
+def test_faiss_index_load_mmap(tmp_path, sql_url):
+    document_store = FAISSDocumentStore(
+        sql_url=sql_url, faiss_index_factory_str="IVF2,Flat", index="haystack_test", isolation_level="AUTOCOMMIT"
+    )
+    document_store.train_index(DOCUMENTS)
+    document_store.write_documents(DOCUMENTS)
+    document_store.save(tmp_path / "haystack_test_faiss")
+
+    mmap_document_store = FAISSDocumentStore.load(tmp_path / "haystack_test_faiss", mmap=True)
+    assert mmap_document_store.get_embedding_count() == len(DOCUMENTS)
+    query_emb = np.asarray(DOCUMENTS[0]["embedding"], dtype=np.float32)
+    assert mmap_document_store.query_by_embedding(query_emb, top_k=2)
+
+    # memory-mapped IVF indices are read-only
+    with pytest.raises(DocumentStoreError):
+        mmap_document_store.write_documents([{"content": "text_7", "embedding": query_emb}])
+    with pytest.raises(DocumentStoreError):
+        mmap_document_store.delete_documents()
+    assert mmap_document_store.get_embedding_count() == len(DOCUMENTS)
+
+
+@pytest.mark.parametrize(
+    "num_documents,target_recall,expected_factory_str,expected_search_params",
+    [
+        (5_000, 0.9, "Flat", None),
+        (100_000, 1.0, "Flat", None),
+        (100_000, 0.99, "HNSW32,Flat", "efSearch=512"),
+        (100_000, 0.95, "IVF1024,Flat", "nprobe=32"),
+        (100_000, 0.9, "IVF1024,PQ192", "nprobe=16"),
+        (10_000_000, 0.99, "IVF16384_HNSW32,Flat", "nprobe=64"),
+    ],
+)
+def test_faiss_suggest_index_factory_str(num_documents, target_recall, expected_factory_str, expected_search_params):
+    assert FAISSDocumentStore.suggest_index_factory_str(
+        num_documents=num_documents, embedding_dim=768, target_recall=target_recall
+    ) == (expected_factory_str, expected_search_params)
+
+
+def test_faiss_create_tuned_index():
+    document_store = FAISSDocumentStore(sql_url="sqlite://", embedding_dim=16)
+    embeddings = np.random.rand(1_000, 16).astype(np.float32)
+
+    faiss_index_factory_str = document_store.create_tuned_index(
+        num_documents=20_000, target_recall=0.95, embeddings=embeddings
+    )
+
+    assert faiss_index_factory_str == "IVF512,Flat"
+    faiss_index = document_store.faiss_indexes[document_store.index]
+    assert faiss_index.is_trained
+    assert faiss.extract_index_ivf(faiss_index).nprobe == 32
+
+    document_store.write_documents([{"content": f"text_{i}", "embedding": emb} for i, emb in enumerate(embeddings)])
+    assert len(document_store.query_by_embedding(embeddings[0], top_k=5)) == 5
+
+    # only empty indices can be replaced
+    with pytest.raises(DocumentStoreError):
+        document_store.create_tuned_index(num_documents=20_000, embeddings=embeddings)
+
+
+def test_faiss_create_tuned_index_without_ivf(monkeypatch):
+    # an index type that needs training but has no inverted lists
+    monkeypatch.setattr(FAISSDocumentStore, "suggest_index_factory_str", staticmethod(lambda **kwargs: ("PQ4", None)))
+    document_store = FAISSDocumentStore(sql_url="sqlite://", embedding_dim=16)
+    embeddings = np.random.rand(1_000, 16).astype(np.float32)
+
+    assert document_store.create_tuned_index(num_documents=1_000, embeddings=embeddings) == "PQ4"
+    assert document_store.faiss_indexes[document_store.index].is_trained
+
+
+def test_faiss_suggest_index_factory_str_independent_of_filtered_search(monkeypatch):
+    monkeypatch.setattr(sys.modules[FAISSDocumentStore.__module__], "EXACT_FILTERED_SEARCH_MAX_VECTORS", 100)
+    assert FAISSDocumentStore.suggest_index_factory_str(num_documents=5_000, embedding_dim=768) == ("Flat", None)
+
+    monkeypatch.setattr(sys.modules[FAISSDocumentStore.__module__], "FLAT_INDEX_MAX_DOCUMENTS", 100)
+    assert FAISSDocumentStore.suggest_index_factory_str(num_documents=5_000, embedding_dim=768)[0] != "Flat"
+
+
 @pytest.mark.skipif(sys.platform in ["win32", "cygwin"], reason="Test with tmp_path not working on windows runner")
 def test_faiss_index_mutual_exclusive_args(tmp_path):
     with pytest.raises(ValueError):
@@ -198,6 +277,33 @@ def test_faiss_write_docs(document_store, index_buffer_size, batch_size):
         assert np.allclose(original_doc["embedding"] / np.linalg.norm(original_doc["embedding"]), stored_emb, rtol=0.01)
 
 
+@pytest.mark.parametrize("index_factory", ["Flat", "IVF2,Flat"])
+def test_faiss_overwrite_and_delete_vectors(index_factory):
+    document_store = FAISSDocumentStore(
+        sql_url="sqlite://", faiss_index_factory_str=index_factory, duplicate_documents="overwrite"
+    )
+    document_store.train_index(DOCUMENTS)
+    document_store.write_documents(DOCUMENTS)
+    faiss_index = document_store.faiss_indexes[document_store.index]
+    assert faiss_index.ntotal == len(DOCUMENTS)
+
+    # vector ids are derived from the document ids
+    doc = document_store.get_all_documents()[0]
+    assert int(doc.meta["vector_id"]) == document_store._get_vector_id(doc.id, document_store.index)
+
+    # overwriting a document replaces its vector
+    new_embedding = np.full(768, 10.0, dtype=np.float32)
+    document_store.write_documents([{"content": doc.content, "id": doc.id, "embedding": new_embedding}])
+    assert faiss_index.ntotal == len(DOCUMENTS)
+    result = document_store.query_by_embedding(new_embedding, top_k=1, return_embedding=False)
+    assert result[0].id == doc.id
+
+    document_store.delete_documents(ids=[doc.id])
+    assert faiss_index.ntotal == len(DOCUMENTS) - 1
+    assert document_store.get_embedding_count() == len(DOCUMENTS) - 1
+    assert doc.id not in [d.id for d in document_store.query_by_embedding(new_embedding, top_k=len(DOCUMENTS))]
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("retriever", ["dpr"], indirect=True)
 @pytest.mark.parametrize("document_store", ["faiss", "milvus1", "milvus"], indirect=True)
@@ -479,7 +585,7 @@ def test_faiss_passing_index_from_outside(tmp_path):
 
     # test if vectors ids are associated with docs
     for doc in documents_indexed:
-        assert 0 <= int(doc.meta["vector_id"]) <= 7
+        assert int(doc.meta["vector_id"]) == document_store._get_vector_id(doc.id, index)
 
 
 @pytest.mark.parametrize("document_store", ["faiss", "milvus1", "milvus", "weaviate"], indirect=True)
@@ -528,6 +634,44 @@ def test_cosine_similarity(document_store):
         assert not np.allclose(original_emb[0], doc.embedding, rtol=0.01)
 
 
+@pytest.mark.parametrize("document_store", ["faiss"], indirect=True)
+def test_faiss_query_by_embedding_batch(document_store):
+    document_store.write_documents(documents=DOCUMENTS)
+    query_embs = np.array([DOCUMENTS[0]["embedding"], DOCUMENTS[3]["embedding"]], dtype=np.float32)
+
+    results = document_store.query_by_embedding_batch(query_embs=query_embs, top_k=len(DOCUMENTS))
+
+    assert len(results) == 2
+    assert results[0][0].content == "text_1"
+    assert results[1][0].content == "text_4"
+    for query_emb, documents in zip(query_embs, results):
+        single_query_documents = document_store.query_by_embedding(query_emb=query_emb, top_k=len(DOCUMENTS))
+        assert [doc.id for doc in documents] == [doc.id for doc in single_query_documents]
+        assert [doc.score for doc in documents] == pytest.approx([doc.score for doc in single_query_documents])
+    # documents that are hits of both queries are separate objects with their own scores
+    assert not {id(doc) for doc in results[0]} & {id(doc) for doc in results[1]}
+
+
+@pytest.mark.parametrize("exact_search_max_vectors", [10_000, 0])
+@pytest.mark.parametrize("document_store", ["faiss"], indirect=True)
+def test_faiss_query_by_embedding_with_filters(document_store, exact_search_max_vectors, monkeypatch):
+    # 0 forces the search with a FAISS ID selector instead of the exact scan
+    monkeypatch.setattr(
+        sys.modules[FAISSDocumentStore.__module__], "EXACT_FILTERED_SEARCH_MAX_VECTORS", exact_search_max_vectors
+    )
+    document_store.write_documents(documents=DOCUMENTS)
+    query_emb = np.array(DOCUMENTS[0]["embedding"], dtype=np.float32)
+
+    documents = document_store.query_by_embedding(query_emb=query_emb, filters={"year": ["2021"]}, top_k=2)
+
+    all_documents = document_store.query_by_embedding(query_emb=query_emb, top_k=len(DOCUMENTS))
+    expected_documents = [doc for doc in all_documents if doc.meta["year"] == "2021"][:2]
+    assert [doc.id for doc in documents] == [doc.id for doc in expected_documents]
+    assert [doc.score for doc in documents] == pytest.approx([doc.score for doc in expected_documents])
+
+    assert document_store.query_by_embedding(query_emb=query_emb, filters={"year": ["1999"]}) == []
+
+
 @pytest.mark.parametrize("document_store_dot_product_small", ["faiss", "milvus1", "milvus"], indirect=True)
 def test_normalize_embeddings_diff_shapes(document_store_dot_product_small):
     VEC_1 = np.array([0.1, 0.2, 0.3], dtype="float32")
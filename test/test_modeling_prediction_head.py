@@ -1,5 +1,8 @@
 import logging
 
+import pytest
+import torch
+
 from haystack.modeling.model.adaptive_model import AdaptiveModel
 from haystack.modeling.model.language_model import LanguageModel
 from haystack.modeling.model.prediction_head import QuestionAnsweringHead
@@ -28,3 +31,35 @@ def test_prediction_head_load_save(tmp_path, caplog=None):
     model.save(tmp_path)
     model_loaded = AdaptiveModel.load(tmp_path, device="cpu")
     assert model_loaded is not None
+
+
+@pytest.mark.parametrize("n_best_per_sample,duplicate_filtering", [(1, 0), (5, -1), (5, 2)])
+@pytest.mark.parametrize("passage_length", [2, 30, 300])
+def test_qa_head_logits_to_preds(n_best_per_sample, duplicate_filtering, passage_length):
+    set_all_seeds(seed=42)
+    prediction_head = QuestionAnsweringHead(
+        n_best_per_sample=n_best_per_sample, duplicate_filtering=duplicate_filtering
+    )
+    logits = torch.randn(4, 384, 2)
+    span_mask = torch.zeros(4, 384, dtype=torch.long)
+    span_mask[:, 0] = 1
+    span_mask[:, 10 : 10 + passage_length] = 1
+
+    preds = prediction_head.logits_to_preds(logits, span_mask=span_mask, start_of_word=None, seq_2_start_t=None)
+
+    # the same candidates as when scoring all spans
+    for sample_idx, sample_preds in enumerate(preds):
+        expected_preds = prediction_head._get_top_candidates_of_all_spans(
+            logits[sample_idx : sample_idx + 1], span_mask[sample_idx : sample_idx + 1], 1000, sample_idx
+        )
+        assert len(sample_preds) == len(expected_preds)
+        for pred, expected_pred in zip(sample_preds, expected_preds):
+            if expected_pred.score < -600:
+                # disqualified spans all have the same score
+                continue
+            assert (pred.offset_answer_start, pred.offset_answer_end) == (
+                expected_pred.offset_answer_start,
+                expected_pred.offset_answer_end,
+            )
+            assert pred.score == pytest.approx(expected_pred.score)
+            assert pred.confidence == pytest.approx(expected_pred.confidence)
@@ -2,15 +2,20 @@ from pathlib import Path
 
 import os
 import json
+import inspect
+import threading
+import time
 from typing import Tuple
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 from requests import PreparedRequest
 import responses
 import logging
 import yaml
+import networkx as nx
 
 from haystack import __version__, Document, Answer, JoinAnswers
 from haystack.document_stores.base import BaseDocumentStore
@@ -19,11 +24,12 @@ from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
 from haystack.nodes.other.join_docs import JoinDocuments
 from haystack.nodes.base import BaseComponent
 from haystack.nodes.retriever.base import BaseRetriever
-from haystack.nodes.retriever.sparse import ElasticsearchRetriever
+from haystack.nodes.retriever.sparse import ElasticsearchRetriever, TfidfRetriever
+from haystack.document_stores.memory import InMemoryDocumentStore
 from haystack.pipelines import Pipeline, DocumentSearchPipeline, RootNode
 from haystack.pipelines.config import validate_config_strings
 from haystack.pipelines.utils import generate_code
-from haystack.errors import PipelineConfigError
+from haystack.errors import PipelineConfigError, PipelineError
 from haystack.nodes import DensePassageRetriever, EmbeddingRetriever, RouteDocuments, PreProcessor, TextConverter
 from haystack.utils.deepsetcloud import DeepsetCloudError
 
@@ -34,6 +40,7 @@ from .conftest import (
     DC_TEST_INDEX,
     SAMPLES_PATH,
     MockDocumentStore,
+    MockReader,
     MockRetriever,
     MockNode,
     deepset_cloud_fixture,
@@ -1410,6 +1417,109 @@ def test_parallel_paths_in_pipeline_graph():
     assert output["test"] == "ABCABD"
 
 
+def test_pipeline_run_uses_execution_plan(monkeypatch):
+    class A(RootNode):
+        def run(self, test=""):
+            return {"test": test + "A"}, "output_1"
+
+    class B(RootNode):
+        def run(self, test, suffix="B"):
+            return {"test": test + suffix}, "output_1"
+
+    class JoinNode(RootNode):
+        def run(self, inputs):
+            return {"test": "".join(sorted(input["test"] for input in inputs))}, "output_1"
+
+    pipeline = Pipeline()
+    pipeline.add_node(name="A", component=A(), inputs=["Query"])
+    pipeline.add_node(name="B", component=B(), inputs=["A"])
+    pipeline.add_node(name="C", component=A(), inputs=["A"])
+    pipeline.add_node(name="D", component=JoinNode(), inputs=["B", "C"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The graph must not be traversed while running the pipeline")
+
+    monkeypatch.setattr(nx, "ancestors", fail)
+    monkeypatch.setattr(inspect, "signature", fail)
+    assert pipeline.run(query="test", params={"suffix": "X"})["test"] == "AAAX"
+    with pytest.raises(ValueError, match="No node\\(s\\) or global parameter\\(s\\) named invalid"):
+        pipeline.run(query="test", params={"invalid": True})
+    monkeypatch.undo()
+
+    pipeline.set_node("C", B())
+    assert pipeline.run(query="test")["test"] == "ABAB"
+
+
+def test_pipeline_run_batch():
+    class Reader(MockReader):
+        predict_batch_calls = 0
+
+        def predict_batch(self, query_doc_list, top_k=None, batch_size=None):
+            self.predict_batch_calls += 1
+            return [
+                {"answers": [Answer(answer=query_doc["docs"][0].content, document_id=query_doc["docs"][0].id)]}
+                for query_doc in query_doc_list
+            ]
+
+    class DocumentCounter(BaseComponent):
+        outgoing_edges = 1
+
+        def run(self, query, documents):
+            return {"document_count": len(documents)}, "output_1"
+
+    document_store = InMemoryDocumentStore()
+    document_store.write_documents([{"content": "My name is Carla"}, {"content": "I live in Berlin"}])
+    reader = Reader()
+    pipeline = Pipeline()
+    pipeline.add_node(name="Retriever", component=TfidfRetriever(document_store=document_store), inputs=["Query"])
+    pipeline.add_node(name="DocumentCounter", component=DocumentCounter(), inputs=["Retriever"])
+    pipeline.add_node(name="Reader", component=reader, inputs=["DocumentCounter"])
+
+    output = pipeline.run_batch(queries=["Who is Carla?", "Where is Berlin?"], params={"top_k": 1})
+    assert output["queries"] == ["Who is Carla?", "Where is Berlin?"]
+    assert output["document_count"] == [1, 1]
+    assert [[answer.answer for answer in answers] for answers in output["answers"]] == [
+        ["My name is Carla"],
+        ["I live in Berlin"],
+    ]
+    assert reader.predict_batch_calls == 1
+
+    with pytest.raises(PipelineError, match="one entry in 'documents' per query"):
+        pipeline.run_batch(queries=["Who is Carla?"], documents=[[], []])
+
+
+def test_pipeline_parallel_execution():
+    class Sleep(RootNode):
+        def __init__(self, seconds: float):
+            self.seconds = seconds
+
+        def run(self, test=""):
+            time.sleep(self.seconds)
+            return {"test": test + self.name}, "output_1"
+
+    class JoinNode(RootNode):
+        def run(self, inputs):
+            return {"test": "+".join(input["test"] for input in inputs)}, "output_1"
+
+    pipeline = Pipeline(parallel_execution=True)
+    pipeline.add_node(name="A", component=Sleep(seconds=0.0), inputs=["Query"])
+    pipeline.add_node(name="B", component=Sleep(seconds=0.5), inputs=["A"])
+    pipeline.add_node(name="C", component=Sleep(seconds=0.1), inputs=["A"])
+    pipeline.add_node(name="D", component=Sleep(seconds=0.3), inputs=["C"])
+    pipeline.add_node(name="E", component=JoinNode(), inputs=["B", "D"])
+
+    # D starts as soon as C is done, so the run takes as long as the slowest branch (0.5s) and not as long as the
+    # slowest nodes of both "waves" (0.5s + 0.3s)
+    start = time.perf_counter()
+    output = pipeline.run(query="test")
+    assert time.perf_counter() - start < 0.75
+    # D finishes before B, but the join node gets its inputs in the order of add_node()
+    assert output["test"] == "AB+ACD"
+
+    # the worker threads are shut down after each run
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("haystack-pipeline")]
+
+
 def test_parallel_paths_in_pipeline_graph_with_branching():
     class AWithOutput1(RootNode):
         outgoing_edges = 2
@@ -1518,6 +1628,35 @@ def test_pipeline_components():
     assert pipeline.components["E"] == e
 
 
+def test_pipeline_pass_by_reference():
+    class Reader(BaseComponent):
+        outgoing_edges = 1
+
+        def run(self, documents):
+            self.received = documents
+            return {}, "output_1"
+
+    class Writer(Reader):
+        copied_inputs = ("documents",)
+
+        def run(self, documents):
+            documents[0].meta["written"] = True
+            return super().run(documents=documents)
+
+    documents = [Document(content="test", embedding=np.ones(768))]
+    reader = Reader()
+    writer = Writer()
+    pipeline = Pipeline(pass_by_reference=True)
+    pipeline.add_node(name="Reader", component=reader, inputs=["Query"])
+    pipeline.add_node(name="Writer", component=writer, inputs=["Reader"])
+    pipeline.run(query="test", documents=documents, params={"Reader": {"debug": True}}, debug=True)
+
+    assert reader.received[0] is documents[0]
+    assert writer.received[0] is not documents[0]
+    assert writer.received[0].meta == {"written": True}
+    assert documents[0].meta == {}
+
+
 def test_pipeline_get_document_store_from_components():
     doc_store = MockDocumentStore()
     pipeline = Pipeline()
@@ -1693,6 +1832,32 @@ def test_join_answers(join_mode):
     assert result["answers"][0].answer == "answer 2"
 
 
+def test_join_answers_pass_by_reference():
+    class Reader(BaseComponent):
+        outgoing_edges = 1
+
+        def __init__(self, answers):
+            super().__init__()
+            self.answers = answers
+
+        def run(self):
+            return {"answers": self.answers}, "output_1"
+
+    answers_1 = [Answer(answer="answer 1", score=0.7)]
+    answers_2 = [Answer(answer="answer 2", score=0.8)]
+    pipeline = Pipeline(pass_by_reference=True)
+    pipeline.add_node(name="Reader1", component=Reader(answers_1), inputs=["Query"])
+    pipeline.add_node(name="Reader2", component=Reader(answers_2), inputs=["Query"])
+    pipeline.add_node(
+        name="Join", component=JoinAnswers(join_mode="merge", weights=[1, 3]), inputs=["Reader1", "Reader2"]
+    )
+    result = pipeline.run(query="test")
+
+    assert [answer.score for answer in result["answers"]] == pytest.approx([0.6, 0.175])
+    assert answers_1[0].score == 0.7
+    assert answers_2[0].score == 0.8
+
+
 def clean_faiss_document_store():
     if Path("existing_faiss_document_store").exists():
         os.remove("existing_faiss_document_store")
@@ -20,6 +20,18 @@ def test_qg_pipeline(question_generator):
     assert len(result["generated_questions"][0]["questions"]) > 0
 
 
+def test_qg_generate_batch(question_generator):
+    other_document = Document(content="Berlin is the capital of Germany. It has a population of 3.7 million.")
+    questions = question_generator.generate_batch([document.content, other_document.content], batch_size=2)
+    assert len(questions) == 2
+    assert len(questions[0]) > 0
+    assert len(questions[1]) > 0
+
+    streamed = list(question_generator.stream_questions(iter([document, other_document]), batch_size=2))
+    assert [result["document_id"] for result in streamed] == [document.id, other_document.id]
+    assert [result["questions"] for result in streamed] == questions
+
+
 @pytest.mark.parametrize("retriever,document_store", [("tfidf", "memory")], indirect=True)
 def test_rqg_pipeline(question_generator, retriever):
     retriever.document_store.write_documents([document])
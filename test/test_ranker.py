@@ -69,3 +69,25 @@ def test_ranker_two_logits(ranker_two_logits):
     ]
     results = ranker_two_logits.predict(query=query, documents=docs)
     assert results[0] == docs[4]
+
+
+def test_ranker_batch(ranker):
+    docs = [
+        Document(content="The Great Sept of Baelor is the main religious building in King's Landing.", id="1"),
+        Document(content="Luanda, the capital of Angola, lies on the Atlantic coast.", id="2"),
+        Document(content="The Dothraki vocabulary was created by David J. Peterson.", id="3"),
+    ]
+    query_doc_list = [
+        {"query": "What is the most important religious building in King's Landing?", "docs": docs},
+        {"query": "What is the capital of Angola?", "docs": docs[1:]},
+        {"query": "Who created the Dothraki language?", "docs": []},
+    ]
+    results = ranker.predict_batch(query_doc_list=query_doc_list, top_k=2, batch_size=2)
+
+    assert [result["query"] for result in results] == [query_docs["query"] for query_docs in query_doc_list]
+    assert [doc.id for doc in results[0]["documents"]] == [
+        doc.id for doc in ranker.predict(query=query_doc_list[0]["query"], documents=docs, top_k=2)
+    ]
+    assert results[0]["documents"][0] == docs[0]
+    assert results[1]["documents"][0] == docs[1]
+    assert results[2]["documents"] == []
@@ -169,3 +169,20 @@ def test_farm_reader_update_params(test_docs_xs):
     with pytest.raises(Exception):
         reader.update_parameters(context_window_size=6, no_ans_boost=-10, max_seq_len=99, doc_stride=128)
         reader.predict(query="Who lives in Berlin?", documents=docs, top_k=3)
+
+
+@pytest.mark.parametrize("reader", ["farm"], indirect=True)
+def test_farm_reader_bucket_by_length(reader, test_docs_xs):
+    docs = [Document.from_dict(d) if isinstance(d, dict) else d for d in test_docs_xs]
+    reader.use_confidence_scores = False
+
+    prediction = reader.predict(query="Who lives in Berlin?", documents=docs, top_k=5)
+    reader.inferencer.bucket_by_length = True
+    bucketed_prediction = reader.predict(query="Who lives in Berlin?", documents=docs, top_k=5)
+
+    # same answers from the same documents, in spite of the changed order of the passages and the trimmed padding
+    for answer, bucketed_answer in zip(prediction["answers"], bucketed_prediction["answers"]):
+        assert answer.answer == bucketed_answer.answer
+        assert answer.document_id == bucketed_answer.document_id
+        assert answer.offsets_in_document == bucketed_answer.offsets_in_document
+        assert math.isclose(answer.score, bucketed_answer.score, rel_tol=1e-4)
@@ -565,3 +565,86 @@ def test_embeddings_encoder_of_embedding_retriever_should_warn_about_model_forma
             "You may need to set 'model_format='sentence_transformers' to ensure correct loading of model."
             in caplog.text
         )
+
+
+def test_tfidf_retriever_incremental_fit_and_filters():
+    document_store = InMemoryDocumentStore()
+    document_store.write_documents(
+        [
+            Document(content="My name is Carla and I live in Berlin", meta={"city": "Berlin"}, id="1"),
+            Document(content="My name is Paul and I live in New York", meta={"city": "New York"}, id="2"),
+        ]
+    )
+    retriever = TfidfRetriever(document_store=document_store, incremental_fit=True, refit_threshold=100)
+
+    results = retriever.retrieve(query="Who lives in Berlin?", top_k=2)
+    assert [doc.id for doc in results] == ["1", "2"]
+
+    document_store.write_documents(
+        [Document(content="My name is Christelle and I live in Paris, not Berlin", meta={"city": "Paris"}, id="3")]
+    )
+    results = retriever.retrieve(query="Who lives in Berlin?", top_k=5)
+    assert {doc.id for doc in results} == {"1", "2", "3"}
+
+    document_store.delete_documents(ids=["2"])
+    results = retriever.retrieve(query="Who lives in Berlin?", top_k=5)
+    assert {doc.id for doc in results} == {"1", "3"}
+    assert retriever.tfidf_matrix.shape[0] == 2
+
+    results = retriever.retrieve(query="Who lives in Berlin?", filters={"city": ["Paris"]})
+    assert [doc.id for doc in results] == ["3"]
+
+
+def test_tfidf_retriever_refit_after_added_and_deleted_paragraphs():
+    document_store = InMemoryDocumentStore()
+    document_store.write_documents(
+        [Document(content=f"My name is {name} and I live in Berlin", id=name) for name in ["Carla", "Paul", "Mia"]]
+    )
+    retriever = TfidfRetriever(document_store=document_store, incremental_fit=True, refit_threshold=0.5)
+    retriever.retrieve(query="Who lives in Berlin?")
+    assert retriever._fitted_paragraph_count == 3
+
+    # An added and a deleted paragraph each count towards the refit threshold, even though the number of
+    # paragraphs ends up unchanged
+    document_store.write_documents([Document(content="My name is Tom and I live in Berlin", id="Tom")])
+    retriever.retrieve(query="Who lives in Berlin?")
+    assert retriever._refit_thread is None
+    document_store.delete_documents(ids=["Carla"])
+    retriever.retrieve(query="Who lives in Berlin?")
+    assert retriever._refit_thread is not None
+
+    retriever._refit_thread.join()
+    assert retriever._fitted_paragraph_count == 3
+    assert retriever._changed_paragraph_count == 0
+    assert {p.document_id for p in retriever.paragraphs} == {"Paul", "Mia", "Tom"}
+
+
+def test_tfidf_retriever_update_fetches_only_new_documents(monkeypatch):
+    document_store = InMemoryDocumentStore()
+    document_store.write_documents(
+        [Document(content=f"My name is {name} and I live in Berlin", id=name) for name in ["Carla", "Paul"]]
+    )
+    retriever = TfidfRetriever(document_store=document_store, incremental_fit=True, refit_threshold=100)
+    retriever.retrieve(query="Who lives in Berlin?")
+
+    refitting = False
+
+    def refit_and_get_documents_by_id(ids, **kwargs):
+        # Simulate a background refit that picks up the new document while the update is running
+        nonlocal refitting
+        refitting = True
+        retriever.fit()
+        refitting = False
+        return InMemoryDocumentStore.get_documents_by_id(document_store, ids=ids, **kwargs)
+
+    def get_all_documents_generator(*args, **kwargs):
+        assert refitting, "Only the refit may fetch the whole corpus"
+        return InMemoryDocumentStore.get_all_documents_generator(document_store, *args, **kwargs)
+
+    document_store.write_documents([Document(content="My name is Tom and I live in Berlin", id="Tom")])
+    monkeypatch.setattr(document_store, "get_documents_by_id", refit_and_get_documents_by_id)
+    monkeypatch.setattr(document_store, "get_all_documents_generator", get_all_documents_generator)
+    retriever._update()
+
+    assert sorted(p.document_id for p in retriever.paragraphs) == ["Carla", "Paul", "Tom"]
+    assert retriever.tfidf_matrix.shape[0] == 3
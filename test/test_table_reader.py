@@ -43,6 +43,29 @@ def test_table_reader_in_pipeline(table_reader):
     assert prediction["answers"][0].offsets_in_context[0].end == 8
 
 
+def test_table_reader_batch(table_reader):
+    data = {
+        "actors": ["brad pitt", "leonardo di caprio", "george clooney"],
+        "age": ["58", "47", "60"],
+        "number of movies": ["87", "53", "69"],
+        "date of birth": ["18 december 1963", "11 november 1974", "6 may 1961"],
+    }
+    table = pd.DataFrame(data)
+    documents = [Document(content=table, content_type="table"), Document(content="text", id="text_doc")]
+
+    queries = ["When was Di Caprio born?", "When was Brad Pitt born?"]
+    predictions = table_reader.predict_batch(
+        query_doc_list=[{"question": query, "docs": documents} for query in queries], batch_size=1
+    )
+    assert len(predictions) == 2
+    assert predictions[0]["query"] == "When was Di Caprio born?"
+    assert predictions[0]["answers"][0].answer == "11 november 1974"
+    assert predictions[0]["answers"][0].offsets_in_context[0].start == 7
+    assert predictions[1]["query"] == "When was Brad Pitt born?"
+    assert predictions[1]["answers"][0].answer == "18 december 1963"
+    assert predictions[1]["answers"][0].offsets_in_context[0].start == 3
+
+
 @pytest.mark.parametrize("table_reader", ["tapas"], indirect=True)
 def test_table_reader_aggregation(table_reader):
     data = {
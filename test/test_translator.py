@@ -44,3 +44,24 @@ def test_translator_with_dict_without_text_key(en_to_de_translator):
 def test_translator_with_dict_with_non_string_value(en_to_de_translator):
     with pytest.raises(AttributeError):
         en_to_de_translator.translate(documents=[{"text": 123}])
+
+
+def test_translator_in_batches_with_cache(en_to_de_translator):
+    en_to_de_translator.batch_size = 2
+    en_to_de_translator.cache_size = 2
+    long_input = "I live in Berlin and work in Munich"
+    inputs = [INPUT, long_input, "Hello", INPUT]
+
+    outputs = en_to_de_translator.translate(documents=inputs)
+    assert len(outputs) == 4
+    assert outputs[0] == outputs[3] == EXPECTED_OUTPUT
+    # Translated in order of decreasing length, so the longest input was evicted first
+    assert list(en_to_de_translator.cache) == [INPUT, "Hello"]
+    assert en_to_de_translator.translate(query=INPUT) == EXPECTED_OUTPUT
+    assert outputs[1] == en_to_de_translator.translate(query=long_input)
+    assert list(en_to_de_translator.cache) == [INPUT, long_input]
+
+
+def test_translator_in_indexing_pipeline(en_to_de_translator):
+    output, _ = en_to_de_translator.run(documents=[{"content": INPUT, "meta": {}}])
+    assert output["documents"][0]["content"] == EXPECTED_OUTPUT